@@ -8,9 +8,6 @@
 from vyper.interfaces import ERC20
 
 
-interface AddressProvider:
-    def get_address(_id: uint256) -> address: view
-
 interface RegistrySwap:
     def exchange(
         _pool: address,
@@ -35,8 +32,8 @@ interface Synth:
     def currencyKey() -> bytes32: nonpayable
 
 
-ADDRESS_PROVIDER: constant(address) = 0x0000000022D53366457F9d5E68Ec105046FC4383
 SNX: constant(address) = 0xC011a73ee8576Fb46F5E1c5751cA3B9Fe0af2a6F
+ETH_ADDRESS: constant(address) = 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE
 
 # "CURVE" as a bytes32
 TRACKING_CODE: constant(bytes32) = 0x4355525645000000000000000000000000000000000000000000000000000000
@@ -58,22 +55,22 @@ def convert_synth(
     _amount: uint256,
     _source_key: bytes32,
     _dest_key: bytes32
-) -> bool:
+) -> uint256:
     """
     @notice Convert between two synths
-    @dev Called via `SynthSwap.swap_into_synth`
+    @dev Called via `SynthSwap.swap_into_synth` and `SynthSwap.convert_token`
     @param _target Address of the synth being converted into
     @param _amount Amount of the original synth to convert
     @param _source_key Currency key for the initial synth
     @param _dest_key Currency key for the target synth
-    @return bool Success
+    @return uint256 Balance of `_target` held after the conversion
     """
     assert msg.sender == self.admin
 
     self.synth = _target
     Synthetix(SNX).exchangeWithTracking(_source_key, _amount, _dest_key, msg.sender, TRACKING_CODE)
 
-    return True
+    return ERC20(_target).balanceOf(self)
 
 
 @external
@@ -83,27 +80,63 @@ def exchange(
     _amount: uint256,
     _expected: uint256,
     _receiver: address,
+    _registry_swap: address,
+    _i: uint256,
+    _j: uint256,
 ) -> uint256:
     """
     @notice Exchange the synth deposited in this contract for another asset
-    @dev Called via `SynthSwap.swap_from_synth`
+    @dev Called via `SynthSwap.swap_from_synth`. The exchange is performed
+         directly within `_pool`, except when swapping into Ether which
+         cannot be received by this contract.
     @param _target Address of the asset being swapped into
     @param _pool Address of the Curve pool used in the exchange
     @param _amount Amount of the deposited synth to exchange
     @param _expected Minimum amount of `_target` to receive in the exchange
     @param _receiver Receiver address for `_target`
+    @param _registry_swap Address of the Curve registry swap contract, as
+                          cached within `SynthSwap`
+    @param _i Index of the deposited synth within `_pool`
+    @param _j Index of `_target` within `_pool`
     @return uint256 Amount of the deposited synth remaining in the contract
     """
     assert msg.sender == self.admin
 
     synth: address = self.synth
-    registry_swap: address = AddressProvider(ADDRESS_PROVIDER).get_address(2)
-
-    if not self.is_approved[synth][registry_swap]:
-        ERC20(synth).approve(registry_swap, MAX_UINT256)
-        self.is_approved[synth][registry_swap] = True
-
-    RegistrySwap(registry_swap).exchange(_pool, synth, _target, _amount, _expected, _receiver)
+    spender: address = _pool
+    if _target == ETH_ADDRESS:
+        spender = _registry_swap
+
+    if not self.is_approved[synth][spender]:
+        ERC20(synth).approve(spender, MAX_UINT256)
+        self.is_approved[synth][spender] = True
+
+    if _target == ETH_ADDRESS:
+        RegistrySwap(_registry_swap).exchange(_pool, synth, _target, _amount, _expected, _receiver)
+    else:
+        # older pools do not return the amount received, so the
+        # entire balance of `_target` is sent to the receiver
+        raw_call(
+            _pool,
+            concat(
+                method_id("exchange(int128,int128,uint256,uint256)"),
+                convert(_i, bytes32),
+                convert(_j, bytes32),
+                convert(_amount, bytes32),
+                convert(_expected, bytes32),
+            )
+        )
+        response: Bytes[32] = raw_call(
+            _target,
+            concat(
+                method_id("transfer(address,uint256)"),
+                convert(_receiver, bytes32),
+                convert(ERC20(_target).balanceOf(self), bytes32),
+            ),
+            max_outsize=32,
+        )
+        if len(response) != 0:
+            assert convert(response, bool)
 
     return ERC20(synth).balanceOf(self)
 
@@ -112,19 +145,39 @@ def exchange(
 def withdraw(_receiver: address, _amount: uint256) -> uint256:
     """
     @notice Withdraw the synth deposited in this contract
-    @dev Called via `SynthSwap.withdraw`
+    @dev Called via `SynthSwap.withdraw`, `SynthSwap.merge` and `SynthSwap.split`
     @param _receiver Receiver address for the deposited synth
-    @param _amount Amount of the deposited synth to withdraw
+    @param _amount Amount of the deposited synth to withdraw. If set to
+                   MAX_UINT256, the entire balance is withdrawn.
     @return uint256 Amount of the deposited synth remaining in the contract
     """
     assert msg.sender == self.admin
 
     synth: address = self.synth
-    ERC20(synth).transfer(_receiver, _amount)
+    amount: uint256 = _amount
+    if amount == MAX_UINT256:
+        amount = ERC20(synth).balanceOf(self)
+    ERC20(synth).transfer(_receiver, amount)
 
     return ERC20(synth).balanceOf(self)
 
 
+@external
+def set_synth(_synth: address) -> uint256:
+    """
+    @notice Set the synth deposited in this contract
+    @dev Called via `SynthSwap.split`, after the synth is transferred
+         in from another settler
+    @param _synth Address of the deposited synth
+    @return uint256 Amount of the deposited synth held in the contract
+    """
+    assert msg.sender == self.admin
+
+    self.synth = _synth
+
+    return ERC20(_synth).balanceOf(self)
+
+
 @external
 def settle() -> bool:
     """
@@ -21,17 +21,6 @@ interface Curve:
 
 interface Registry:
     def get_coins(_pool: address) -> address[8]: view
-    def get_coin_indices(pool: address, _from: address, _to: address) -> (int128, int128): view
-
-interface RegistrySwap:
-    def exchange(
-        _pool: address,
-        _from: address,
-        _to: address,
-        _amount: uint256,
-        _expected: uint256,
-        _receiver: address,
-    ) -> uint256: payable
 
 interface SNXAddressResolver:
     def getAddress(name: bytes32) -> address: view
@@ -46,27 +35,30 @@ interface Exchanger:
         destinationCurrencyKey: bytes32
     ) -> (uint256, uint256, uint256): view
     def maxSecsLeftInWaitingPeriod(account: address, currencyKey: bytes32) -> uint256: view
+    def waitingPeriodSecs() -> uint256: view
     def settlementOwing(account: address, currencyKey: bytes32) -> (uint256, uint256): view
     def settle(user: address, currencyKey: bytes32): nonpayable
 
 interface Settler:
     def initialize(): nonpayable
-    def synth() -> address: view
-    def time_to_settle() -> uint256: view
     def convert_synth(
         _target: address,
         _amount: uint256,
         _source_key: bytes32,
         _dest_key: bytes32
-    ) -> bool: nonpayable
+    ) -> uint256: nonpayable
     def exchange(
         _target: address,
         _pool: address,
         _amount: uint256,
         _expected: uint256,
         _receiver: address,
+        _registry_swap: address,
+        _i: uint256,
+        _j: uint256,
     ) -> uint256: nonpayable
     def withdraw(_receiver: address, _amount: uint256) -> uint256: nonpayable
+    def set_synth(_synth: address) -> uint256: nonpayable
 
 interface ERC721Receiver:
     def onERC721Received(
@@ -95,10 +87,19 @@ event ApprovalForAll:
 event NewSettler:
     addr: address
 
+event SettlersDeployed:
+    deployer: indexed(address)
+    count: uint256
+    available: uint256
+
 event NewSynth:
     synth: address
     pool: address
 
+event BalanceTransfer:
+    sender_id: indexed(uint256)
+    receiver_id: indexed(uint256)
+
 event TokenUpdate:
     token_id: indexed(uint256)
     owner: indexed(address)
@@ -118,39 +119,82 @@ ADDRESS_PROVIDER: constant(address) = 0x0000000022D53366457F9d5E68Ec105046FC4383
 SNX_ADDRESS_RESOLVER: constant(address) = 0x4E3b31eB0E5CB73641EE1E65E7dCEFe520bA3ef2
 EXCHANGER_KEY: constant(bytes32) = 0x45786368616e6765720000000000000000000000000000000000000000000000
 
-# token id -> owner
-id_to_owner: HashMap[uint256, address]
+ETH_ADDRESS: constant(address) = 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE
+
+# maximum number of swaps that may be performed in a single batched call
+MAX_BATCH_SIZE: constant(uint256) = 10
+# maximum number of settlers that may be deployed in a single call
+MAX_SETTLER_DEPLOYS: constant(uint256) = 100
+
+# packed token data flag, set once the synth within an NFT has been settled
+IS_SETTLED: constant(uint256) = 2**160
+# marks the end of the stack of available settlers, non-zero so that
+# the slots holding the final settler are never cleared
+FREE_LIST_END: constant(uint256) = 1
+
+# settler -> packed token data, stored as a single word to minimize storage reads
+# [31 bit token index][32 bit owner token index][32 bit synth index][1 bit is settled flag][160 bit owner address]
+# the data is keyed by settler rather than token ID so that reusing a settler
+# writes to a non-zero slot. it only belongs to the token ID formed from the
+# current nonce of the settler, see `_token_data`.
+token_data: HashMap[address, uint256]
 # token id -> address approved to transfer this nft
 id_to_approval: HashMap[uint256, address]
 # owner -> number of nfts
 owner_to_token_count: HashMap[address, uint256]
+# owner -> owner token index -> token id, indexes at or above the
+# owner's token count hold stale values and are never read
+owner_to_tokens: HashMap[address, HashMap[uint256, uint256]]
 # owner -> operator -> is approved?
 owner_to_operators: HashMap[address, HashMap[address, bool]]
+# token index -> token id, for every nft that currently exists. as with
+# `owner_to_tokens`, indexes at or above `total_supply` hold stale values
+all_tokens: HashMap[uint256, uint256]
+# total number of nfts
+total_supply: uint256
 
 # implementation contract used for `Settler` proxies
 settler_implementation: address
 
-# list of available token IDs
 # each token ID has an associated `Settler` contract, and to reduce
 # gas costs these contracts are reused. Each token ID is created from
 # [12 byte nonce][20 byte settler address]. The nonce starts at 0 and is
-# incremented each time the token ID is "freed" (added to `available_token_ids`)
-available_token_ids: uint256[4294967296]
-id_count: uint256
+# incremented each time the settler is freed.
+#
+# available settlers form a linked stack threaded through `settler_data`:
+# [96 bit count][160 bit settler at the top of the stack]
+free_settlers: uint256
+# settler -> [96 bit nonce][160 bit value]
+# while a settler is available, the value is the next settler in the stack.
+# while in use, it is the timestamp of the most recent synth conversion.
+# neither slot is ever cleared, so pushing and popping settlers only modifies
+# storage that is already non-zero.
+settler_data: HashMap[address, uint256]
 
 # synth -> curve pool where it can be traded
 synth_pools: public(HashMap[address, address])
-# coin -> synth that it can be swapped for
+# coin -> default synth that it can be swapped for, set by the most recent
+# `add_synth` for a pool containing the coin
 swappable_synth: public(HashMap[address, address])
-# token id -> is synth settled?
-is_settled: public(HashMap[uint256, bool])
+# pool -> coin -> index of the coin within the pool plus one, zero if not in the pool
+coin_indices: HashMap[address, HashMap[address, uint256]]
 # coin -> spender -> is approved to transfer from this contract?
 is_approved: HashMap[address, HashMap[address, bool]]
 # synth -> currency key
-currency_keys: HashMap[address, bytes32]
+currency_keys: public(HashMap[address, bytes32])
+# synth -> index used within packed token data (starts at 1)
+synth_indices: HashMap[address, uint256]
+# synth index -> synth, enumerable until the first zero address
+synths: public(HashMap[uint256, address])
+# synth index -> currency key
+synth_currency_keys: HashMap[uint256, bytes32]
+synth_count: uint256
 
 # Synthetix exchanger contract
 exchanger: Exchanger
+# Curve registry and registry swap contracts
+registry: address
+registry_swap: address
 
 
 @external
@@ -158,19 +202,28 @@ def __init__(_settler_implementation: address, _settler_count: uint256):
     """
     @notice Contract constructor
     @param _settler_implementation `Settler` implementation deployment
+    @param _settler_count Number of settlers to deploy immediately, cannot
+                          exceed `MAX_SETTLER_DEPLOYS`
     """
+    assert _settler_count <= MAX_SETTLER_DEPLOYS  # dev: too many settlers
+
     self.settler_implementation = _settler_implementation
     self.exchanger = Exchanger(SNXAddressResolver(SNX_ADDRESS_RESOLVER).getAddress(EXCHANGER_KEY))
+    self.registry = AddressProvider(ADDRESS_PROVIDER).get_registry()
+    self.registry_swap = AddressProvider(ADDRESS_PROVIDER).get_address(2)
 
     # deploy settler contracts immediately
-    self.id_count = _settler_count
-    for i in range(100):
+    free: uint256 = FREE_LIST_END
+    for i in range(MAX_SETTLER_DEPLOYS):
         if i == _settler_count:
             break
         settler: address = create_forwarder_to(_settler_implementation)
         Settler(settler).initialize()
-        self.available_token_ids[i] = convert(settler, uint256)
+        # push the settler onto the stack, with a nonce of zero
+        self.settler_data[settler] = bitwise_and(free, 2**160 - 1)
+        free = shift(shift(free, -160) + 1, 160) + convert(settler, uint256)
         log NewSettler(settler)
+    self.free_settlers = free
 
 
 @view
@@ -196,6 +249,7 @@ def supportsInterface(_interface_id: bytes32) -> bool:
     return _interface_id in [
         0x0000000000000000000000000000000000000000000000000000000001ffc9a7,  # ERC165
         0x0000000000000000000000000000000000000000000000000000000080ac58cd,  # ERC721
+        0x00000000000000000000000000000000000000000000000000000000780e9d63,  # ERC721Enumerable
     ]
 
 
@@ -213,6 +267,21 @@ def balanceOf(_owner: address) -> uint256:
     return self.owner_to_token_count[_owner]
 
 
+@view
+@internal
+def _token_data(_token_id: uint256) -> uint256:
+    # return the packed token data for `_token_id`, reverting if it does not
+    # exist. data stored for a settler belongs to the token ID formed from
+    # its current nonce, and holds no owner once the NFT has been burned.
+    settler: address = convert(bitwise_and(_token_id, 2**160 - 1), address)
+    data: uint256 = self.token_data[settler]
+    assert (
+        bitwise_and(data, 2**160 - 1) != 0 and
+        shift(self.settler_data[settler], -160) == shift(_token_id, -160)
+    ), "Unknown Token ID"
+    return data
+
+
 @view
 @external
 def ownerOf(_token_id: uint256) -> address:
@@ -222,9 +291,7 @@ def ownerOf(_token_id: uint256) -> address:
     @param _token_id The identifier for an NFT
     @return address NFT owner
     """
-    owner: address = self.id_to_owner[_token_id]
-    assert owner != ZERO_ADDRESS
-    return owner
+    return convert(bitwise_and(self._token_data(_token_id), 2**160 - 1), address)
 
 
 @view
@@ -236,10 +303,51 @@ def getApproved(_token_id: uint256) -> address:
     @param _token_id ID of the NFT to query the approval of
     @return address Address approved to transfer this NFT
     """
-    assert self.id_to_owner[_token_id] != ZERO_ADDRESS
+    assert self._token_data(_token_id) != 0
     return self.id_to_approval[_token_id]
 
 
+@view
+@external
+def totalSupply() -> uint256:
+    """
+    @notice Return the number of valid NFTs tracked by this contract
+    @return uint256 Total number of NFTs
+    """
+    return self.total_supply
+
+
+@view
+@external
+def tokenByIndex(_index: uint256) -> uint256:
+    """
+    @notice Enumerate valid NFTs
+    @dev Reverts if `_index` is not less than `totalSupply()`. The order of
+         NFTs is not specified and may change when an NFT is burned.
+    @param _index A counter less than `totalSupply()`
+    @return uint256 Token ID of the NFT at `_index`
+    """
+    assert _index < self.total_supply
+    return self.all_tokens[_index]
+
+
+@view
+@external
+def tokenOfOwnerByIndex(_owner: address, _index: uint256) -> uint256:
+    """
+    @notice Enumerate NFTs assigned to an owner
+    @dev Reverts if `_index` is not less than `balanceOf(_owner)`. The order
+         of NFTs is not specified and may change when an NFT is transferred
+         or burned.
+    @param _owner Address of the owner
+    @param _index A counter less than `balanceOf(_owner)`
+    @return uint256 Token ID of the NFT at `_index` in the list of NFTs
+                    owned by `_owner`
+    """
+    assert _index < self.owner_to_token_count[_owner]
+    return self.owner_to_tokens[_owner][_index]
+
+
 @view
 @external
 def isApprovedForAll(_owner: address, _operator: address) -> bool:
@@ -252,11 +360,67 @@ def isApprovedForAll(_owner: address, _operator: address) -> bool:
     return self.owner_to_operators[_owner][_operator]
 
 
+@internal
+def _add_token_to_owner(_owner: address, _token_id: uint256) -> uint256:
+    # append `_token_id` to the tokens held by `_owner` and return the owner token index
+    index: uint256 = self.owner_to_token_count[_owner]
+    self.owner_to_tokens[_owner][index] = _token_id
+    self.owner_to_token_count[_owner] = index + 1
+
+    return index
+
+
+@internal
+def _remove_token_from_owner(_owner: address, _index: uint256):
+    # remove the token at `_index` from the tokens held by `_owner`
+    # the last token held by `_owner` is moved into the vacated index.
+    # the final slot is not cleared, so the next token added is written to
+    # a non-zero slot which is cheaper than the refund gained by clearing it.
+    last: uint256 = self.owner_to_token_count[_owner] - 1
+    if _index != last:
+        token_id: uint256 = self.owner_to_tokens[_owner][last]
+        self.owner_to_tokens[_owner][_index] = token_id
+        settler: address = convert(bitwise_and(token_id, 2**160 - 1), address)
+        data: uint256 = self.token_data[settler]
+        self.token_data[settler] = (
+            shift(shift(data, -225), 225) + shift(_index, 193) + bitwise_and(data, 2**193 - 1)
+        )
+
+    self.owner_to_token_count[_owner] = last
+
+
+@internal
+def _add_token_to_all(_token_id: uint256) -> uint256:
+    # append `_token_id` to the list of all tokens and return the token index
+    index: uint256 = self.total_supply
+    self.all_tokens[index] = _token_id
+    self.total_supply = index + 1
+
+    return index
+
+
+@internal
+def _remove_token_from_all(_index: uint256):
+    # remove the token at `_index` from the list of all tokens
+    # the last token in the list is moved into the vacated index.
+    # as above, the final slot is left non-zero for the next token added.
+    last: uint256 = self.total_supply - 1
+    if _index != last:
+        token_id: uint256 = self.all_tokens[last]
+        self.all_tokens[_index] = token_id
+        settler: address = convert(bitwise_and(token_id, 2**160 - 1), address)
+        data: uint256 = self.token_data[settler]
+        self.token_data[settler] = shift(_index, 225) + bitwise_and(data, 2**225 - 1)
+
+    self.total_supply = last
+
+
 @internal
 def _transfer(_from: address, _to: address, _token_id: uint256, _caller: address):
     assert _from != ZERO_ADDRESS, "Cannot send from zero address"
     assert _to != ZERO_ADDRESS, "Cannot send to zero address"
-    owner: address = self.id_to_owner[_token_id]
+    data: uint256 = self._token_data(_token_id)
+    owner: address = convert(bitwise_and(data, 2**160 - 1), address)
     assert owner == _from, "Incorrect owner for Token ID"
 
     approved_for: address = self.id_to_approval[_token_id]
@@ -266,9 +430,15 @@ def _transfer(_from: address, _to: address, _token_id: uint256, _caller: address
     if approved_for != ZERO_ADDRESS:
         self.id_to_approval[_token_id] = ZERO_ADDRESS
 
-    self.id_to_owner[_token_id] = _to
-    self.owner_to_token_count[_from] -= 1
-    self.owner_to_token_count[_to] += 1
+    self._remove_token_from_owner(_from, bitwise_and(shift(data, -193), 2**32 - 1))
+    index: uint256 = self._add_token_to_owner(_to, _token_id)
+    self.token_data[convert(bitwise_and(_token_id, 2**160 - 1), address)] = (
+        shift(shift(data, -225), 225)
+        + shift(index, 193)
+        + bitwise_and(data, 2**193 - 1)
+        - bitwise_and(data, 2**160 - 1)
+        + convert(_to, uint256)
+    )
 
     log Transfer(_from, _to, _token_id)
 
@@ -320,10 +490,9 @@ def approve(_approved: address, _token_id: uint256):
     @param _approved Address to be approved for the given NFT ID
     @param _token_id ID of the token to be approved
     """
-    owner: address = self.id_to_owner[_token_id]
+    owner: address = convert(bitwise_and(self._token_data(_token_id), 2**160 - 1), address)
 
-    if msg.sender != self.id_to_owner[_token_id]:
-        assert owner != ZERO_ADDRESS, "Unknown Token ID"
+    if msg.sender != owner:
         assert self.owner_to_operators[owner][msg.sender], "Caller is not owner or operator"
 
     self.id_to_approval[_token_id] = _approved
@@ -345,22 +514,23 @@ def setApprovalForAll(_operator: address, _approved: bool):
 @view
 @internal
 def _get_swap_into(_from: address, _synth: address, _amount: uint256) -> uint256:
-    registry: address = AddressProvider(ADDRESS_PROVIDER).get_registry()
-
+    # a synth that is not in any added pool may still be swapped from, but
+    # `currencyKey` on a Synthetix proxy modifies state and cannot be called
+    # within a view, so it is only quoted once it has been added
     intermediate_synth: address = self.swappable_synth[_from]
-    pool: address = self.synth_pools[intermediate_synth]
-
+    source_key: bytes32 = self.currency_keys[intermediate_synth]
+    assert source_key != EMPTY_BYTES32  # dev: unknown synth
     synth_amount: uint256 = _amount
     if _from != intermediate_synth:
-        i: int128 = 0
-        j: int128 = 0
-        i, j = Registry(registry).get_coin_indices(pool, _from, intermediate_synth)
-
-        synth_amount = Curve(pool).get_dy(i, j, _amount)
+        pool: address = self.synth_pools[intermediate_synth]
+        # coin indices are stored with an offset of one, zero means not in the pool
+        i: uint256 = self.coin_indices[pool][_from]
+        j: uint256 = self.coin_indices[pool][intermediate_synth]
+        synth_amount = Curve(pool).get_dy(convert(i - 1, int128), convert(j - 1, int128), _amount)
 
     return self.exchanger.getAmountsForExchange(
         synth_amount,
-        self.currency_keys[intermediate_synth],
+        source_key,
         self.currency_keys[_synth],
     )[0]
 
@@ -372,7 +542,8 @@ def get_swap_into_synth_amount(_from: address, _synth: address, _amount: uint256
     @notice Return the amount received when performing a cross-asset swap
     @dev Used to calculate `_expected` when calling `swap_into_synth`. Be sure to
          reduce the value slightly to account for market movement prior to the
-         transaction confirmation.
+         transaction confirmation. Reverts for a synth that has not been added
+         with `add_synth`, even though it may be swapped from.
     @param _from Address of the initial asset being exchanged
     @param _synth Address of the synth being swapped into
     @param _amount Amount of `_from` to swap
@@ -384,14 +555,14 @@ def get_swap_into_synth_amount(_from: address, _synth: address, _amount: uint256
 @view
 @internal
 def _get_swap_from(_synth: address, _to: address, _amount: uint256) -> uint256:
-    registry: address = AddressProvider(ADDRESS_PROVIDER).get_registry()
     pool: address = self.synth_pools[_synth]
 
-    i: int128 = 0
-    j: int128 = 0
-    i, j = Registry(registry).get_coin_indices(pool, _synth, _to)
+    # coin indices are stored with an offset of one, zero means not in the pool
+    i: uint256 = self.coin_indices[pool][_synth]
+    j: uint256 = self.coin_indices[pool][_to]
+    assert j != 0  # dev: coin not in pool
 
-    return Curve(pool).get_dy(i, j, _amount)
+    return Curve(pool).get_dy(convert(i - 1, int128), convert(j - 1, int128), _amount)
 
 
 @view
@@ -426,6 +597,37 @@ def get_estimated_swap_amount(_from: address, _to: address, _amount: uint256) ->
     return self._get_swap_from(synth, _to, synth_amount)
 
 
+@view
+@external
+def is_settled(_token_id: uint256) -> bool:
+    """
+    @notice Check if the synth represented by an NFT has been settled
+    @dev Reverts if `_token_id` is not a valid NFT
+    @param _token_id The identifier for an NFT
+    @return bool Is synth settled?
+    """
+    return bitwise_and(self._token_data(_token_id), IS_SETTLED) != 0
+
+
+@view
+@external
+def settle_ready_at(_token_id: uint256) -> uint256:
+    """
+    @notice Get the time at which the synth represented by an NFT may be settled
+    @dev Cheaper than `token_info` as the Synthetix exchange entries are not
+         queried. The waiting period begins at the most recent conversion.
+    @param _token_id The identifier for an NFT
+    @return uint256 Timestamp at which the waiting period ends, or zero
+                    if the synth has already been settled
+    """
+    data: uint256 = self._token_data(_token_id)
+    if bitwise_and(data, IS_SETTLED) != 0:
+        return 0
+
+    settler: address = convert(bitwise_and(_token_id, 2**160 - 1), address)
+    return bitwise_and(self.settler_data[settler], 2**160 - 1) + self.exchanger.waitingPeriodSecs()
+
+
 @view
 @external
 def token_info(_token_id: uint256) -> TokenInfo:
@@ -437,16 +639,17 @@ def token_info(_token_id: uint256) -> TokenInfo:
             Balance of the synth
             Max settlement time in seconds
     """
+    data: uint256 = self._token_data(_token_id)
     info: TokenInfo = empty(TokenInfo)
-    info.owner = self.id_to_owner[_token_id]
-    assert info.owner != ZERO_ADDRESS
+    info.owner = convert(bitwise_and(data, 2**160 - 1), address)
 
-    settler: address = convert(_token_id % (2**160), address)
-    info.synth = Settler(settler).synth()
+    settler: address = convert(bitwise_and(_token_id, 2**160 - 1), address)
+    synth_index: uint256 = bitwise_and(shift(data, -161), 2**32 - 1)
+    info.synth = self.synths[synth_index]
     info.underlying_balance = ERC20(info.synth).balanceOf(settler)
 
-    if not self.is_settled[_token_id]:
-        currency_key: bytes32 = self.currency_keys[info.synth]
+    if bitwise_and(data, IS_SETTLED) == 0:
+        currency_key: bytes32 = self.synth_currency_keys[synth_index]
         reclaim: uint256 = 0
         rebate: uint256 = 0
         reclaim, rebate = self.exchanger.settlementOwing(settler, currency_key)
@@ -456,6 +659,256 @@ def token_info(_token_id: uint256) -> TokenInfo:
     return info
 
 
+@view
+@internal
+def _check_caller(_token_id: uint256, _caller: address) -> uint256:
+    # verify that `_caller` may act on `_token_id` and return the packed token data
+    data: uint256 = self._token_data(_token_id)
+    owner: address = convert(bitwise_and(data, 2**160 - 1), address)
+    if _caller != owner:
+        assert (
+            self.owner_to_operators[owner][_caller] or
+            _caller == self.id_to_approval[_token_id]
+        ), "Caller is not owner or operator"
+
+    return data
+
+
+@internal
+def _burn(_token_id: uint256):
+    # burn an NFT, the settler must be added to `free_settlers` by the caller.
+    # the token data is read here rather than passed in by the caller, as the
+    # NFT may have been transferred during an external call since it was checked.
+    settler: address = convert(bitwise_and(_token_id, 2**160 - 1), address)
+    data: uint256 = self.token_data[settler]
+    owner: address = convert(bitwise_and(data, 2**160 - 1), address)
+    self._remove_token_from_owner(owner, bitwise_and(shift(data, -193), 2**32 - 1))
+    self._remove_token_from_all(shift(data, -225))
+    # only the settled flag is left, rather than clearing the slot, so that
+    # the next token minted with this settler writes to a non-zero slot
+    self.token_data[settler] = IS_SETTLED
+    self.id_to_approval[_token_id] = ZERO_ADDRESS
+    log Transfer(owner, ZERO_ADDRESS, _token_id)
+
+
+@internal
+def _new_token_id() -> uint256:
+    # deploy a new settler contract and return the associated token ID
+    settler: address = create_forwarder_to(self.settler_implementation)
+    Settler(settler).initialize()
+    log NewSettler(settler)
+
+    return convert(settler, uint256)
+
+
+@internal
+def _pop_token_id() -> uint256:
+    # pop the top settler from `free_settlers` and return the token ID formed
+    # from its nonce and address
+    free: uint256 = self.free_settlers
+    settler: uint256 = bitwise_and(free, 2**160 - 1)
+    if settler == FREE_LIST_END:
+        # if there are no available settler contracts we must deploy a new one
+        return self._new_token_id()
+
+    data: uint256 = self.settler_data[convert(settler, address)]
+    self.free_settlers = free - 2**160 - settler + bitwise_and(data, 2**160 - 1)
+    return shift(shift(data, -160), 160) + settler
+
+
+@internal
+def _transfer_in(_coin: address, _amount: uint256, _caller: address, _pool: address):
+    # transfer `_coin` from `_caller` and ensure it is approved for `_pool`
+    if _coin == ETH_ADDRESS:
+        return
+
+    # Vyper equivalent of SafeERC20Transfer, handles most ERC20 return values
+    response: Bytes[32] = raw_call(
+        _coin,
+        concat(
+            method_id("transferFrom(address,address,uint256)"),
+            convert(_caller, bytes32),
+            convert(self, bytes32),
+            convert(_amount, bytes32),
+        ),
+        max_outsize=32,
+    )
+    if len(response) != 0:
+        assert convert(response, bool)
+    if not self.is_approved[_coin][_pool]:
+        response = raw_call(
+            _coin,
+            concat(
+                method_id("approve(address,uint256)"),
+                convert(_pool, bytes32),
+                convert(MAX_UINT256, bytes32),
+            ),
+            max_outsize=32,
+        )
+        if len(response) != 0:
+            assert convert(response, bool)
+        self.is_approved[_coin][_pool] = True
+
+
+@internal
+def _swap_into(
+    _from: address,
+    _synth: address,
+    _amount: uint256,
+    _expected: uint256,
+    _caller: address,
+    _token_id: uint256,
+    _value: uint256,
+) -> uint256:
+    # perform the swap from `_from` into `_synth` using the settler of `_token_id`,
+    # and return the final synth balance of the settler. If `_from` is not a synth,
+    # it must already be held by this contract and approved for the pool of the
+    # intermediate synth.
+    settler: address = convert(bitwise_and(_token_id, 2**160 - 1), address)
+    intermediate_synth: address = self.swappable_synth[_from]
+    source_key: bytes32 = EMPTY_BYTES32
+    synth_amount: uint256 = 0
+
+    if intermediate_synth == ZERO_ADDRESS:
+        # `_from` is not in any added pool, so it must be a synth which is
+        # exchanged directly on Synthetix. the currency key is not cached, as
+        # any caller may swap from an unlisted synth. this reverts if `_from`
+        # is not actually a synth.
+        intermediate_synth = _from
+        source_key = Synth(_from).currencyKey()
+    else:
+        source_key = self.currency_keys[intermediate_synth]
+
+    if intermediate_synth == _from:
+        # if `_from` is already a synth, no initial curve exchange is required
+        assert ERC20(_from).transferFrom(_caller, settler, _amount)
+        synth_amount = _amount
+    else:
+        # use Curve to exchange for initial synth, which is sent to the settler.
+        # the exchange is made directly within the pool using the cached coin
+        # indices. older pools do not return the amount received, so it is
+        # measured from the change in balance. a batched swap may hold coins
+        # for later swaps which are the intermediate synth of this one.
+        pool: address = self.synth_pools[intermediate_synth]
+        synth_amount = ERC20(intermediate_synth).balanceOf(self)
+        raw_call(
+            pool,
+            concat(
+                method_id("exchange(int128,int128,uint256,uint256)"),
+                convert(self.coin_indices[pool][_from] - 1, bytes32),
+                convert(self.coin_indices[pool][intermediate_synth] - 1, bytes32),
+                convert(_amount, bytes32),
+                EMPTY_BYTES32,
+            ),
+            value=_value
+        )
+        synth_amount = ERC20(intermediate_synth).balanceOf(self) - synth_amount
+        assert ERC20(intermediate_synth).transfer(settler, synth_amount)
+
+    # use Synthetix to convert initial synth into the target synth
+    initial_balance: uint256 = ERC20(_synth).balanceOf(settler)
+    final_balance: uint256 = Settler(settler).convert_synth(
+        _synth,
+        synth_amount,
+        source_key,
+        self.currency_keys[_synth]
+    )
+    assert final_balance - initial_balance >= _expected, "Rekt by slippage"
+    # record the conversion time, retaining the nonce
+    self.settler_data[settler] = shift(shift(_token_id, -160), 160) + block.timestamp
+
+    return final_balance
+
+
+@internal
+def _mint(_receiver: address, _token_id: uint256, _synth: address):
+    assert _receiver != ZERO_ADDRESS  # dev: zero receiver
+    synth_index: uint256 = self.synth_indices[_synth]
+    assert synth_index != 0  # dev: unknown synth
+    index: uint256 = self._add_token_to_owner(_receiver, _token_id)
+    self.token_data[convert(bitwise_and(_token_id, 2**160 - 1), address)] = (
+        shift(self._add_token_to_all(_token_id), 225)
+        + shift(index, 193)
+        + shift(synth_index, 161)
+        + convert(_receiver, uint256)
+    )
+    log Transfer(ZERO_ADDRESS, _receiver, _token_id)
+
+
+@internal
+def _exchange_from(
+    _settler: address,
+    _synth: address,
+    _to: address,
+    _amount: uint256,
+    _expected: uint256,
+    _receiver: address,
+    _registry_swap: address,
+) -> uint256:
+    # exchange `_synth` held by `_settler` for `_to`, using the cached coin indices
+    pool: address = self.synth_pools[_synth]
+    j: uint256 = self.coin_indices[pool][_to]
+    assert j != 0  # dev: coin not in pool
+
+    return Settler(_settler).exchange(
+        _to, pool, _amount, _expected, _receiver, _registry_swap, self.coin_indices[pool][_synth] - 1, j - 1
+    )
+
+
+@internal
+def _claim(
+    _token_id: uint256,
+    _to: address,
+    _amount: uint256,
+    _expected: uint256,
+    _receiver: address,
+    _caller: address,
+) -> uint256:
+    # settle the synth represented by an NFT, then swap `_amount` into `_to` or
+    # withdraw it if `_to` is ZERO_ADDRESS. The NFT is burned once it is empty.
+    data: uint256 = self._check_caller(_token_id, _caller)
+
+    settler: address = convert(bitwise_and(_token_id, 2**160 - 1), address)
+    synth_index: uint256 = bitwise_and(shift(data, -161), 2**32 - 1)
+    synth: address = self.synths[synth_index]
+
+    # ensure the synth is settled prior to swapping or withdrawing
+    if bitwise_and(data, IS_SETTLED) == 0:
+        currency_key: bytes32 = self.synth_currency_keys[synth_index]
+        self.exchanger.settle(settler, currency_key)
+        self.token_data[settler] = data + IS_SETTLED
+
+    remaining: uint256 = 0
+    if _to == ZERO_ADDRESS:
+        remaining = Settler(settler).withdraw(_receiver, _amount)
+    else:
+        # use Curve to exchange the synth for another asset which is sent to the receiver
+        remaining = self._exchange_from(
+            settler, synth, _to, _amount, _expected, _receiver, self.registry_swap
+        )
+
+    # if the balance of the synth within the NFT is now zero, burn the NFT
+    if remaining == 0:
+        self._burn(_token_id)
+
+        # push the settler onto `free_settlers`, incrementing the
+        # nonce for next time this settler is used
+        free: uint256 = self.free_settlers
+        self.settler_data[settler] = (
+            shift(shift(_token_id, -160) + 1, 160) + bitwise_and(free, 2**160 - 1)
+        )
+        self.free_settlers = shift(shift(free, -160) + 1, 160) + bitwise_and(_token_id, 2**160 - 1)
+
+        synth = ZERO_ADDRESS
+
+    # the receiver may reenter and transfer the NFT while receiving Ether, so
+    # the owner is read again. it is ZERO_ADDRESS if the NFT was burned.
+    owner: address = convert(bitwise_and(self.token_data[settler], 2**160 - 1), address)
+    log TokenUpdate(_token_id, owner, synth, remaining)
+
+    return remaining
+
+
 @payable
 @external
 def swap_into_synth(
@@ -473,7 +926,9 @@ def swap_into_synth(
          this function mints an NFT which represents ownership of the generated
          synth. Once the settlement time has passed, the owner may claim the
          synth by calling to `swap_from_synth` or `withdraw`.
-    @param _from Address of the initial asset being exchanged
+    @param _from Address of the initial asset being exchanged. A synth is
+                 exchanged directly on Synthetix, even if it was not added
+                 with `add_synth`.
     @param _synth Address of the synth being swapped into
     @param _amount Amount of `_from` to swap
     @param _expected Minimum amount of `_synth` to receive
@@ -485,108 +940,135 @@ def swap_into_synth(
                        synth as is being swapped into.
     @return uint256 NFT token ID
     """
-    settler: address = ZERO_ADDRESS
     token_id: uint256 = 0
 
     if _existing_token_id == 0:
         # if no token ID is given we are initiating a new swap
-        count: uint256 = self.id_count
-        if count == 0:
-            # if there are no availale settler contracts we must deploy a new one
-            settler = create_forwarder_to(self.settler_implementation)
-            Settler(settler).initialize()
-            token_id = convert(settler, uint256)
-            log NewSettler(settler)
-        else:
-            count -= 1
-            token_id = self.available_token_ids[count]
-            settler = convert(token_id % (2**160), address)
-            self.id_count = count
+        token_id = self._pop_token_id()
     else:
         # if a token ID is given we are adding to the balance of an existing swap
         # so must check to make sure this is a permitted action
-        settler = convert(_existing_token_id % (2**160), address)
         token_id = _existing_token_id
-        owner: address = self.id_to_owner[_existing_token_id]
-        if msg.sender != owner:
-            assert owner != ZERO_ADDRESS, "Unknown Token ID"
-            assert (
-                self.owner_to_operators[owner][msg.sender] or
-                msg.sender == self.id_to_approval[_existing_token_id]
-            ), "Caller is not owner or operator"
-        assert owner == _receiver, "Receiver is not owner"
-        assert Settler(settler).synth() == _synth, "Incorrect synth for Token ID"
-
-    registry_swap: address = AddressProvider(ADDRESS_PROVIDER).get_address(2)
-    intermediate_synth: address = self.swappable_synth[_from]
-    synth_amount: uint256 = 0
+        data: uint256 = self._check_caller(_existing_token_id, msg.sender)
+        assert convert(bitwise_and(data, 2**160 - 1), address) == _receiver, "Receiver is not owner"
+        synth_index: uint256 = bitwise_and(shift(data, -161), 2**32 - 1)
+        assert self.synths[synth_index] == _synth, "Incorrect synth for Token ID"
+        if bitwise_and(data, IS_SETTLED) != 0:
+            # the new conversion also requires settlement
+            self.token_data[convert(bitwise_and(token_id, 2**160 - 1), address)] = data - IS_SETTLED
 
-    if intermediate_synth == _from:
-        # if `_from` is already a synth, no initial curve exchange is required
-        assert ERC20(_from).transferFrom(msg.sender, settler, _amount)
-        synth_amount = _amount
-    else:
-        if _from != 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE:
-            # Vyper equivalent of SafeERC20Transfer, handles most ERC20 return values
-            response: Bytes[32] = raw_call(
-                _from,
-                concat(
-                    method_id("transferFrom(address,address,uint256)"),
-                    convert(msg.sender, bytes32),
-                    convert(self, bytes32),
-                    convert(_amount, bytes32),
-                ),
-                max_outsize=32,
-            )
-            if len(response) != 0:
-                assert convert(response, bool)
-            if not self.is_approved[_from][registry_swap]:
-                response = raw_call(
-                    _from,
-                    concat(
-                        method_id("approve(address,uint256)"),
-                        convert(registry_swap, bytes32),
-                        convert(MAX_UINT256, bytes32),
-                    ),
-                    max_outsize=32,
-                )
-                if len(response) != 0:
-                    assert convert(response, bool)
-                self.is_approved[_from][registry_swap] = True
-
-        # use Curve to exchange for initial synth, which is sent to the settler
-        synth_amount = RegistrySwap(registry_swap).exchange(
-            self.synth_pools[intermediate_synth],
-            _from,
-            intermediate_synth,
-            _amount,
-            0,
-            settler,
-            value=msg.value
-        )
-
-    # use Synthetix to convert initial synth into the target synth
-    initial_balance: uint256 = ERC20(_synth).balanceOf(settler)
-    Settler(settler).convert_synth(
-        _synth,
-        synth_amount,
-        self.currency_keys[intermediate_synth],
-        self.currency_keys[_synth]
+    intermediate_synth: address = self.swappable_synth[_from]
+    if intermediate_synth != _from and intermediate_synth != ZERO_ADDRESS:
+        self._transfer_in(_from, _amount, msg.sender, self.synth_pools[intermediate_synth])
+    final_balance: uint256 = self._swap_into(
+        _from, _synth, _amount, _expected, msg.sender, token_id, msg.value
     )
-    final_balance: uint256 = ERC20(_synth).balanceOf(settler)
-    assert final_balance - initial_balance >= _expected, "Rekt by slippage"
 
     # if this is a new swap, mint an NFT to represent the unsettled conversion
     if _existing_token_id == 0:
-        self.id_to_owner[token_id] = _receiver
-        self.owner_to_token_count[_receiver] += 1
-        log Transfer(ZERO_ADDRESS, _receiver, token_id)
+        self._mint(_receiver, token_id, _synth)
 
     log TokenUpdate(token_id, _receiver, _synth, final_balance)
 
     return token_id
 
 
+@payable
+@external
+def swap_into_synth_many(
+    _from: address[MAX_BATCH_SIZE],
+    _synth: address[MAX_BATCH_SIZE],
+    _amount: uint256[MAX_BATCH_SIZE],
+    _expected: uint256[MAX_BATCH_SIZE],
+    _receiver: address[MAX_BATCH_SIZE],
+) -> uint256[MAX_BATCH_SIZE]:
+    """
+    @notice Perform multiple cross-asset swaps, minting one NFT for each
+    @dev Each swap behaves the same as a call to `swap_into_synth` without an
+         existing token ID. Arrays are processed until the first swap where
+         `_from` is ZERO_ADDRESS. Coins that are not synths are transferred
+         from the caller once per unique coin, using the combined amount.
+         When swapping from Ether, `msg.value` must equal the sum of all
+         amounts where `_from` is the Ether address.
+    @param _from Addresses of the initial assets being exchanged
+    @param _synth Addresses of the synths being swapped into
+    @param _amount Amounts of `_from` to swap
+    @param _expected Minimum amounts of `_synth` to receive
+    @param _receiver Addresses of the recipients of each NFT, which cannot
+                     be ZERO_ADDRESS for any swap that is processed
+    @return uint256[MAX_BATCH_SIZE] NFT token IDs
+    """
+    token_ids: uint256[MAX_BATCH_SIZE] = empty(uint256[MAX_BATCH_SIZE])
+    coins: address[MAX_BATCH_SIZE] = empty(address[MAX_BATCH_SIZE])
+    totals: uint256[MAX_BATCH_SIZE] = empty(uint256[MAX_BATCH_SIZE])
+    coin_count: uint256 = 0
+    eth_amount: uint256 = 0
+
+    # reserve all token IDs and sum the amounts of each input coin
+    # prior to making any calls to untrusted contracts
+    free: uint256 = self.free_settlers
+    for i in range(MAX_BATCH_SIZE):
+        coin: address = _from[i]
+        if coin == ZERO_ADDRESS:
+            break
+        settler: uint256 = bitwise_and(free, 2**160 - 1)
+        if settler == FREE_LIST_END:
+            # deploying a settler is an external call, but only to trusted code
+            token_ids[i] = self._new_token_id()
+        else:
+            data: uint256 = self.settler_data[convert(settler, address)]
+            token_ids[i] = shift(shift(data, -160), 160) + settler
+            free = free - 2**160 - settler + bitwise_and(data, 2**160 - 1)
+
+        if coin == ETH_ADDRESS:
+            eth_amount += _amount[i]
+            continue
+        intermediate_synth: address = self.swappable_synth[coin]
+        if intermediate_synth == coin or intermediate_synth == ZERO_ADDRESS:
+            # synths are transferred directly into each settler
+            continue
+
+        for x in range(MAX_BATCH_SIZE):
+            if x == coin_count:
+                coins[x] = coin
+                coin_count += 1
+            if coins[x] == coin:
+                totals[x] += _amount[i]
+                break
+    self.free_settlers = free
+
+    assert msg.value == eth_amount  # dev: incorrect ETH amount
+
+    for i in range(MAX_BATCH_SIZE):
+        if i == coin_count:
+            break
+        coin: address = coins[i]
+        self._transfer_in(coin, totals[i], msg.sender, self.synth_pools[self.swappable_synth[coin]])
+
+    for i in range(MAX_BATCH_SIZE):
+        coin: address = _from[i]
+        if coin == ZERO_ADDRESS:
+            break
+        value: uint256 = 0
+        if coin == ETH_ADDRESS:
+            value = _amount[i]
+
+        token_id: uint256 = token_ids[i]
+        final_balance: uint256 = self._swap_into(
+            coin,
+            _synth[i],
+            _amount[i],
+            _expected[i],
+            msg.sender,
+            token_id,
+            value,
+        )
+        self._mint(_receiver[i], token_id, _synth[i])
+        log TokenUpdate(token_id, _receiver[i], _synth[i], final_balance)
+
+    return token_ids
+
+
 @external
 def swap_from_synth(
     _token_id: uint256,
@@ -608,44 +1090,80 @@ def swap_from_synth(
                      if not given defaults to `msg.sender`
     @return uint256 Synth balance remaining in `_token_id`
     """
-    owner: address = self.id_to_owner[_token_id]
-    if msg.sender != self.id_to_owner[_token_id]:
-        assert owner != ZERO_ADDRESS, "Unknown Token ID"
-        assert (
-            self.owner_to_operators[owner][msg.sender] or
-            msg.sender == self.id_to_approval[_token_id]
-        ), "Caller is not owner or operator"
+    assert _to != ZERO_ADDRESS  # dev: coin not in pool
 
-    settler: address = convert(_token_id % (2**160), address)
-    synth: address = self.swappable_synth[_to]
-    pool: address = self.synth_pools[synth]
+    return self._claim(_token_id, _to, _amount, _expected, _receiver, msg.sender)
 
-    # ensure the synth is settled prior to swapping
-    if not self.is_settled[_token_id]:
-        currency_key: bytes32 = self.currency_keys[synth]
-        self.exchanger.settle(settler, currency_key)
-        self.is_settled[_token_id] = True
 
-    # use Curve to exchange the synth for another asset which is sent to the receiver
-    remaining: uint256 = Settler(settler).exchange(_to, pool, _amount, _expected, _receiver)
+@external
+def swap_from_synth_many(
+    _token_ids: uint256[MAX_BATCH_SIZE],
+    _to: address[MAX_BATCH_SIZE],
+    _amounts: uint256[MAX_BATCH_SIZE],
+    _expected: uint256[MAX_BATCH_SIZE],
+    _receiver: address = msg.sender,
+) -> uint256[MAX_BATCH_SIZE]:
+    """
+    @notice Swap the synths represented by multiple NFTs into other assets.
+    @dev Each swap behaves the same as a call to `swap_from_synth`. Arrays are
+         processed until the first token ID of zero. NFTs with no remaining
+         balance are burned.
+    @param _token_ids NFT token IDs
+    @param _to Addresses of the assets to swap into
+    @param _amounts Amounts of the synths to swap
+    @param _expected Minimum amounts of `_to` to receive
+    @param _receiver Address of the recipient of all swapped assets,
+                     if not given defaults to `msg.sender`
+    @return uint256[MAX_BATCH_SIZE] Synth balances remaining in each NFT
+    """
+    exchanger: address = self.exchanger.address
+    registry_swap: address = self.registry_swap
+    remaining: uint256[MAX_BATCH_SIZE] = empty(uint256[MAX_BATCH_SIZE])
+    burned: uint256[MAX_BATCH_SIZE] = empty(uint256[MAX_BATCH_SIZE])
+    burn_count: uint256 = 0
+
+    for i in range(MAX_BATCH_SIZE):
+        token_id: uint256 = _token_ids[i]
+        if token_id == 0:
+            break
+        data: uint256 = self._check_caller(token_id, msg.sender)
 
-    # if the balance of the synth within the NFT is now zero, burn the NFT
-    if remaining == 0:
-        self.id_to_owner[_token_id] = ZERO_ADDRESS
-        self.id_to_approval[_token_id] = ZERO_ADDRESS
-        self.is_settled[_token_id] = False
-        self.owner_to_token_count[msg.sender] -= 1
+        settler: address = convert(bitwise_and(token_id, 2**160 - 1), address)
+        synth_index: uint256 = bitwise_and(shift(data, -161), 2**32 - 1)
+        synth: address = self.synths[synth_index]
 
-        count: uint256 = self.id_count
-        # add 2**160 to increment the nonce for next time this settler is used
-        self.available_token_ids[count] = _token_id + 2**160
-        self.id_count = count + 1
+        if bitwise_and(data, IS_SETTLED) == 0:
+            Exchanger(exchanger).settle(settler, self.synth_currency_keys[synth_index])
+            self.token_data[settler] = data + IS_SETTLED
 
-        owner = ZERO_ADDRESS
-        synth = ZERO_ADDRESS
-        log Transfer(msg.sender, ZERO_ADDRESS, _token_id)
+        remaining[i] = self._exchange_from(
+            settler, synth, _to[i], _amounts[i], _expected[i], _receiver, registry_swap
+        )
 
-    log TokenUpdate(_token_id, owner, synth, remaining)
+        if remaining[i] == 0:
+            self._burn(token_id)
+            burned[burn_count] = token_id
+            burn_count += 1
+            synth = ZERO_ADDRESS
+
+        # read after any external call, as in `_claim`
+        owner: address = convert(bitwise_and(self.token_data[settler], 2**160 - 1), address)
+        log TokenUpdate(token_id, owner, synth, remaining[i])
+
+    # push the settlers of burned NFTs onto `free_settlers` only after every
+    # external call has been made, incrementing the nonce for next time each
+    # settler is used. this is inlined as copying `burned` into an internal
+    # call requires more bytecode than the loop itself.
+    free: uint256 = self.free_settlers
+    for i in range(MAX_BATCH_SIZE):
+        if i == burn_count:
+            break
+        token_id: uint256 = burned[i]
+        self.settler_data[convert(bitwise_and(token_id, 2**160 - 1), address)] = (
+            shift(shift(token_id, -160) + 1, 160) + bitwise_and(free, 2**160 - 1)
+        )
+        free = shift(shift(free, -160) + 1, 160) + bitwise_and(token_id, 2**160 - 1)
+    self.free_settlers = free
 
     return remaining
 
@@ -658,50 +1176,202 @@ def withdraw(_token_id: uint256, _amount: uint256, _receiver: address = msg.send
          period has passed. If `_amount` is equal to the entire balance within
          the NFT, the NFT is burned.
     @param _token_id The identifier for an NFT
-    @param _amount Amount of the synth to withdraw
+    @param _amount Amount of the synth to withdraw. If set to MAX_UINT256,
+                   the entire balance is withdrawn.
     @param _receiver Address of the recipient of the synth,
                      if not given defaults to `msg.sender`
     @return uint256 Synth balance remaining in `_token_id`
     """
-    owner: address = self.id_to_owner[_token_id]
-    if msg.sender != self.id_to_owner[_token_id]:
-        assert owner != ZERO_ADDRESS, "Unknown Token ID"
-        assert (
-            self.owner_to_operators[owner][msg.sender] or
-            msg.sender == self.id_to_approval[_token_id]
-        ), "Caller is not owner or operator"
+    return self._claim(_token_id, ZERO_ADDRESS, _amount, 0, _receiver, msg.sender)
 
-    settler: address = convert(_token_id % (2**160), address)
-    synth: address = Settler(settler).synth()
 
-    # ensure the synth is settled prior to withdrawal
-    if not self.is_settled[_token_id]:
-        currency_key: bytes32 = self.currency_keys[synth]
+@external
+def withdraw_many(
+    _token_ids: uint256[MAX_BATCH_SIZE],
+    _amounts: uint256[MAX_BATCH_SIZE],
+    _receiver: address = msg.sender,
+) -> uint256[MAX_BATCH_SIZE]:
+    """
+    @notice Withdraw the synths represented by multiple NFTs.
+    @dev Each withdrawal behaves the same as a call to `withdraw`. Arrays are
+         processed until the first token ID of zero. NFTs with no remaining
+         balance are burned.
+    @param _token_ids NFT token IDs
+    @param _amounts Amounts of the synths to withdraw
+    @param _receiver Address of the recipient of all withdrawn synths,
+                     if not given defaults to `msg.sender`
+    @return uint256[MAX_BATCH_SIZE] Synth balances remaining in each NFT
+    """
+    exchanger: address = self.exchanger.address
+    remaining: uint256[MAX_BATCH_SIZE] = empty(uint256[MAX_BATCH_SIZE])
+    burned: uint256[MAX_BATCH_SIZE] = empty(uint256[MAX_BATCH_SIZE])
+    burn_count: uint256 = 0
+
+    # NFTs in a batch commonly hold the same synth, so the last currency key is reused
+    last_index: uint256 = 0
+    currency_key: bytes32 = EMPTY_BYTES32
+
+    for i in range(MAX_BATCH_SIZE):
+        token_id: uint256 = _token_ids[i]
+        if token_id == 0:
+            break
+        data: uint256 = self._check_caller(token_id, msg.sender)
+
+        settler: address = convert(bitwise_and(token_id, 2**160 - 1), address)
+        synth_index: uint256 = bitwise_and(shift(data, -161), 2**32 - 1)
+        synth: address = self.synths[synth_index]
+
+        if bitwise_and(data, IS_SETTLED) == 0:
+            if synth_index != last_index:
+                currency_key = self.synth_currency_keys[synth_index]
+                last_index = synth_index
+            Exchanger(exchanger).settle(settler, currency_key)
+            self.token_data[settler] = data + IS_SETTLED
+
+        remaining[i] = Settler(settler).withdraw(_receiver, _amounts[i])
+
+        if remaining[i] == 0:
+            self._burn(token_id)
+            burned[burn_count] = token_id
+            burn_count += 1
+            synth = ZERO_ADDRESS
+
+        # read after any external call, as in `_claim`
+        owner: address = convert(bitwise_and(self.token_data[settler], 2**160 - 1), address)
+        log TokenUpdate(token_id, owner, synth, remaining[i])
+
+    # push the settlers of burned NFTs onto `free_settlers` only after every
+    # external call has been made, incrementing the nonce for next time each
+    # settler is used. this is inlined as copying `burned` into an internal
+    # call requires more bytecode than the loop itself.
+    free: uint256 = self.free_settlers
+    for i in range(MAX_BATCH_SIZE):
+        if i == burn_count:
+            break
+        token_id: uint256 = burned[i]
+        self.settler_data[convert(bitwise_and(token_id, 2**160 - 1), address)] = (
+            shift(shift(token_id, -160) + 1, 160) + bitwise_and(free, 2**160 - 1)
+        )
+        free = shift(shift(free, -160) + 1, 160) + bitwise_and(token_id, 2**160 - 1)
+    self.free_settlers = free
+
+    return remaining
+
+
+@external
+def convert_token(_token_id: uint256, _synth: address, _expected: uint256) -> uint256:
+    """
+    @notice Convert the synth represented by an NFT into another synth
+    @dev Callable by the owner or operator of `_token_id` after the synth settlement
+         period has passed. The entire balance is converted via Synthetix within
+         the same settler, so the token ID is unchanged. The new synth must be
+         settled before it can be converted, swapped or withdrawn.
+    @param _token_id The identifier for an NFT
+    @param _synth Address of the synth to convert into
+    @param _expected Minimum amount of `_synth` to receive
+    @return uint256 Balance of `_synth` held in `_token_id`
+    """
+    data: uint256 = self._check_caller(_token_id, msg.sender)
+    new_index: uint256 = self.synth_indices[_synth]
+    assert new_index != 0  # dev: unknown synth
+
+    settler: address = convert(bitwise_and(_token_id, 2**160 - 1), address)
+    synth_index: uint256 = bitwise_and(shift(data, -161), 2**32 - 1)
+    assert synth_index != new_index  # dev: same synth
+    currency_key: bytes32 = self.synth_currency_keys[synth_index]
+
+    # ensure the synth is settled prior to conversion
+    if bitwise_and(data, IS_SETTLED) == 0:
         self.exchanger.settle(settler, currency_key)
-        self.is_settled[_token_id] = True
 
-    remaining: uint256 = Settler(settler).withdraw(_receiver, _amount)
+    final_balance: uint256 = Settler(settler).convert_synth(
+        _synth,
+        ERC20(self.synths[synth_index]).balanceOf(settler),
+        currency_key,
+        self.synth_currency_keys[new_index],
+    )
+    assert final_balance >= _expected, "Rekt by slippage"
 
-    # if the balance of the synth within the NFT is now zero, burn the NFT
-    if remaining == 0:
-        self.id_to_owner[_token_id] = ZERO_ADDRESS
-        self.id_to_approval[_token_id] = ZERO_ADDRESS
-        self.is_settled[_token_id] = False
-        self.owner_to_token_count[msg.sender] -= 1
+    # replace the synth index and clear the settled flag, the new conversion
+    # restarts the waiting period
+    self.token_data[settler] = (
+        data + shift(new_index, 161) - shift(synth_index, 161) - bitwise_and(data, IS_SETTLED)
+    )
+    self.settler_data[settler] = shift(shift(_token_id, -160), 160) + block.timestamp
 
-        count: uint256 = self.id_count
-        # add 2**160 to increment the nonce for next time this settler is used
-        self.available_token_ids[count] = _token_id + 2**160
-        self.id_count = count + 1
+    owner: address = convert(bitwise_and(data, 2**160 - 1), address)
+    log TokenUpdate(_token_id, owner, _synth, final_balance)
 
-        owner = ZERO_ADDRESS
-        synth = ZERO_ADDRESS
-        log Transfer(msg.sender, ZERO_ADDRESS, _token_id)
+    return final_balance
 
 
-    log TokenUpdate(_token_id, owner, synth, remaining)
+@external
+def merge(_token_ids: uint256[MAX_BATCH_SIZE], _into_id: uint256) -> uint256:
+    """
+    @notice Merge the synths represented by multiple NFTs into a single NFT
+    @dev Callable by the owner or operator of each NFT after the synth settlement
+         period has passed. Every NFT must have the same owner and synth as
+         `_into_id`. The entire balance of each NFT in `_token_ids` is moved into
+         `_into_id`, and the emptied NFTs are burned so their settlers can be
+         reused. Token IDs are processed until the first token ID of zero.
+    @param _token_ids NFT token IDs to merge
+    @param _into_id NFT token ID that receives the merged balances
+    @return uint256 Synth balance of `_into_id`
+    """
+    into_data: uint256 = self._check_caller(_into_id, msg.sender)
+    into_settler: address = convert(bitwise_and(_into_id, 2**160 - 1), address)
 
-    return remaining
+    for token_id in _token_ids:
+        if token_id == 0:
+            break
+        assert token_id != _into_id  # dev: cannot merge into self
+        # the owner and synth must match, the settled flag may differ
+        diff: uint256 = bitwise_xor(self._token_data(token_id), into_data)
+        assert bitwise_and(diff, 2**193 - 1 - IS_SETTLED) == 0  # dev: owner or synth mismatch
+
+        # withdraw the entire balance into the settler of `_into_id`
+        self._claim(token_id, ZERO_ADDRESS, MAX_UINT256, 0, into_settler, msg.sender)
+        log BalanceTransfer(token_id, _into_id)
+
+    synth: address = self.synths[bitwise_and(shift(into_data, -161), 2**32 - 1)]
+    final_balance: uint256 = ERC20(synth).balanceOf(into_settler)
+    owner: address = convert(bitwise_and(into_data, 2**160 - 1), address)
+    log TokenUpdate(_into_id, owner, synth, final_balance)
+
+    return final_balance
+
+
+@external
+def split(_token_id: uint256, _amount: uint256) -> uint256:
+    """
+    @notice Move part of the synth balance represented by an NFT into a new NFT
+    @dev Callable by the owner or operator of `_token_id` after the synth settlement
+         period has passed. `_amount` is moved to an available settler and the
+         new NFT is minted to the owner of `_token_id`. Both NFTs are settled.
+    @param _token_id The identifier for an NFT
+    @param _amount Amount of the synth to move, must be less than the balance
+                   of `_token_id`
+    @return uint256 Token ID of the new NFT
+    """
+    token_id: uint256 = self._pop_token_id()
+    settler: address = convert(bitwise_and(token_id, 2**160 - 1), address)
+
+    remaining: uint256 = self._claim(_token_id, ZERO_ADDRESS, _amount, 0, settler, msg.sender)
+    assert remaining != 0  # dev: entire balance
+
+    data: uint256 = self._token_data(_token_id)
+    owner: address = convert(bitwise_and(data, 2**160 - 1), address)
+    synth: address = self.synths[bitwise_and(shift(data, -161), 2**32 - 1)]
+    final_balance: uint256 = Settler(settler).set_synth(synth)
+
+    # the moved balance is already settled
+    self._mint(owner, token_id, synth)
+    self.token_data[settler] += IS_SETTLED
+
+    log BalanceTransfer(_token_id, token_id)
+    log TokenUpdate(token_id, owner, synth, final_balance)
+
+    return token_id
 
 
 @external
@@ -713,14 +1383,42 @@ def settle(_token_id: uint256) -> bool:
     @param _token_id The identifier for an NFT
     @return bool Success
     """
-    if not self.is_settled[_token_id]:
-        assert self.id_to_owner[_token_id] != ZERO_ADDRESS, "Unknown Token ID"
-
-        settler: address = convert(_token_id % (2**160), address)
-        synth: address = Settler(settler).synth()
-        currency_key: bytes32 = self.currency_keys[synth]
+    data: uint256 = self._token_data(_token_id)
+    if bitwise_and(data, IS_SETTLED) == 0:
+        settler: address = convert(bitwise_and(_token_id, 2**160 - 1), address)
+        currency_key: bytes32 = self.synth_currency_keys[bitwise_and(shift(data, -161), 2**32 - 1)]
         self.exchanger.settle(settler, currency_key)  # dev: settlement failed
-        self.is_settled[_token_id] = True
+        self.token_data[settler] = data + IS_SETTLED
+
+    return True
+
+
+@external
+def settle_many(_token_ids: uint256[MAX_BATCH_SIZE]) -> bool:
+    """
+    @notice Settle the synths represented in multiple NFTs.
+    @dev Token IDs are processed until the first token ID of zero.
+    @param _token_ids NFT token IDs
+    @return bool Success
+    """
+    exchanger: address = self.exchanger.address
+    last_index: uint256 = 0
+    currency_key: bytes32 = EMPTY_BYTES32
+
+    for token_id in _token_ids:
+        if token_id == 0:
+            break
+        data: uint256 = self._token_data(token_id)
+        if bitwise_and(data, IS_SETTLED) != 0:
+            continue
+
+        settler: address = convert(bitwise_and(token_id, 2**160 - 1), address)
+        synth_index: uint256 = bitwise_and(shift(data, -161), 2**32 - 1)
+        if synth_index != last_index:
+            currency_key = self.synth_currency_keys[synth_index]
+            last_index = synth_index
+        Exchanger(exchanger).settle(settler, currency_key)  # dev: settlement failed
+        self.token_data[settler] = data + IS_SETTLED
 
     return True
 
@@ -738,13 +1436,21 @@ def add_synth(_synth: address, _pool: address):
     assert self.synth_pools[_synth] == ZERO_ADDRESS  # dev: already added
 
     # this will revert if `_synth` is not actually a synth
-    self.currency_keys[_synth] = Synth(_synth).currencyKey()
+    currency_key: bytes32 = Synth(_synth).currencyKey()
+    self.currency_keys[_synth] = currency_key
 
-    registry: address = AddressProvider(ADDRESS_PROVIDER).get_registry()
+    synth_index: uint256 = self.synth_count + 1
+    self.synth_indices[_synth] = synth_index
+    self.synths[synth_index] = _synth
+    self.synth_currency_keys[synth_index] = currency_key
+    self.synth_count = synth_index
+
+    registry: address = self.registry
     pool_coins: address[8] = Registry(registry).get_coins(_pool)
 
     has_synth: bool = False
-    for coin in pool_coins:
+    for i in range(8):
+        coin: address = pool_coins[i]
         if coin == ZERO_ADDRESS:
             assert has_synth  # dev: synth not in pool
             break
@@ -752,19 +1458,67 @@ def add_synth(_synth: address, _pool: address):
             self.synth_pools[_synth] = _pool
             has_synth = True
         self.swappable_synth[coin] = _synth
+        self.coin_indices[_pool][coin] = i + 1
 
     log NewSynth(_synth, _pool)
 
 
+@view
+@external
+def available_settlers() -> uint256:
+    """
+    @notice Get the number of settlers available for new swaps
+    @dev When no settlers are available, `swap_into_synth` deploys a new
+         settler at the caller's expense
+    @return uint256 Number of available settlers
+    """
+    return shift(self.free_settlers, -160)
+
+
+@external
+def prewarm_settlers(_count: uint256) -> uint256:
+    """
+    @notice Deploy new settlers ahead of demand
+    @dev Callable by anyone. Settlers are deployed up front so that swaps do
+         not incur the cost of deploying a settler during busy periods.
+    @param _count Number of settlers to deploy, cannot exceed `MAX_SETTLER_DEPLOYS`
+    @return uint256 Number of available settlers after deployment
+    """
+    assert _count <= MAX_SETTLER_DEPLOYS  # dev: too many settlers
+
+    implementation: address = self.settler_implementation
+    free: uint256 = self.free_settlers
+    for i in range(MAX_SETTLER_DEPLOYS):
+        if i == _count:
+            break
+        settler: address = create_forwarder_to(implementation)
+        Settler(settler).initialize()
+        # push the settler onto the stack, with a nonce of zero
+        self.settler_data[settler] = bitwise_and(free, 2**160 - 1)
+        free = shift(shift(free, -160) + 1, 160) + convert(settler, uint256)
+        log NewSettler(settler)
+
+    self.free_settlers = free
+    count: uint256 = shift(free, -160)
+    log SettlersDeployed(msg.sender, _count, count)
+
+    return count
+
+
 @external
 def rebuildCache():
     """
-    @notice Update the current address of the SNX Exchanger contract
-    @dev The SNX exchanger address is kept in the local contract storage to reduce gas costs.
-         If this address changes, contract will stop working until the local address is updated.
+    @notice Update the cached addresses of the SNX Exchanger, Curve registry
+            and Curve registry swap contracts
+    @dev The addresses are kept in the local contract storage to reduce gas costs.
+         If an address changes, contract will stop working until the local address is updated.
          Synthetix automates this process within their own architecture by exposing a `rebuildCache`
          method in their own contracts, and calling them all to update via `AddressResolver.rebuildCaches`,
          so we use the same API in order to be able to receive updates from them as well.
          https://docs.synthetix.io/contracts/source/contracts/AddressResolver/#rebuildcaches
+         Approvals are tracked per spender, so coins and synths are approved for a new
+         registry swap contract the first time they are exchanged through it.
     """
     self.exchanger = Exchanger(SNXAddressResolver(SNX_ADDRESS_RESOLVER).getAddress(EXCHANGER_KEY))
+    self.registry = AddressProvider(ADDRESS_PROVIDER).get_registry()
+    self.registry_swap = AddressProvider(ADDRESS_PROVIDER).get_address(2)
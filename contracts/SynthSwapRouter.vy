@@ -0,0 +1,386 @@
+# @version 0.2.8
+"""
+@title Curve SynthSwap Router
+@author Curve.fi
+@license MIT
+@notice Alternative entry points for `SynthSwap`
+@dev Kept separate from `SynthSwap` so that the main contract stays
+     within the contract size limit. Coins are transferred into the router
+     and then swapped, with the resulting NFT minted to the receiver. To swap
+     out of an NFT via the router, it must be approved as an operator.
+"""
+
+
+interface SynthSwap:
+    def swap_into_synth(
+        _from: address,
+        _synth: address,
+        _amount: uint256,
+        _expected: uint256,
+        _receiver: address,
+    ) -> uint256: payable
+    def swap_from_synth(
+        _token_id: uint256,
+        _to: address,
+        _amount: uint256,
+        _expected: uint256,
+        _receiver: address,
+    ) -> uint256: nonpayable
+    def synth_pools(_synth: address) -> address: view
+    def swappable_synth(_coin: address) -> address: view
+    def currency_keys(_synth: address) -> bytes32: view
+    def ownerOf(_token_id: uint256) -> address: view
+    def getApproved(_token_id: uint256) -> address: view
+    def isApprovedForAll(_owner: address, _operator: address) -> bool: view
+
+interface AddressProvider:
+    def get_registry() -> address: view
+
+interface Registry:
+    def get_coins(_pool: address) -> address[8]: view
+
+interface SNXAddressResolver:
+    def getAddress(name: bytes32) -> address: view
+
+interface Synth:
+    def currencyKey() -> bytes32: nonpayable
+
+interface Exchanger:
+    def getAmountsForExchange(
+        sourceAmount: uint256,
+        sourceCurrencyKey: bytes32,
+        destinationCurrencyKey: bytes32
+    ) -> (uint256, uint256, uint256): view
+
+interface ERC20:
+    def balanceOf(_owner: address) -> uint256: view
+    def decimals() -> uint256: view
+
+interface ERC20Permit:
+    def allowance(_owner: address, _spender: address) -> uint256: view
+    def nonces(_owner: address) -> uint256: view
+
+
+ADDRESS_PROVIDER: constant(address) = 0x0000000022D53366457F9d5E68Ec105046FC4383
+
+SNX_ADDRESS_RESOLVER: constant(address) = 0x4E3b31eB0E5CB73641EE1E65E7dCEFe520bA3ef2
+EXCHANGER_KEY: constant(bytes32) = 0x45786368616e6765720000000000000000000000000000000000000000000000
+
+ETH_ADDRESS: constant(address) = 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE
+
+# denominator for slippage given in basis points
+MAX_BPS: constant(uint256) = 10000
+
+
+swap: public(address)
+
+# coin -> spender -> is approved to transfer the coin from this contract?
+is_approved: HashMap[address, HashMap[address, bool]]
+
+
+@external
+def __init__(_swap: address):
+    """
+    @notice Contract constructor
+    @param _swap `SynthSwap` deployment to route swaps through
+    """
+    self.swap = _swap
+
+
+@view
+@internal
+def _decimals(_coin: address) -> uint256:
+    if _coin == ETH_ADDRESS:
+        return 18
+    return ERC20(_coin).decimals()
+
+
+@internal
+def _approve(_coin: address, _spender: address):
+    # ensure `_coin` is approved for `_spender`
+    if not self.is_approved[_coin][_spender]:
+        response: Bytes[32] = raw_call(
+            _coin,
+            concat(
+                method_id("approve(address,uint256)"),
+                convert(_spender, bytes32),
+                convert(MAX_UINT256, bytes32),
+            ),
+            max_outsize=32,
+        )
+        if len(response) != 0:
+            assert convert(response, bool)
+        self.is_approved[_coin][_spender] = True
+
+
+@internal
+def _transfer_in(_coin: address, _amount: uint256, _caller: address, _spender: address):
+    # transfer `_coin` from `_caller` and ensure it is approved for `_spender`
+
+    # Vyper equivalent of SafeERC20Transfer, handles most ERC20 return values
+    response: Bytes[32] = raw_call(
+        _coin,
+        concat(
+            method_id("transferFrom(address,address,uint256)"),
+            convert(_caller, bytes32),
+            convert(self, bytes32),
+            convert(_amount, bytes32),
+        ),
+        max_outsize=32,
+    )
+    if len(response) != 0:
+        assert convert(response, bool)
+    self._approve(_coin, _spender)
+
+
+@external
+def swap_into_synth_with_permit(
+    _from: address,
+    _synth: address,
+    _amount: uint256,
+    _expected: uint256,
+    _deadline: uint256,
+    _v: uint256,
+    _r: bytes32,
+    _s: bytes32,
+    _is_dai_permit: bool,
+    _receiver: address = msg.sender,
+) -> uint256:
+    """
+    @notice Perform a cross-asset swap between `_from` and `_synth`, using a
+            signed permit to approve the transfer of `_from`
+    @dev Allows a first swap to be made in a single transaction, without a
+         prior call to `approve`. The permit must be signed for this contract
+         as the spender. `_from` must support either EIP-2612 `permit`, or the
+         DAI-style `permit` which approves an unlimited amount using the
+         caller's current nonce. The permit is skipped if the existing allowance
+         is sufficient, so a signature that was already submitted by a third
+         party does not cause a revert.
+    @param _from Address of the initial asset being exchanged
+    @param _synth Address of the synth being swapped into
+    @param _amount Amount of `_from` to swap, and the value of an EIP-2612 permit
+    @param _expected Minimum amount of `_synth` to receive
+    @param _deadline Expiry of the permit signature
+    @param _v Recovery byte of the permit signature
+    @param _r First 32 bytes of the permit signature
+    @param _s Second 32 bytes of the permit signature
+    @param _is_dai_permit If True, `_from` uses the DAI-style `permit`
+    @param _receiver Address of the recipient of the NFT, if not given
+                       defaults to `msg.sender`
+    @return uint256 NFT token ID
+    """
+    if ERC20Permit(_from).allowance(msg.sender, self) < _amount:
+        if _is_dai_permit:
+            raw_call(
+                _from,
+                concat(
+                    method_id("permit(address,address,uint256,uint256,bool,uint8,bytes32,bytes32)"),
+                    convert(msg.sender, bytes32),
+                    convert(self, bytes32),
+                    convert(ERC20Permit(_from).nonces(msg.sender), bytes32),
+                    convert(_deadline, bytes32),
+                    convert(True, bytes32),
+                    convert(_v, bytes32),
+                    _r,
+                    _s,
+                ),
+            )
+        else:
+            raw_call(
+                _from,
+                concat(
+                    method_id("permit(address,address,uint256,uint256,uint8,bytes32,bytes32)"),
+                    convert(msg.sender, bytes32),
+                    convert(self, bytes32),
+                    convert(_amount, bytes32),
+                    convert(_deadline, bytes32),
+                    convert(_v, bytes32),
+                    _r,
+                    _s,
+                ),
+            )
+
+    swap: address = self.swap
+    self._transfer_in(_from, _amount, msg.sender, swap)
+
+    return SynthSwap(swap).swap_into_synth(_from, _synth, _amount, _expected, _receiver)
+
+
+@payable
+@external
+def swap_into_synth_via(
+    _from: address,
+    _synth: address,
+    _amount: uint256,
+    _expected: uint256,
+    _initial_synth: address,
+    _receiver: address = msg.sender,
+) -> uint256:
+    """
+    @notice Perform a cross-asset swap between `_from` and `_synth`, using
+            `_initial_synth` as the intermediate synth
+    @dev `swap_into_synth` always exchanges `_from` for `swappable_synth(_from)`.
+         This allows any other synth whose Curve pool contains `_from` to be
+         used instead, for example the route returned by
+         `SynthSwapViews.get_best_route`.
+    @param _from Address of the initial asset being exchanged
+    @param _synth Address of the synth being swapped into
+    @param _amount Amount of `_from` to swap. When swapping from Ether,
+                   `msg.value` must be equal to this amount.
+    @param _expected Minimum amount of `_synth` to receive
+    @param _initial_synth Synth that `_from` is exchanged for on Curve
+    @param _receiver Address of the recipient of the NFT, if not given
+                       defaults to `msg.sender`
+    @return uint256 NFT token ID
+    """
+    if _from == ETH_ADDRESS:
+        assert msg.value == _amount  # dev: incorrect ETH amount
+    else:
+        assert msg.value == 0  # dev: non-zero ETH amount
+
+    swap: address = self.swap
+    synth_amount: uint256 = _amount
+    if _from == _initial_synth:
+        # `_from` is already a synth, so no curve exchange is required
+        self._transfer_in(_from, _amount, msg.sender, swap)
+    else:
+        pool: address = SynthSwap(swap).synth_pools(_initial_synth)
+        assert pool != ZERO_ADDRESS  # dev: unknown synth
+
+        registry: address = AddressProvider(ADDRESS_PROVIDER).get_registry()
+        coins: address[8] = Registry(registry).get_coins(pool)
+        i: int128 = -1
+        j: int128 = 0
+        for x in range(8):
+            if coins[x] == _from:
+                i = x
+            elif coins[x] == _initial_synth:
+                j = x
+        assert i != -1  # dev: coin not in pool
+
+        if _from != ETH_ADDRESS:
+            self._transfer_in(_from, _amount, msg.sender, pool)
+
+        # older pools do not return the amount received, so it is measured
+        # from the change in balance
+        synth_amount = ERC20(_initial_synth).balanceOf(self)
+        raw_call(
+            pool,
+            concat(
+                method_id("exchange(int128,int128,uint256,uint256)"),
+                convert(i, bytes32),
+                convert(j, bytes32),
+                convert(_amount, bytes32),
+                EMPTY_BYTES32,
+            ),
+            value=msg.value
+        )
+        synth_amount = ERC20(_initial_synth).balanceOf(self) - synth_amount
+        self._approve(_initial_synth, swap)
+
+    return SynthSwap(swap).swap_into_synth(
+        _initial_synth, _synth, synth_amount, _expected, _receiver
+    )
+
+
+@payable
+@external
+def swap_into_synth_with_slippage(
+    _from: address,
+    _synth: address,
+    _amount: uint256,
+    _max_slippage: uint256,
+    _deadline: uint256,
+    _receiver: address = msg.sender,
+) -> uint256:
+    """
+    @notice Perform a cross-asset swap between `_from` and `_synth`, with the
+            minimum amount received given as a maximum slippage
+    @dev The reference amount is calculated within the transaction, valuing
+         `_from` at par with its synth and converting at the Synthetix rate.
+         Neither depends on the balances of the Curve pool, so the reference
+         cannot be moved by trades placed before this one. The slippage covers
+         the Curve exchange, including its fee.
+    @param _from Address of the initial asset being exchanged
+    @param _synth Address of the synth being swapped into
+    @param _amount Amount of `_from` to swap. When swapping from Ether,
+                   `msg.value` must be equal to this amount.
+    @param _max_slippage Maximum slippage from the reference amount, in
+                         basis points
+    @param _deadline Timestamp after which the swap reverts
+    @param _receiver Address of the recipient of the NFT, if not given
+                       defaults to `msg.sender`
+    @return uint256 NFT token ID
+    """
+    assert block.timestamp <= _deadline  # dev: expired
+    assert _max_slippage <= MAX_BPS  # dev: invalid slippage
+    if _from == ETH_ADDRESS:
+        assert msg.value == _amount  # dev: incorrect ETH amount
+    else:
+        assert msg.value == 0  # dev: non-zero ETH amount
+
+    swap: address = self.swap
+    # currency keys are read from the cache within `SynthSwap` where possible,
+    # as `currencyKey` on a Synthetix proxy is handled by a state-changing fallback
+    initial_key: bytes32 = SynthSwap(swap).currency_keys(SynthSwap(swap).swappable_synth(_from))
+    if initial_key == EMPTY_BYTES32:
+        # a synth that is not in any added pool is exchanged directly
+        initial_key = Synth(_from).currencyKey()
+
+    exchanger: address = SNXAddressResolver(SNX_ADDRESS_RESOLVER).getAddress(EXCHANGER_KEY)
+    expected: uint256 = Exchanger(exchanger).getAmountsForExchange(
+        _amount * 10**18 / 10**self._decimals(_from),
+        initial_key,
+        SynthSwap(swap).currency_keys(_synth),
+    )[0]
+    expected = expected * (MAX_BPS - _max_slippage) / MAX_BPS
+
+    if _from != ETH_ADDRESS:
+        self._transfer_in(_from, _amount, msg.sender, swap)
+
+    return SynthSwap(swap).swap_into_synth(
+        _from, _synth, _amount, expected, _receiver, value=msg.value
+    )
+
+
+@external
+def swap_from_synth_with_slippage(
+    _token_id: uint256,
+    _to: address,
+    _amount: uint256,
+    _max_slippage: uint256,
+    _deadline: uint256,
+    _receiver: address = msg.sender,
+) -> uint256:
+    """
+    @notice Swap the synth represented by an NFT into another asset, with the
+            minimum amount received given as a maximum slippage
+    @dev The reference amount values the synth at par with `_to`, so it
+         cannot be moved by trades placed before this one. This contract must
+         be approved as an operator of `_token_id`, and the caller must be its
+         owner or operator.
+    @param _token_id The identifier for an NFT
+    @param _to Address of the asset to swap into
+    @param _amount Amount of the synth to swap
+    @param _max_slippage Maximum slippage from the reference amount, in
+                         basis points
+    @param _deadline Timestamp after which the swap reverts
+    @param _receiver Address of the recipient of `_to`, if not given
+                       defaults to `msg.sender`
+    @return uint256 Synth balance remaining in `_token_id`
+    """
+    assert block.timestamp <= _deadline  # dev: expired
+    assert _max_slippage <= MAX_BPS  # dev: invalid slippage
+
+    swap: address = self.swap
+    owner: address = SynthSwap(swap).ownerOf(_token_id)
+    if msg.sender != owner:
+        assert (
+            SynthSwap(swap).isApprovedForAll(owner, msg.sender)
+            or SynthSwap(swap).getApproved(_token_id) == msg.sender
+        ), "Caller is not owner or operator"
+
+    expected: uint256 = _amount * 10**self._decimals(_to) / 10**18
+    expected = expected * (MAX_BPS - _max_slippage) / MAX_BPS
+
+    return SynthSwap(swap).swap_from_synth(_token_id, _to, _amount, expected, _receiver)
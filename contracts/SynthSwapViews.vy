@@ -0,0 +1,427 @@
+# @version 0.2.8
+"""
+@title Curve SynthSwap Views
+@author Curve.fi
+@license MIT
+@notice Bulk read-only queries and quotes for `SynthSwap`
+@dev Kept separate from `SynthSwap` so that the main contract stays
+     within the contract size limit
+"""
+
+
+struct TokenInfo:
+    owner: address
+    synth: address
+    underlying_balance: uint256
+    time_to_settle: uint256
+
+struct SwapRoute:
+    initial_synth: address
+    initial_pool: address
+    initial_synth_amount: uint256
+    final_synth: address
+    final_pool: address
+    final_synth_amount: uint256
+    exchange_fee: uint256
+    amount: uint256
+
+struct RoutePath:
+    initial_pool: address
+    initial_i: int128
+    initial_j: int128
+    initial_currency_key: bytes32
+    final_pool: address
+    final_i: int128
+    final_j: int128
+    final_currency_key: bytes32
+    exchanger: address
+
+
+interface AddressProvider:
+    def get_registry() -> address: view
+
+interface Curve:
+    def get_dy(i: int128, j: int128, dx: uint256) -> uint256: view
+
+interface Registry:
+    def get_coins(_pool: address) -> address[8]: view
+
+interface SNXAddressResolver:
+    def getAddress(name: bytes32) -> address: view
+
+interface Exchanger:
+    def getAmountsForExchange(
+        sourceAmount: uint256,
+        sourceCurrencyKey: bytes32,
+        destinationCurrencyKey: bytes32
+    ) -> (uint256, uint256, uint256): view
+
+interface SynthSwap:
+    def synths(_index: uint256) -> address: view
+    def synth_pools(_synth: address) -> address: view
+    def swappable_synth(_coin: address) -> address: view
+    def currency_keys(_synth: address) -> bytes32: view
+    def balanceOf(_owner: address) -> uint256: view
+    def tokenOfOwnerByIndex(_owner: address, _index: uint256) -> uint256: view
+    def token_info(_token_id: uint256) -> TokenInfo: view
+
+
+ADDRESS_PROVIDER: constant(address) = 0x0000000022D53366457F9d5E68Ec105046FC4383
+
+SNX_ADDRESS_RESOLVER: constant(address) = 0x4E3b31eB0E5CB73641EE1E65E7dCEFe520bA3ef2
+EXCHANGER_KEY: constant(bytes32) = 0x45786368616e6765720000000000000000000000000000000000000000000000
+
+# maximum number of token IDs or amounts that may be queried in a single call
+MAX_QUERY_SIZE: constant(uint256) = 50
+# maximum number of synths considered when searching for the best route
+MAX_SYNTHS: constant(uint256) = 20
+
+swap: public(address)
+
+
+@external
+def __init__(_swap: address):
+    """
+    @notice Contract constructor
+    @param _swap `SynthSwap` deployment to query
+    """
+    self.swap = _swap
+
+
+@view
+@external
+def tokens_of_owner(
+    _owner: address,
+    _offset: uint256 = 0,
+    _limit: uint256 = MAX_QUERY_SIZE
+) -> uint256[MAX_QUERY_SIZE]:
+    """
+    @notice Get the token IDs of NFTs owned by `_owner`
+    @dev Token IDs are not returned in any particular order, and the order
+         may change when NFTs are transferred or burned
+    @param _owner Address to query token IDs for
+    @param _offset Number of token IDs to skip
+    @param _limit Maximum number of token IDs to return, cannot exceed
+                  `MAX_QUERY_SIZE`
+    @return Array of token IDs, unused entries are zero
+    """
+    token_ids: uint256[MAX_QUERY_SIZE] = empty(uint256[MAX_QUERY_SIZE])
+    swap: address = self.swap
+    count: uint256 = SynthSwap(swap).balanceOf(_owner)
+    if _offset >= count:
+        return token_ids
+
+    count = min(count - _offset, min(_limit, MAX_QUERY_SIZE))
+    for i in range(MAX_QUERY_SIZE):
+        if i == count:
+            break
+        token_ids[i] = SynthSwap(swap).tokenOfOwnerByIndex(_owner, _offset + i)
+
+    return token_ids
+
+
+@view
+@external
+def tokens_info(_token_ids: uint256[MAX_QUERY_SIZE]) -> (
+    address[MAX_QUERY_SIZE],
+    address[MAX_QUERY_SIZE],
+    uint256[MAX_QUERY_SIZE],
+    uint256[MAX_QUERY_SIZE],
+):
+    """
+    @notice Get information about the synths represented by many NFTs
+    @dev Use in combination with `tokens_of_owner` to fetch an
+         entire portfolio in two calls. Querying the ID of an NFT that does
+         not exist causes the call to revert.
+    @param _token_ids Array of NFT token IDs to query. The array is processed
+                      until the first zero value.
+    @return NFT owners
+            Addresses of synths within the NFTs
+            Balances of the synths
+            Max settlement times in seconds
+    """
+    owners: address[MAX_QUERY_SIZE] = empty(address[MAX_QUERY_SIZE])
+    synths: address[MAX_QUERY_SIZE] = empty(address[MAX_QUERY_SIZE])
+    balances: uint256[MAX_QUERY_SIZE] = empty(uint256[MAX_QUERY_SIZE])
+    times_to_settle: uint256[MAX_QUERY_SIZE] = empty(uint256[MAX_QUERY_SIZE])
+
+    swap: address = self.swap
+    for i in range(MAX_QUERY_SIZE):
+        if _token_ids[i] == 0:
+            break
+        info: TokenInfo = SynthSwap(swap).token_info(_token_ids[i])
+        owners[i] = info.owner
+        synths[i] = info.synth
+        balances[i] = info.underlying_balance
+        times_to_settle[i] = info.time_to_settle
+
+    return owners, synths, balances, times_to_settle
+
+
+@view
+@internal
+def _coin_index(_coins: address[8], _coin: address) -> int128:
+    # index of `_coin` within `_coins`, or -1 if it is not present
+    for i in range(8):
+        if _coins[i] == _coin:
+            return i
+    return -1
+
+
+@view
+@internal
+def _get_path(_from: address, _to: address) -> (address, address, RoutePath):
+    # resolve the synths, pools, coin indices and currency keys of a route
+    swap: address = self.swap
+    registry: address = AddressProvider(ADDRESS_PROVIDER).get_registry()
+    path: RoutePath = empty(RoutePath)
+
+    # synth currency keys are read from `SynthSwap`, as calls to `currencyKey`
+    # on a Synthetix proxy modify state and so revert within a view. a synth
+    # that is not in any added pool has no cached key and cannot be quoted.
+    initial_synth: address = SynthSwap(swap).swappable_synth(_from)
+    assert initial_synth != ZERO_ADDRESS  # dev: unknown coin
+    path.initial_pool = SynthSwap(swap).synth_pools(initial_synth)
+    if _from != initial_synth:
+        coins: address[8] = Registry(registry).get_coins(path.initial_pool)
+        path.initial_i = self._coin_index(coins, _from)
+        path.initial_j = self._coin_index(coins, initial_synth)
+        assert path.initial_i != -1  # dev: coin not in pool
+
+    final_synth: address = SynthSwap(swap).swappable_synth(_to)
+    assert final_synth != ZERO_ADDRESS  # dev: unknown coin
+    path.final_pool = SynthSwap(swap).synth_pools(final_synth)
+    if _to != final_synth:
+        coins: address[8] = Registry(registry).get_coins(path.final_pool)
+        path.final_i = self._coin_index(coins, final_synth)
+        path.final_j = self._coin_index(coins, _to)
+        assert path.final_j != -1  # dev: coin not in pool
+
+    path.initial_currency_key = SynthSwap(swap).currency_keys(initial_synth)
+    path.final_currency_key = SynthSwap(swap).currency_keys(final_synth)
+    path.exchanger = SNXAddressResolver(SNX_ADDRESS_RESOLVER).getAddress(EXCHANGER_KEY)
+
+    return initial_synth, final_synth, path
+
+
+@view
+@internal
+def _quote(_path: RoutePath, _amount: uint256) -> (uint256, uint256, uint256, uint256):
+    # quote each leg of a route, the curve legs are skipped when the
+    # input or output asset is the synth itself
+    initial_amount: uint256 = _amount
+    if _path.initial_i != _path.initial_j:
+        initial_amount = Curve(_path.initial_pool).get_dy(
+            _path.initial_i, _path.initial_j, _amount
+        )
+
+    final_amount: uint256 = 0
+    fee: uint256 = 0
+    rate: uint256 = 0
+    final_amount, fee, rate = Exchanger(_path.exchanger).getAmountsForExchange(
+        initial_amount, _path.initial_currency_key, _path.final_currency_key
+    )
+
+    amount: uint256 = final_amount
+    if _path.final_i != _path.final_j:
+        amount = Curve(_path.final_pool).get_dy(_path.final_i, _path.final_j, final_amount)
+
+    return initial_amount, final_amount, fee, amount
+
+
+@view
+@external
+def get_swap_route(_from: address, _to: address, _amount: uint256) -> SwapRoute:
+    """
+    @notice Quote every leg of a cross-asset swap between `_from` and `_to`
+    @dev Equivalent to `get_estimated_swap_amount`, but also returns the
+         intermediate amounts. Use `final_synth_amount` as `_expected` when
+         calling `swap_into_synth`, and `amount` as `_expected` when calling
+         `swap_from_synth` after settlement. When `_to` is the final synth
+         the second Curve leg is skipped, as the synth may be withdrawn.
+    @param _from Address of the initial asset being exchanged
+    @param _to Address of the asset to swap into
+    @param _amount Amount of `_from` being exchanged
+    @return Synth received from the first Curve exchange
+            Curve pool used for the first exchange
+            Amount of the initial synth received
+            Synth received from the Synthetix exchange
+            Curve pool used for the final exchange
+            Amount of the final synth received
+            Synthetix exchange fee, denominated in the final synth
+            Estimated amount of `_to` received
+    """
+    route: SwapRoute = empty(SwapRoute)
+    path: RoutePath = empty(RoutePath)
+    route.initial_synth, route.final_synth, path = self._get_path(_from, _to)
+    route.initial_pool = path.initial_pool
+    route.final_pool = path.final_pool
+
+    (
+        route.initial_synth_amount,
+        route.final_synth_amount,
+        route.exchange_fee,
+        route.amount,
+    ) = self._quote(path, _amount)
+
+    return route
+
+
+@view
+@external
+def get_swap_route_amounts(
+    _from: address,
+    _to: address,
+    _amounts: uint256[MAX_QUERY_SIZE]
+) -> (
+    uint256[MAX_QUERY_SIZE],
+    uint256[MAX_QUERY_SIZE],
+    uint256[MAX_QUERY_SIZE],
+    uint256[MAX_QUERY_SIZE],
+):
+    """
+    @notice Quote a cross-asset swap for many input amounts
+    @dev Used to plot a slippage curve. The route is resolved once and
+         then quoted for each amount, as in `get_swap_route`.
+    @param _from Address of the initial asset being exchanged
+    @param _to Address of the asset to swap into
+    @param _amounts Array of amounts of `_from` to quote. The array is
+                    processed until the first zero value.
+    @return Amounts of the initial synth received
+            Amounts of the final synth received
+            Synthetix exchange fees
+            Estimated amounts of `_to` received
+    """
+    initial_amounts: uint256[MAX_QUERY_SIZE] = empty(uint256[MAX_QUERY_SIZE])
+    final_amounts: uint256[MAX_QUERY_SIZE] = empty(uint256[MAX_QUERY_SIZE])
+    fees: uint256[MAX_QUERY_SIZE] = empty(uint256[MAX_QUERY_SIZE])
+    amounts: uint256[MAX_QUERY_SIZE] = empty(uint256[MAX_QUERY_SIZE])
+
+    initial_synth: address = ZERO_ADDRESS
+    final_synth: address = ZERO_ADDRESS
+    path: RoutePath = empty(RoutePath)
+    initial_synth, final_synth, path = self._get_path(_from, _to)
+
+    for i in range(MAX_QUERY_SIZE):
+        if _amounts[i] == 0:
+            break
+        initial_amounts[i], final_amounts[i], fees[i], amounts[i] = self._quote(
+            path, _amounts[i]
+        )
+
+    return initial_amounts, final_amounts, fees, amounts
+
+
+@view
+@external
+def get_best_route(
+    _from: address,
+    _to: address,
+    _amount: uint256,
+    _offset: uint256 = 0,
+    _limit: uint256 = MAX_SYNTHS
+) -> SwapRoute:
+    """
+    @notice Find the cross-asset swap route between `_from` and `_to` that
+            gives the greatest estimated output
+    @dev Every synth whose Curve pool contains `_from` is a candidate initial
+         synth, and every synth whose pool contains `_to` is a candidate final
+         synth. Routes where both synths are the same are not considered.
+         The final synth is selected by passing it to `swap_into_synth`. An
+         initial synth other than `swappable_synth(_from)` is selected by
+         swapping via `SynthSwapRouter.swap_into_synth_via`. Only the added
+         synths within the range given by `_offset` and `_limit` are
+         considered, when more than `MAX_SYNTHS` synths have been added the
+         range must be chosen by the caller. Synths that have not been added
+         cannot be quoted, as their currency keys are not cached.
+    @param _from Address of the initial asset being exchanged
+    @param _to Address of the asset to swap into
+    @param _amount Amount of `_from` being exchanged
+    @param _offset Number of added synths to skip
+    @param _limit Maximum number of added synths to consider, cannot exceed
+                  `MAX_SYNTHS`
+    @return Best route, in the same format as `get_swap_route`
+    """
+    swap: address = self.swap
+    registry: address = AddressProvider(ADDRESS_PROVIDER).get_registry()
+
+    # candidate initial and final synths, stored as parallel arrays
+    initial_synths: address[MAX_SYNTHS] = empty(address[MAX_SYNTHS])
+    initial_pools: address[MAX_SYNTHS] = empty(address[MAX_SYNTHS])
+    initial_indices: int128[MAX_SYNTHS][2] = empty(int128[MAX_SYNTHS][2])
+    initial_keys: bytes32[MAX_SYNTHS] = empty(bytes32[MAX_SYNTHS])
+    initial_count: uint256 = 0
+    final_synths: address[MAX_SYNTHS] = empty(address[MAX_SYNTHS])
+    final_pools: address[MAX_SYNTHS] = empty(address[MAX_SYNTHS])
+    final_indices: int128[MAX_SYNTHS][2] = empty(int128[MAX_SYNTHS][2])
+    final_keys: bytes32[MAX_SYNTHS] = empty(bytes32[MAX_SYNTHS])
+    final_count: uint256 = 0
+
+    for x in range(MAX_SYNTHS):
+        if x == _limit:
+            break
+        synth: address = SynthSwap(swap).synths(_offset + x + 1)
+        if synth == ZERO_ADDRESS:
+            break
+        pool: address = SynthSwap(swap).synth_pools(synth)
+        coins: address[8] = Registry(registry).get_coins(pool)
+        synth_index: int128 = self._coin_index(coins, synth)
+        i: int128 = self._coin_index(coins, _from)
+        j: int128 = self._coin_index(coins, _to)
+        if i == -1 and j == -1:
+            continue
+
+        currency_key: bytes32 = SynthSwap(swap).currency_keys(synth)
+        if i != -1:
+            initial_synths[initial_count] = synth
+            initial_pools[initial_count] = pool
+            initial_indices[0][initial_count] = i
+            initial_indices[1][initial_count] = synth_index
+            initial_keys[initial_count] = currency_key
+            initial_count += 1
+        if j != -1:
+            final_synths[final_count] = synth
+            final_pools[final_count] = pool
+            final_indices[0][final_count] = synth_index
+            final_indices[1][final_count] = j
+            final_keys[final_count] = currency_key
+            final_count += 1
+
+    path: RoutePath = empty(RoutePath)
+    path.exchanger = SNXAddressResolver(SNX_ADDRESS_RESOLVER).getAddress(EXCHANGER_KEY)
+
+    best: SwapRoute = empty(SwapRoute)
+    for x in range(MAX_SYNTHS):
+        if x == initial_count:
+            break
+        path.initial_pool = initial_pools[x]
+        path.initial_i = initial_indices[0][x]
+        path.initial_j = initial_indices[1][x]
+        path.initial_currency_key = initial_keys[x]
+
+        for y in range(MAX_SYNTHS):
+            if y == final_count:
+                break
+            if initial_synths[x] == final_synths[y]:
+                continue
+            path.final_pool = final_pools[y]
+            path.final_i = final_indices[0][y]
+            path.final_j = final_indices[1][y]
+            path.final_currency_key = final_keys[y]
+
+            route: SwapRoute = empty(SwapRoute)
+            (
+                route.initial_synth_amount,
+                route.final_synth_amount,
+                route.exchange_fee,
+                route.amount,
+            ) = self._quote(path, _amount)
+            if route.amount > best.amount:
+                route.initial_synth = initial_synths[x]
+                route.initial_pool = path.initial_pool
+                route.final_synth = final_synths[y]
+                route.final_pool = path.final_pool
+                best = route
+
+    assert best.initial_synth != ZERO_ADDRESS  # dev: no route
+    return best
@@ -0,0 +1,19 @@
+# @version 0.2.8
+"""
+@notice Mock Curve address provider for testing
+@dev Deployed bytecode is injected at the hardcoded `ADDRESS_PROVIDER`
+     address, so the contract has no constructor and setters are unguarded.
+"""
+
+get_address: public(HashMap[uint256, address])
+
+
+@view
+@external
+def get_registry() -> address:
+    return self.get_address[0]
+
+
+@external
+def set_address(_id: uint256, _addr: address):
+    self.get_address[_id] = _addr
@@ -0,0 +1,13 @@
+# @version 0.2.8
+"""
+@notice Mock Synthetix address resolver for testing
+@dev Deployed bytecode is injected at the hardcoded `SNX_ADDRESS_RESOLVER`
+     address, so the contract has no constructor and setters are unguarded.
+"""
+
+getAddress: public(HashMap[bytes32, address])
+
+
+@external
+def set_address(_name: bytes32, _addr: address):
+    self.getAddress[_name] = _addr
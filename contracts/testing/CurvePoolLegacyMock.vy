@@ -0,0 +1,153 @@
+# @version 0.2.8
+"""
+@notice Mock of the quote math within older Curve StableSwap pools
+@dev `get_D`, `get_y` and `get_dy` follow the compound, y, busd and sUSD
+     pools: a one is added to each balance when calculating D, and no
+     amount is deducted from `dy` to account for rounding. As in those pools,
+     `balances` takes an `int128` index. Balances are set directly with
+     `set_balances`, exchanges are not implemented.
+"""
+
+interface ERC20:
+    def decimals() -> uint256: view
+
+
+MAX_COINS: constant(int128) = 4
+FEE_DENOMINATOR: constant(uint256) = 10 ** 10
+PRECISION: constant(uint256) = 10 ** 18
+
+coins: public(address[MAX_COINS])
+stored_balances: uint256[MAX_COINS]
+A: public(uint256)
+fee: public(uint256)
+
+n_coins: int128
+rates: uint256[MAX_COINS]
+
+
+@external
+def __init__(_coins: address[MAX_COINS], _A: uint256, _fee: uint256):
+    """
+    @notice Contract constructor
+    @param _coins Addresses of the pool coins, unused slots set to ZERO_ADDRESS
+    @param _A Amplification coefficient
+    @param _fee Fee charged on exchanges, with 1e10 precision
+    """
+    for i in range(MAX_COINS):
+        coin: address = _coins[i]
+        if coin == ZERO_ADDRESS:
+            break
+        self.rates[i] = 10 ** (36 - ERC20(coin).decimals())
+        self.n_coins = i + 1
+
+    self.coins = _coins
+    self.A = _A
+    self.fee = _fee
+
+
+@external
+def set_balances(_balances: uint256[MAX_COINS]):
+    self.stored_balances = _balances
+
+
+@view
+@external
+def balances(i: int128) -> uint256:
+    return self.stored_balances[i]
+
+
+@view
+@internal
+def _xp() -> uint256[MAX_COINS]:
+    result: uint256[MAX_COINS] = self.rates
+    for i in range(MAX_COINS):
+        result[i] = result[i] * self.stored_balances[i] / PRECISION
+    return result
+
+
+@view
+@internal
+def get_D(xp: uint256[MAX_COINS], _n: int128) -> uint256:
+    n: uint256 = convert(_n, uint256)
+    S: uint256 = 0
+    for i in range(MAX_COINS):
+        if i == _n:
+            break
+        S += xp[i]
+    if S == 0:
+        return 0
+
+    Dprev: uint256 = 0
+    D: uint256 = S
+    Ann: uint256 = self.A * n
+    for _i in range(255):
+        D_P: uint256 = D
+        for i in range(MAX_COINS):
+            if i == _n:
+                break
+            D_P = D_P * D / (xp[i] * n + 1)  # +1 is to prevent /0
+        Dprev = D
+        D = (Ann * S + D_P * n) * D / ((Ann - 1) * D + (n + 1) * D_P)
+        # Equality with the precision of 1
+        if D > Dprev:
+            if D - Dprev <= 1:
+                break
+        else:
+            if Dprev - D <= 1:
+                break
+    return D
+
+
+@view
+@internal
+def get_y(i: int128, j: int128, x: uint256, _xp: uint256[MAX_COINS], _n: int128) -> uint256:
+    # x in the input is converted to the same price/precision
+    n: uint256 = convert(_n, uint256)
+    D: uint256 = self.get_D(_xp, _n)
+    c: uint256 = D
+    S_: uint256 = 0
+    Ann: uint256 = self.A * n
+
+    _x: uint256 = 0
+    for _i in range(MAX_COINS):
+        if _i == _n:
+            break
+        if _i == i:
+            _x = x
+        elif _i != j:
+            _x = _xp[_i]
+        else:
+            continue
+        S_ += _x
+        c = c * D / (_x * n)
+    c = c * D / (Ann * n)
+    b: uint256 = S_ + D / Ann  # - D
+    y_prev: uint256 = 0
+    y: uint256 = D
+    for _i in range(255):
+        y_prev = y
+        y = (y*y + c) / (2 * y + b - D)
+        # Equality with the precision of 1
+        if y > y_prev:
+            if y - y_prev <= 1:
+                break
+        else:
+            if y_prev - y <= 1:
+                break
+    return y
+
+
+@view
+@external
+def get_dy(i: int128, j: int128, dx: uint256) -> uint256:
+    # dx and dy in c-units
+    n: int128 = self.n_coins
+    assert i != j and i < n and j < n  # dev: invalid coin index
+    rates: uint256[MAX_COINS] = self.rates
+    xp: uint256[MAX_COINS] = self._xp()
+
+    x: uint256 = xp[i] + dx * rates[i] / PRECISION
+    y: uint256 = self.get_y(i, j, x, xp, n)
+    dy: uint256 = (xp[j] - y) * PRECISION / rates[j]
+    _fee: uint256 = self.fee * dy / FEE_DENOMINATOR
+    return dy - _fee
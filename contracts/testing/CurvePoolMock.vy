@@ -0,0 +1,231 @@
+# @version 0.2.8
+"""
+@notice Mock Curve StableSwap pool for testing
+@dev Implements the StableSwap invariant for up to four coins, without an
+     LP token or admin fees. Use `0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE`
+     as a coin address to represent Ether.
+"""
+
+interface ERC20:
+    def decimals() -> uint256: view
+
+
+event TokenExchange:
+    buyer: indexed(address)
+    sold_id: int128
+    tokens_sold: uint256
+    bought_id: int128
+    tokens_bought: uint256
+
+
+MAX_COINS: constant(int128) = 4
+ETH_ADDRESS: constant(address) = 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE
+FEE_DENOMINATOR: constant(uint256) = 10 ** 10
+PRECISION: constant(uint256) = 10 ** 18
+
+coins: public(address[MAX_COINS])
+balances: public(uint256[MAX_COINS])
+A: public(uint256)
+fee: public(uint256)
+
+n_coins: int128
+rates: uint256[MAX_COINS]
+
+
+@external
+def __init__(_coins: address[MAX_COINS], _A: uint256, _fee: uint256):
+    """
+    @notice Contract constructor
+    @param _coins Addresses of the pool coins, unused slots set to ZERO_ADDRESS
+    @param _A Amplification coefficient
+    @param _fee Fee charged on exchanges, with 1e10 precision
+    """
+    for i in range(MAX_COINS):
+        coin: address = _coins[i]
+        if coin == ZERO_ADDRESS:
+            break
+        decimals: uint256 = 18
+        if coin != ETH_ADDRESS:
+            decimals = ERC20(coin).decimals()
+        self.rates[i] = 10 ** (36 - decimals)
+        self.n_coins = i + 1
+
+    self.coins = _coins
+    self.A = _A
+    self.fee = _fee
+
+
+@view
+@internal
+def _xp(_balances: uint256[MAX_COINS]) -> uint256[MAX_COINS]:
+    result: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    for i in range(MAX_COINS):
+        result[i] = self.rates[i] * _balances[i] / PRECISION
+    return result
+
+
+@view
+@internal
+def _get_D(_xp: uint256[MAX_COINS], _amp: uint256, _n: int128) -> uint256:
+    n: uint256 = convert(_n, uint256)
+    S: uint256 = 0
+    for i in range(MAX_COINS):
+        if i == _n:
+            break
+        S += _xp[i]
+    if S == 0:
+        return 0
+
+    D: uint256 = S
+    Ann: uint256 = _amp * n
+    for _i in range(255):
+        D_P: uint256 = D
+        for i in range(MAX_COINS):
+            if i == _n:
+                break
+            D_P = D_P * D / (_xp[i] * n)
+        Dprev: uint256 = D
+        D = (Ann * S + D_P * n) * D / ((Ann - 1) * D + (n + 1) * D_P)
+        if D > Dprev:
+            if D - Dprev <= 1:
+                break
+        else:
+            if Dprev - D <= 1:
+                break
+    return D
+
+
+@view
+@internal
+def _get_y(i: int128, j: int128, x: uint256, _xp: uint256[MAX_COINS], _amp: uint256, _n: int128) -> uint256:
+    n: uint256 = convert(_n, uint256)
+    D: uint256 = self._get_D(_xp, _amp, _n)
+    Ann: uint256 = _amp * n
+    c: uint256 = D
+    S_: uint256 = 0
+
+    _x: uint256 = 0
+    for _i in range(MAX_COINS):
+        if _i == _n:
+            break
+        if _i == i:
+            _x = x
+        elif _i != j:
+            _x = _xp[_i]
+        else:
+            continue
+        S_ += _x
+        c = c * D / (_x * n)
+    c = c * D / (Ann * n)
+    b: uint256 = S_ + D / Ann
+
+    y: uint256 = D
+    for _i in range(255):
+        y_prev: uint256 = y
+        y = (y * y + c) / (2 * y + b - D)
+        if y > y_prev:
+            if y - y_prev <= 1:
+                break
+        else:
+            if y_prev - y <= 1:
+                break
+    return y
+
+
+@view
+@internal
+def _get_dy(i: int128, j: int128, dx: uint256) -> uint256:
+    n: int128 = self.n_coins
+    assert i != j and i < n and j < n  # dev: invalid coin index
+
+    xp: uint256[MAX_COINS] = self._xp(self.balances)
+    x: uint256 = xp[i] + dx * self.rates[i] / PRECISION
+    y: uint256 = self._get_y(i, j, x, xp, self.A, n)
+    dy: uint256 = (xp[j] - y - 1) * PRECISION / self.rates[j]
+
+    return dy - self.fee * dy / FEE_DENOMINATOR
+
+
+@view
+@external
+def get_dy(i: int128, j: int128, dx: uint256) -> uint256:
+    return self._get_dy(i, j, dx)
+
+
+@payable
+@external
+def exchange(i: int128, j: int128, dx: uint256, min_dy: uint256) -> uint256:
+    dy: uint256 = self._get_dy(i, j, dx)
+    assert dy >= min_dy, "Exchange resulted in fewer coins than expected"
+
+    self.balances[i] += dx
+    self.balances[j] -= dy
+
+    coin: address = self.coins[i]
+    if coin == ETH_ADDRESS:
+        assert msg.value == dx
+    else:
+        assert msg.value == 0
+        response: Bytes[32] = raw_call(
+            coin,
+            concat(
+                method_id("transferFrom(address,address,uint256)"),
+                convert(msg.sender, bytes32),
+                convert(self, bytes32),
+                convert(dx, bytes32),
+            ),
+            max_outsize=32,
+        )
+        if len(response) != 0:
+            assert convert(response, bool)
+
+    coin = self.coins[j]
+    if coin == ETH_ADDRESS:
+        raw_call(msg.sender, b"", value=dy)
+    else:
+        response: Bytes[32] = raw_call(
+            coin,
+            concat(
+                method_id("transfer(address,uint256)"),
+                convert(msg.sender, bytes32),
+                convert(dy, bytes32),
+            ),
+            max_outsize=32,
+        )
+        if len(response) != 0:
+            assert convert(response, bool)
+
+    log TokenExchange(msg.sender, i, dx, j, dy)
+
+    return dy
+
+
+@payable
+@external
+def add_liquidity(_amounts: uint256[MAX_COINS]):
+    """
+    @notice Deposit coins into the pool
+    @dev No LP token is minted, deposited liquidity is locked in the pool
+    @param _amounts List of amounts of coins to deposit
+    """
+    for i in range(MAX_COINS):
+        amount: uint256 = _amounts[i]
+        if amount == 0:
+            continue
+        coin: address = self.coins[i]
+        if coin == ETH_ADDRESS:
+            assert msg.value == amount
+        else:
+            response: Bytes[32] = raw_call(
+                coin,
+                concat(
+                    method_id("transferFrom(address,address,uint256)"),
+                    convert(msg.sender, bytes32),
+                    convert(self, bytes32),
+                    convert(amount, bytes32),
+                ),
+                max_outsize=32,
+            )
+            if len(response) != 0:
+                assert convert(response, bool)
+        self.balances[i] += amount
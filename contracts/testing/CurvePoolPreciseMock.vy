@@ -0,0 +1,175 @@
+# @version 0.2.8
+"""
+@notice Mock of the quote math within Curve StableSwap pools using `A_PRECISION`
+@dev `get_D`, `get_y` and `get_dy` follow the sETH and sEUR pools and the pool
+     templates: `A` is stored multiplied by `A_PRECISION`, and the fee is
+     charged before `dy` is converted from 18 decimals. Balances are set
+     directly with `set_balances`, exchanges are not implemented.
+"""
+
+interface ERC20:
+    def decimals() -> uint256: view
+
+
+MAX_COINS: constant(int128) = 4
+ETH_ADDRESS: constant(address) = 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE
+FEE_DENOMINATOR: constant(uint256) = 10 ** 10
+PRECISION: constant(uint256) = 10 ** 18
+A_PRECISION: constant(uint256) = 100
+
+coins: public(address[MAX_COINS])
+balances: public(uint256[MAX_COINS])
+fee: public(uint256)
+
+n_coins: int128
+rates: uint256[MAX_COINS]
+amp: uint256
+
+
+@external
+def __init__(_coins: address[MAX_COINS], _A: uint256, _fee: uint256):
+    """
+    @notice Contract constructor
+    @param _coins Addresses of the pool coins, unused slots set to ZERO_ADDRESS
+    @param _A Amplification coefficient, without `A_PRECISION`
+    @param _fee Fee charged on exchanges, with 1e10 precision
+    """
+    for i in range(MAX_COINS):
+        coin: address = _coins[i]
+        if coin == ZERO_ADDRESS:
+            break
+        decimals: uint256 = 18
+        if coin != ETH_ADDRESS:
+            decimals = ERC20(coin).decimals()
+        self.rates[i] = 10 ** (36 - decimals)
+        self.n_coins = i + 1
+
+    self.coins = _coins
+    self.amp = _A * A_PRECISION
+    self.fee = _fee
+
+
+@external
+def set_balances(_balances: uint256[MAX_COINS]):
+    self.balances = _balances
+
+
+@view
+@external
+def A() -> uint256:
+    return self.amp / A_PRECISION
+
+
+@view
+@external
+def A_precise() -> uint256:
+    return self.amp
+
+
+@view
+@internal
+def _xp() -> uint256[MAX_COINS]:
+    result: uint256[MAX_COINS] = self.rates
+    for i in range(MAX_COINS):
+        result[i] = result[i] * self.balances[i] / PRECISION
+    return result
+
+
+@pure
+@internal
+def get_D(xp: uint256[MAX_COINS], amp: uint256, _n: int128) -> uint256:
+    n: uint256 = convert(_n, uint256)
+    S: uint256 = 0
+    Dprev: uint256 = 0
+
+    for i in range(MAX_COINS):
+        if i == _n:
+            break
+        S += xp[i]
+    if S == 0:
+        return 0
+
+    D: uint256 = S
+    Ann: uint256 = amp * n
+    for _i in range(255):
+        D_P: uint256 = D
+        for i in range(MAX_COINS):
+            if i == _n:
+                break
+            D_P = D_P * D / (xp[i] * n)  # If division by 0, this will be borked: only withdrawal will work. And that is good
+        Dprev = D
+        D = (Ann * S / A_PRECISION + D_P * n) * D / ((Ann - A_PRECISION) * D / A_PRECISION + (n + 1) * D_P)
+        # Equality with the precision of 1
+        if D > Dprev:
+            if D - Dprev <= 1:
+                return D
+        else:
+            if Dprev - D <= 1:
+                return D
+    # convergence typically occurs in 4 rounds or less, this should be unreachable!
+    # if it does happen the pool is borked and LPs can withdraw via `remove_liquidity`
+    raise
+
+
+@view
+@internal
+def get_y(i: int128, j: int128, x: uint256, xp: uint256[MAX_COINS], _n: int128) -> uint256:
+    """
+    Calculate x[j] if one makes x[i] = x
+
+    Done by solving quadratic equation iteratively.
+    x_1**2 + x_1 * (sum' - (A*n**n - 1) * D / (A * n**n)) = D ** (n + 1) / (n ** (2 * n) * prod' * A)
+    x_1**2 + b*x_1 = c
+
+    x_1 = (x_1**2 + c) / (2*x_1 + b)
+    """
+    # x in the input is converted to the same price/precision
+    n: uint256 = convert(_n, uint256)
+    amp: uint256 = self.amp
+    D: uint256 = self.get_D(xp, amp, _n)
+    Ann: uint256 = amp * n
+    c: uint256 = D
+    S_: uint256 = 0
+    _x: uint256 = 0
+    y_prev: uint256 = 0
+
+    for _i in range(MAX_COINS):
+        if _i == _n:
+            break
+        if _i == i:
+            _x = x
+        elif _i != j:
+            _x = xp[_i]
+        else:
+            continue
+        S_ += _x
+        c = c * D / (_x * n)
+    c = c * D * A_PRECISION / (Ann * n)
+    b: uint256 = S_ + D * A_PRECISION / Ann  # - D
+    y: uint256 = D
+    for _i in range(255):
+        y_prev = y
+        y = (y*y + c) / (2 * y + b - D)
+        # Equality with the precision of 1
+        if y > y_prev:
+            if y - y_prev <= 1:
+                return y
+        else:
+            if y_prev - y <= 1:
+                return y
+    raise
+
+
+@view
+@external
+def get_dy(i: int128, j: int128, dx: uint256) -> uint256:
+    n: int128 = self.n_coins
+    assert i != j and i < n and j < n  # dev: invalid coin index
+    xp: uint256[MAX_COINS] = self._xp()
+    rates: uint256[MAX_COINS] = self.rates
+
+    x: uint256 = xp[i] + (dx * rates[i] / PRECISION)
+    y: uint256 = self.get_y(i, j, x, xp, n)
+    dy: uint256 = xp[j] - y - 1
+    fee: uint256 = self.fee * dy / FEE_DENOMINATOR
+    return (dy - fee) * PRECISION / rates[j]
@@ -0,0 +1,118 @@
+# @version 0.3.10
+"""
+@notice Mock ERC20 with DAI-style `permit` for testing
+@dev Uses a newer Vyper version than the other contracts, because the
+     `v` argument of `permit` must be declared as uint8 to match the ABI.
+"""
+
+event Transfer:
+    _from: indexed(address)
+    _to: indexed(address)
+    _value: uint256
+
+event Approval:
+    _owner: indexed(address)
+    _spender: indexed(address)
+    _value: uint256
+
+
+EIP712_TYPEHASH: constant(bytes32) = keccak256("EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+PERMIT_TYPEHASH: constant(bytes32) = keccak256("Permit(address holder,address spender,uint256 nonce,uint256 expiry,bool allowed)")
+VERSION: constant(String[1]) = "1"
+
+name: public(String[64])
+symbol: public(String[32])
+decimals: public(uint256)
+balanceOf: public(HashMap[address, uint256])
+allowance: public(HashMap[address, HashMap[address, uint256]])
+totalSupply: public(uint256)
+
+DOMAIN_SEPARATOR: public(bytes32)
+nonces: public(HashMap[address, uint256])
+
+
+@external
+def __init__(_name: String[64], _symbol: String[32], _decimals: uint256):
+    self.name = _name
+    self.symbol = _symbol
+    self.decimals = _decimals
+    self.DOMAIN_SEPARATOR = keccak256(
+        concat(
+            EIP712_TYPEHASH,
+            keccak256(_name),
+            keccak256(VERSION),
+            convert(chain.id, bytes32),
+            convert(self, bytes32),
+        )
+    )
+
+
+@external
+def transfer(_to: address, _value: uint256) -> bool:
+    self.balanceOf[msg.sender] -= _value
+    self.balanceOf[_to] += _value
+    log Transfer(msg.sender, _to, _value)
+    return True
+
+
+@external
+def transferFrom(_from: address, _to: address, _value: uint256) -> bool:
+    self.balanceOf[_from] -= _value
+    self.balanceOf[_to] += _value
+    self.allowance[_from][msg.sender] -= _value
+    log Transfer(_from, _to, _value)
+    return True
+
+
+@external
+def approve(_spender: address, _value: uint256) -> bool:
+    self.allowance[msg.sender][_spender] = _value
+    log Approval(msg.sender, _spender, _value)
+    return True
+
+
+@external
+def _mint_for_testing(_target: address, _value: uint256):
+    self.totalSupply += _value
+    self.balanceOf[_target] += _value
+    log Transfer(empty(address), _target, _value)
+
+
+@external
+def permit(
+    _holder: address,
+    _spender: address,
+    _nonce: uint256,
+    _expiry: uint256,
+    _allowed: bool,
+    _v: uint8,
+    _r: bytes32,
+    _s: bytes32,
+):
+    assert _expiry == 0 or block.timestamp <= _expiry, "Permit expired"
+    assert _nonce == self.nonces[_holder], "Invalid nonce"
+
+    digest: bytes32 = keccak256(
+        concat(
+            b"\x19\x01",
+            self.DOMAIN_SEPARATOR,
+            keccak256(
+                concat(
+                    PERMIT_TYPEHASH,
+                    convert(_holder, bytes32),
+                    convert(_spender, bytes32),
+                    convert(_nonce, bytes32),
+                    convert(_expiry, bytes32),
+                    convert(_allowed, bytes32),
+                )
+            ),
+        )
+    )
+    assert ecrecover(digest, _v, _r, _s) == _holder, "Invalid signature"
+
+    self.nonces[_holder] = _nonce + 1
+    value: uint256 = 0
+    if _allowed:
+        value = max_value(uint256)
+    self.allowance[_holder][_spender] = value
+    log Approval(_holder, _spender, value)
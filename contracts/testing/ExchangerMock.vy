@@ -0,0 +1,151 @@
+# @version 0.2.8
+"""
+@notice Mock Synthetix exchanger for testing
+@dev Converts between synths at fixed USD rates, charging a flat fee. The
+     destination synth of each exchange is subject to a waiting period
+     before it may be settled. Also acts as the `ExchangeRates` contract.
+"""
+
+interface Synth:
+    def currencyKey() -> bytes32: view
+    def issue(_target: address, _value: uint256): nonpayable
+    def burn(_target: address, _value: uint256): nonpayable
+
+
+SNX: constant(address) = 0xC011a73ee8576Fb46F5E1c5751cA3B9Fe0af2a6F
+PRECISION: constant(uint256) = 10 ** 18
+
+# currency key -> synth
+synths: public(HashMap[bytes32, address])
+# currency key -> USD rate
+rates: public(HashMap[bytes32, uint256])
+# account -> currency key -> timestamp of last exchange into the synth
+last_exchange: public(HashMap[address, HashMap[bytes32, uint256]])
+
+fee_rate: public(uint256)
+waiting_period: public(uint256)
+
+
+@external
+def __init__(_fee_rate: uint256, _waiting_period: uint256):
+    """
+    @notice Contract constructor
+    @param _fee_rate Fee charged on exchanges, with 1e18 precision
+    @param _waiting_period Seconds before an exchanged synth may be settled
+    """
+    self.fee_rate = _fee_rate
+    self.waiting_period = _waiting_period
+
+
+@external
+def add_synth(_synth: address, _rate: uint256):
+    """
+    @notice Register a synth and set its USD rate
+    @param _synth Address of the synth
+    @param _rate USD rate of the synth, with 1e18 precision
+    """
+    key: bytes32 = Synth(_synth).currencyKey()
+    self.synths[key] = _synth
+    self.rates[key] = _rate
+
+
+@view
+@internal
+def _round(_value_times_ten: uint256) -> uint256:
+    # round half up, as `SafeDecimalMath` does for `multiplyDecimalRound`
+    # and `divideDecimalRound`
+    if _value_times_ten % 10 >= 5:
+        return (_value_times_ten + 10) / 10
+    return _value_times_ten / 10
+
+
+@view
+@internal
+def _get_amounts(_amount: uint256, _source_key: bytes32, _dest_key: bytes32) -> (uint256, uint256, uint256):
+    source_rate: uint256 = self.rates[_source_key]
+    dest_rate: uint256 = self.rates[_dest_key]
+    assert source_rate != 0 and dest_rate != 0  # dev: unknown synth
+
+    # mirrors `Exchanger.getAmountsForExchange` in Synthetix
+    amount: uint256 = self._round(_amount * source_rate / (PRECISION / 10))
+    amount = self._round(amount * (PRECISION * 10) / dest_rate)
+    received: uint256 = amount * (PRECISION - self.fee_rate) / PRECISION
+
+    return received, amount - received, self.fee_rate
+
+
+@view
+@external
+def rateForCurrency(currencyKey: bytes32) -> uint256:
+    return self.rates[currencyKey]
+
+
+@view
+@external
+def feeRateForExchange(sourceCurrencyKey: bytes32, destinationCurrencyKey: bytes32) -> uint256:
+    return self.fee_rate
+
+
+@view
+@external
+def getAmountsForExchange(
+    sourceAmount: uint256,
+    sourceCurrencyKey: bytes32,
+    destinationCurrencyKey: bytes32
+) -> (uint256, uint256, uint256):
+    return self._get_amounts(sourceAmount, sourceCurrencyKey, destinationCurrencyKey)
+
+
+@view
+@internal
+def _max_secs_left(_account: address, _currency_key: bytes32) -> uint256:
+    settle_time: uint256 = self.last_exchange[_account][_currency_key] + self.waiting_period
+    if settle_time > block.timestamp:
+        return settle_time - block.timestamp
+    return 0
+
+
+@view
+@external
+def waitingPeriodSecs() -> uint256:
+    return self.waiting_period
+
+
+@view
+@external
+def maxSecsLeftInWaitingPeriod(account: address, currencyKey: bytes32) -> uint256:
+    return self._max_secs_left(account, currencyKey)
+
+
+@view
+@external
+def settlementOwing(account: address, currencyKey: bytes32) -> (uint256, uint256):
+    return 0, 0
+
+
+@external
+def settle(user: address, currencyKey: bytes32):
+    assert self._max_secs_left(user, currencyKey) == 0, "Cannot settle during waiting period"
+
+
+@external
+def exchange(
+    _from: address,
+    _source_key: bytes32,
+    _amount: uint256,
+    _dest_key: bytes32
+) -> uint256:
+    """
+    @notice Convert `_amount` of the source synth held by `_from`
+    @dev Only callable via `SynthetixMock`
+    """
+    assert msg.sender == SNX
+    assert _source_key != _dest_key, "Can't be same synth"
+    assert self._max_secs_left(_from, _source_key) == 0, "Cannot settle during waiting period"
+
+    received: uint256 = self._get_amounts(_amount, _source_key, _dest_key)[0]
+    Synth(self.synths[_source_key]).burn(_from, _amount)
+    Synth(self.synths[_dest_key]).issue(_from, received)
+    self.last_exchange[_from][_dest_key] = block.timestamp
+
+    return received
@@ -0,0 +1,40 @@
+# @version 0.2.8
+"""
+@notice Mock NFT owner that transfers an NFT when it receives Ether
+@dev Used to test reentrancy from the receiver of a swap into Ether. Calls
+     to `SynthSwap` are made via `execute`, so that this contract is both
+     the caller and the receiver.
+"""
+
+interface SynthSwap:
+    def transferFrom(_from: address, _to: address, _token_id: uint256): nonpayable
+
+
+swap: public(address)
+token_id: public(uint256)
+transfer_to: public(address)
+
+
+@external
+def __init__(_swap: address):
+    self.swap = _swap
+
+
+@external
+def execute(_data: Bytes[2048], _token_id: uint256, _transfer_to: address):
+    """
+    @notice Call `SynthSwap` with `_data`
+    @param _data Calldata for the call to `SynthSwap`
+    @param _token_id NFT to transfer when Ether is received
+    @param _transfer_to Address to transfer the NFT to
+    """
+    self.token_id = _token_id
+    self.transfer_to = _transfer_to
+    raw_call(self.swap, _data)
+
+
+@payable
+@external
+def __default__():
+    if self.transfer_to != ZERO_ADDRESS:
+        SynthSwap(self.swap).transferFrom(self, self.transfer_to, self.token_id)
@@ -0,0 +1,41 @@
+# @version 0.2.8
+"""
+@notice Mock Curve pool registry for testing
+"""
+
+interface CurvePool:
+    def coins(i: uint256) -> address: view
+
+
+MAX_COINS: constant(int128) = 4
+
+pool_coins: HashMap[address, address[8]]
+
+
+@external
+def add_pool(_pool: address):
+    coins: address[8] = empty(address[8])
+    for i in range(MAX_COINS):
+        coins[i] = CurvePool(_pool).coins(convert(i, uint256))
+    self.pool_coins[_pool] = coins
+
+
+@view
+@external
+def get_coins(_pool: address) -> address[8]:
+    return self.pool_coins[_pool]
+
+
+@view
+@external
+def get_coin_indices(_pool: address, _from: address, _to: address) -> (int128, int128):
+    i: int128 = -1
+    j: int128 = -1
+    for x in range(MAX_COINS):
+        coin: address = self.pool_coins[_pool][x]
+        if coin == _from:
+            i = x
+        elif coin == _to:
+            j = x
+    assert i != -1 and j != -1  # dev: no such pool or coins
+    return i, j
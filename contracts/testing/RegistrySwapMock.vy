@@ -0,0 +1,86 @@
+# @version 0.2.8
+"""
+@notice Mock Curve registry exchange contract for testing
+"""
+
+interface AddressProvider:
+    def get_registry() -> address: view
+
+interface Registry:
+    def get_coin_indices(_pool: address, _from: address, _to: address) -> (int128, int128): view
+
+interface CurvePool:
+    def exchange(i: int128, j: int128, dx: uint256, min_dy: uint256) -> uint256: payable
+
+
+ADDRESS_PROVIDER: constant(address) = 0x0000000022D53366457F9d5E68Ec105046FC4383
+ETH_ADDRESS: constant(address) = 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE
+
+
+@internal
+def _call_token(_token: address, _data: Bytes[100]):
+    response: Bytes[32] = raw_call(_token, _data, max_outsize=32)
+    if len(response) != 0:
+        assert convert(response, bool)
+
+
+@payable
+@external
+def exchange(
+    _pool: address,
+    _from: address,
+    _to: address,
+    _amount: uint256,
+    _expected: uint256,
+    _receiver: address = msg.sender,
+) -> uint256:
+    registry: address = AddressProvider(ADDRESS_PROVIDER).get_registry()
+    i: int128 = 0
+    j: int128 = 0
+    i, j = Registry(registry).get_coin_indices(_pool, _from, _to)
+
+    eth_amount: uint256 = 0
+    if _from == ETH_ADDRESS:
+        assert msg.value == _amount
+        eth_amount = _amount
+    else:
+        assert msg.value == 0
+        self._call_token(
+            _from,
+            concat(
+                method_id("transferFrom(address,address,uint256)"),
+                convert(msg.sender, bytes32),
+                convert(self, bytes32),
+                convert(_amount, bytes32),
+            )
+        )
+        self._call_token(
+            _from,
+            concat(
+                method_id("approve(address,uint256)"),
+                convert(_pool, bytes32),
+                convert(_amount, bytes32),
+            )
+        )
+
+    received: uint256 = CurvePool(_pool).exchange(i, j, _amount, _expected, value=eth_amount)
+
+    if _to == ETH_ADDRESS:
+        raw_call(_receiver, b"", value=received)
+    else:
+        self._call_token(
+            _to,
+            concat(
+                method_id("transfer(address,uint256)"),
+                convert(_receiver, bytes32),
+                convert(received, bytes32),
+            )
+        )
+
+    return received
+
+
+@payable
+@external
+def __default__():
+    pass
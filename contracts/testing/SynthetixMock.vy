@@ -0,0 +1,43 @@
+# @version 0.2.8
+"""
+@notice Mock Synthetix for testing
+@dev Deployed bytecode is injected at the hardcoded `SNX` address. Exchanges
+     and settlements are forwarded to the exchanger set in the address resolver.
+"""
+
+interface AddressResolver:
+    def getAddress(name: bytes32) -> address: view
+
+interface Exchanger:
+    def exchange(
+        _from: address,
+        _source_key: bytes32,
+        _amount: uint256,
+        _dest_key: bytes32
+    ) -> uint256: nonpayable
+    def settle(user: address, currencyKey: bytes32): nonpayable
+
+
+SNX_ADDRESS_RESOLVER: constant(address) = 0x4E3b31eB0E5CB73641EE1E65E7dCEFe520bA3ef2
+EXCHANGER_KEY: constant(bytes32) = 0x45786368616e6765720000000000000000000000000000000000000000000000
+
+
+@external
+def exchangeWithTracking(
+    sourceCurrencyKey: bytes32,
+    sourceAmount: uint256,
+    destinationCurrencyKey: bytes32,
+    originator: address,
+    trackingCode: bytes32,
+) -> uint256:
+    exchanger: address = AddressResolver(SNX_ADDRESS_RESOLVER).getAddress(EXCHANGER_KEY)
+    return Exchanger(exchanger).exchange(
+        msg.sender, sourceCurrencyKey, sourceAmount, destinationCurrencyKey
+    )
+
+
+@external
+def settle(currencyKey: bytes32) -> uint256[3]:
+    exchanger: address = AddressResolver(SNX_ADDRESS_RESOLVER).getAddress(EXCHANGER_KEY)
+    Exchanger(exchanger).settle(msg.sender, currencyKey)
+    return empty(uint256[3])
@@ -0,0 +1,13 @@
+"""
+Off-chain event indexer for `SynthSwap`.
+
+An `EventIndexer` consumes `Transfer`, `TokenUpdate`, `BalanceTransfer` and
+`NewSettler` events incrementally and materializes the owner, synth and balance
+of every NFT and the list of available settlers into an SQLite `Store`. The functions within
+`indexer.settlement` predict when each token may be settled from the indexed
+state, without querying every token on-chain.
+"""
+
+from indexer.indexer import EventIndexer  # noqa: F401
+from indexer.settlement import get_waiting_period, settle_ready_at, tokens_due  # noqa
+from indexer.store import Store, TokenState  # noqa: F401
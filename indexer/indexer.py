@@ -0,0 +1,136 @@
+"""
+Incremental indexing of `SynthSwap` events.
+"""
+
+from brownie import ZERO_ADDRESS, web3
+from brownie.convert import to_address
+from eth_utils import to_hex
+
+from indexer.store import Store
+
+EVENTS = ("Transfer", "TokenUpdate", "BalanceTransfer", "NewSettler")
+
+# number of blocks to query logs for in a single request
+DEFAULT_BATCH_SIZE = 10_000
+
+# blocks behind the chain head that are not indexed, to avoid reorgs
+DEFAULT_CONFIRMATIONS = 5
+
+
+class EventIndexer:
+    """
+    Materialize the state of `SynthSwap` NFTs and settlers from events.
+
+    Events are applied in batches of blocks. Each batch is committed together
+    with the checkpoint of the last block within it, so an indexer that is
+    restarted continues from where it stopped instead of replaying all logs.
+
+    Arguments
+    ---------
+    swap : Contract
+        `SynthSwap` deployment
+    path : str
+        Path to the SQLite database file
+    start_block : int, optional
+        Block to begin indexing from when the database is empty, should be set
+        to the block that `swap` was deployed in
+    confirmations : int, optional
+        Number of most recent blocks that are not indexed
+    batch_size : int, optional
+        Maximum number of blocks to query logs for in a single request
+    """
+
+    def __init__(
+        self,
+        swap,
+        path,
+        start_block=0,
+        confirmations=DEFAULT_CONFIRMATIONS,
+        batch_size=DEFAULT_BATCH_SIZE,
+    ):
+        self.address = to_address(swap.address)
+        self.store = Store(path, self.address)
+        self.start_block = start_block
+        self.confirmations = confirmations
+        self.batch_size = batch_size
+
+        contract = web3.eth.contract(address=self.address, abi=swap.abi)
+        self._events = {swap.topics[i].lower(): contract.events[i]() for i in EVENTS}
+
+    def sync(self, to_block=None):
+        """
+        Index all events up to `to_block`.
+
+        Arguments
+        ---------
+        to_block : int, optional
+            Last block to index, defaults to the most recent confirmed block
+
+        Returns
+        -------
+        int
+            Number of events applied
+        """
+        if to_block is None:
+            to_block = web3.eth.block_number - self.confirmations
+
+        checkpoint = self.store.checkpoint
+        from_block = self.start_block if checkpoint is None else checkpoint + 1
+
+        count = 0
+        while from_block <= to_block:
+            end_block = min(from_block + self.batch_size - 1, to_block)
+            logs = web3.eth.get_logs(
+                {
+                    "address": self.address,
+                    "fromBlock": from_block,
+                    "toBlock": end_block,
+                    "topics": [list(self._events)],
+                }
+            )
+            logs = sorted(logs, key=lambda k: (k["blockNumber"], k["logIndex"]))
+
+            # applying the batch and updating the checkpoint is atomic
+            timestamps = {}
+            transfers = set()
+            with self.store.connection:
+                for log in logs:
+                    self._apply(log, timestamps, transfers)
+                self.store.set_checkpoint(end_block)
+
+            count += len(logs)
+            from_block = end_block + 1
+
+        return count
+
+    def _apply(self, log, timestamps, transfers):
+        event = self._events[to_hex(log["topics"][0])].process_log(log)
+        args = event["args"]
+        block = event["blockNumber"]
+
+        if event["event"] == "NewSettler":
+            self.store.add_settler(args["addr"], block)
+        elif event["event"] == "BalanceTransfer":
+            # `merge` and `split` move settled balances, this is followed by
+            # an update of the receiving token within the same transaction
+            transfers.add(args["receiver_id"])
+        elif event["event"] == "TokenUpdate":
+            # the timestamp is required to predict when a new conversion may be
+            # settled, it is queried once per block containing an update
+            if block not in timestamps:
+                timestamps[block] = web3.eth.get_block(block)["timestamp"]
+            self.store.update(
+                args["token_id"],
+                args["synth"],
+                args["underlying_balance"],
+                block,
+                timestamps[block],
+                is_transfer=args["token_id"] in transfers,
+            )
+            transfers.discard(args["token_id"])
+        elif args["sender"] == ZERO_ADDRESS:
+            self.store.mint(args["token_id"], args["receiver"], block)
+        elif args["receiver"] == ZERO_ADDRESS:
+            self.store.burn(args["token_id"])
+        else:
+            self.store.transfer(args["token_id"], args["receiver"])
@@ -0,0 +1,63 @@
+"""
+Local prediction of when the synths held in `SynthSwap` NFTs may be settled.
+"""
+
+from brownie import Contract
+
+# hardcoded addresses used within `SynthSwap`
+SNX_ADDRESS_RESOLVER = "0x4E3b31eB0E5CB73641EE1E65E7dCEFe520bA3ef2"
+EXCHANGER_KEY = "0x45786368616e6765720000000000000000000000000000000000000000000000"
+
+
+def _view(name, inputs, outputs):
+    return {
+        "name": name,
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": f"arg{i}", "type": t} for i, t in enumerate(inputs)],
+        "outputs": [{"name": "", "type": t} for t in outputs],
+    }
+
+
+RESOLVER_ABI = [_view("getAddress", ["bytes32"], ["address"])]
+EXCHANGER_ABI = [_view("waitingPeriodSecs", [], ["uint256"])]
+
+
+def get_waiting_period(block_identifier=None):
+    """Query the current Synthetix waiting period, in seconds."""
+    resolver = Contract.from_abi("AddressResolver", SNX_ADDRESS_RESOLVER, RESOLVER_ABI)
+    exchanger = Contract.from_abi(
+        "Exchanger",
+        resolver.getAddress(EXCHANGER_KEY, block_identifier=block_identifier),
+        EXCHANGER_ABI,
+    )
+    return exchanger.waitingPeriodSecs(block_identifier=block_identifier)
+
+
+def settle_ready_at(token, waiting_period):
+    """
+    Timestamp at which the synth within `token` may be settled, or zero if it
+    is already settled. Mirrors `SynthSwap.settle_ready_at`.
+
+    Arguments
+    ---------
+    token : TokenState
+        Indexed state of the token
+    waiting_period : int
+        Synthetix waiting period, in seconds
+    """
+    if token.settled:
+        return 0
+    return token.converted_at + waiting_period
+
+
+def tokens_due(store, waiting_period, timestamp):
+    """
+    Indexed tokens that are not yet settled, and whose waiting period has
+    ended at `timestamp`.
+    """
+    return [
+        i
+        for i in store.unsettled_tokens()
+        if settle_ready_at(i, waiting_period) <= timestamp
+    ]
@@ -0,0 +1,224 @@
+"""
+SQLite store holding the state of `SynthSwap` NFTs and settlers.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoint (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    address TEXT NOT NULL,
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    token_id TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    synth TEXT,
+    balance TEXT NOT NULL,
+    settled INTEGER NOT NULL,
+    updated_block INTEGER NOT NULL,
+    converted_at INTEGER
+);
+CREATE INDEX IF NOT EXISTS tokens_owner ON tokens (owner);
+CREATE TABLE IF NOT EXISTS settlers (
+    address TEXT PRIMARY KEY,
+    deployed_block INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS available_token_ids (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    token_id TEXT UNIQUE NOT NULL
+);
+"""
+
+
+def _key(token_id):
+    # token IDs and balances exceed the range of an SQLite integer, so they are
+    # stored as fixed width hex strings which also preserves their ordering
+    return f"{token_id:064x}"
+
+
+@dataclass(frozen=True)
+class TokenState:
+    """State of a single `SynthSwap` NFT."""
+
+    token_id: int
+    owner: str
+    synth: Optional[str]
+    balance: int
+    # `True` once the synth has been settled by a swap or withdrawal. Calls to
+    # `settle` do not emit an event and are only reflected once recorded with
+    # `Store.mark_settled`.
+    settled: bool
+    updated_block: int
+    # timestamp of the most recent synth conversion into the token
+    converted_at: Optional[int]
+
+    @classmethod
+    def from_row(cls, row):
+        token_id, owner, synth, balance, settled, updated_block, converted_at = row
+        return cls(
+            token_id=int(token_id, 16),
+            owner=owner,
+            synth=synth,
+            balance=int(balance, 16),
+            settled=bool(settled),
+            updated_block=updated_block,
+            converted_at=converted_at,
+        )
+
+
+class Store:
+    """
+    Materialized `SynthSwap` state, stored in an SQLite database.
+
+    Arguments
+    ---------
+    path : str
+        Path to the database file, or ":memory:" for a temporary store
+    address : str
+        Address of the `SynthSwap` deployment that the store is built from
+    """
+
+    def __init__(self, path, address):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self.address = address
+
+        row = self.connection.execute("SELECT address FROM checkpoint").fetchone()
+        if row is not None and row[0] != address:
+            raise ValueError(f"Store at {path} was built from {row[0]}, not {address}")
+
+    def close(self):
+        self.connection.close()
+
+    @property
+    def checkpoint(self):
+        """Last block that has been fully indexed, or `None` if nothing is indexed."""
+        row = self.connection.execute("SELECT block_number FROM checkpoint").fetchone()
+        return None if row is None else row[0]
+
+    def set_checkpoint(self, block_number):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO checkpoint VALUES (0, ?, ?)",
+            (self.address, block_number),
+        )
+
+    # event handlers, these are called within a single transaction per batch of blocks
+
+    def add_settler(self, settler, block_number):
+        self.connection.execute(
+            "INSERT INTO settlers VALUES (?, ?)", (settler, block_number)
+        )
+        self._push_token_id(int(settler, 16))
+
+    def mint(self, token_id, owner, block_number):
+        self.connection.execute(
+            "INSERT INTO tokens VALUES (?, ?, NULL, ?, 0, ?, NULL)",
+            (_key(token_id), owner, _key(0), block_number),
+        )
+        self.connection.execute(
+            "DELETE FROM available_token_ids WHERE token_id = ?", (_key(token_id),)
+        )
+
+    def burn(self, token_id):
+        self.connection.execute(
+            "DELETE FROM tokens WHERE token_id = ?", (_key(token_id),)
+        )
+        # the nonce is incremented each time a settler is re-used
+        self._push_token_id(token_id + 2 ** 160)
+
+    def transfer(self, token_id, owner):
+        self.connection.execute(
+            "UPDATE tokens SET owner = ? WHERE token_id = ?", (owner, _key(token_id))
+        )
+
+    def update(
+        self, token_id, synth, balance, block_number, timestamp, is_transfer=False
+    ):
+        token = self.get_token(token_id)
+        if token is None:
+            # the final update for a burned token
+            return
+
+        # swaps and withdrawals settle the synth prior to reducing the balance,
+        # an increased balance or a new synth means a conversion that is not
+        # yet settled. balances moved by `merge` and `split` are already settled,
+        # so the receiver keeps its settlement state unless it was just minted.
+        settled, converted_at = token.settled, token.converted_at
+        if is_transfer:
+            if token.synth is None:
+                settled = True
+        elif synth != token.synth or balance > token.balance:
+            settled, converted_at = False, timestamp
+        elif balance < token.balance:
+            settled = True
+
+        self.connection.execute(
+            "UPDATE tokens SET synth = ?, balance = ?, settled = ?, updated_block = ?, "
+            "converted_at = ? WHERE token_id = ?",
+            (
+                synth,
+                _key(balance),
+                int(settled),
+                block_number,
+                converted_at,
+                _key(token_id),
+            ),
+        )
+
+    def mark_settled(self, token_ids):
+        """
+        Record that `token_ids` have been settled outside of a swap or withdrawal.
+        A conversion indexed afterwards marks the token as unsettled again.
+        """
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE tokens SET settled = 1 WHERE token_id = ?",
+                [(_key(i),) for i in token_ids],
+            )
+
+    def _push_token_id(self, token_id):
+        self.connection.execute(
+            "INSERT INTO available_token_ids (token_id) VALUES (?)", (_key(token_id),)
+        )
+
+    # lookups
+
+    def get_token(self, token_id) -> Optional[TokenState]:
+        """State of `token_id`, or `None` if the token does not exist."""
+        row = self.connection.execute(
+            "SELECT * FROM tokens WHERE token_id = ?", (_key(token_id),)
+        ).fetchone()
+        return None if row is None else TokenState.from_row(row)
+
+    def tokens_of_owner(self, owner) -> List[int]:
+        """Token IDs currently owned by `owner`."""
+        rows = self.connection.execute(
+            "SELECT token_id FROM tokens WHERE owner = ? ORDER BY token_id",
+            (str(owner),),
+        )
+        return [int(i[0], 16) for i in rows]
+
+    def unsettled_tokens(self) -> List[TokenState]:
+        """All tokens holding a synth that has not yet been settled."""
+        rows = self.connection.execute(
+            "SELECT * FROM tokens WHERE settled = 0 ORDER BY updated_block"
+        )
+        return [TokenState.from_row(i) for i in rows]
+
+    def settlers(self) -> List[str]:
+        """Addresses of all deployed settlers, in order of deployment."""
+        rows = self.connection.execute("SELECT address FROM settlers ORDER BY rowid")
+        return [i[0] for i in rows]
+
+    def available_token_ids(self) -> List[int]:
+        """
+        Token IDs of settlers that are not currently in use. The last
+        item is the token ID that will be minted by the next swap.
+        """
+        rows = self.connection.execute(
+            "SELECT token_id FROM available_token_ids ORDER BY position"
+        )
+        return [int(i[0], 16) for i in rows]
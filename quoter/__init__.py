@@ -0,0 +1,9 @@
+"""
+Off-chain quote engine for `SynthSwap`.
+
+Take a `Snapshot` of pool balances, synth rates and fees once per block, and
+use a `QuoteEngine` to evaluate any number of quotes against it locally.
+"""
+
+from quoter.engine import QuoteEngine  # noqa: F401
+from quoter.snapshot import Snapshot, take_snapshot  # noqa: F401
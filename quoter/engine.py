@@ -0,0 +1,172 @@
+"""
+Off-chain evaluation of the `SynthSwap` quote views.
+"""
+
+import numpy as np
+from brownie.convert import to_address
+
+from quoter.stableswap import as_int_array
+from quoter.synthetix import get_amount_received
+
+
+class QuoteEngine:
+    """
+    Evaluate `SynthSwap` quotes from a `Snapshot`, without any RPC calls.
+
+    Each quote method mirrors the `SynthSwap` view of the same name. Amounts
+    may be given as a single integer, in which case an integer is returned,
+    or as an array, in which case an array of integers is returned.
+    """
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    def _synth_for(self, coin):
+        try:
+            return self.snapshot.swappable_synth[coin]
+        except KeyError:
+            raise ValueError(f"{coin} is not swappable") from None
+
+    def _is_unlisted(self, coin):
+        # a synth that is not in any added pool is exchanged directly
+        return (
+            coin not in self.snapshot.swappable_synth
+            and coin in self.snapshot.synth_rates
+        )
+
+    def _candidates_for(self, coin, synths):
+        # every synth within `synths` whose pool contains `coin`
+        return [i for i in synths if coin in self.snapshot.pools[i].coins]
+
+    def _swap_into(self, _from, synth, amounts, intermediate_synth=None):
+        if synth not in self.snapshot.pools:
+            raise ValueError(f"{synth} has not been added")
+        if intermediate_synth is None:
+            intermediate_synth = _from
+            if not self._is_unlisted(_from):
+                intermediate_synth = self._synth_for(_from)
+        if _from != intermediate_synth:
+            pool = self.snapshot.pools[intermediate_synth]
+            i, j = pool.coins.index(_from), pool.coins.index(intermediate_synth)
+            amounts = pool.get_dy(i, j, amounts)
+
+        return get_amount_received(
+            amounts,
+            self.snapshot.synth_rates[intermediate_synth],
+            self.snapshot.synth_rates[synth],
+            self.snapshot.fee_rates[(intermediate_synth, synth)],
+        )
+
+    def _swap_from(self, synth, to, amounts):
+        pool = self.snapshot.pools[synth]
+        if to not in pool.coins:
+            raise ValueError(f"{to} is not swappable with {synth}")
+        return pool.get_dy(pool.coins.index(synth), pool.coins.index(to), amounts)
+
+    def get_swap_into_synth_amount(self, _from, synth, amounts):
+        """Amount of `synth` received when swapping `amounts` of `_from`."""
+        result = self._swap_into(
+            to_address(str(_from)), to_address(str(synth)), as_int_array(amounts)
+        )
+        return _unwrap(result, amounts)
+
+    def get_swap_from_synth_amount(self, synth, to, amounts):
+        """Amount of `to` received when swapping `amounts` of a settled `synth`."""
+        result = self._swap_from(
+            to_address(str(synth)), to_address(str(to)), as_int_array(amounts)
+        )
+        return _unwrap(result, amounts)
+
+    def get_estimated_swap_amount(self, _from, to, amounts):
+        """Estimated amount of `to` received when swapping `amounts` of `_from`."""
+        _from, to = to_address(str(_from)), to_address(str(to))
+        synth = self._synth_for(to)
+        synth_amounts = self._swap_into(_from, synth, as_int_array(amounts))
+        return _unwrap(self._swap_from(synth, to, synth_amounts), amounts)
+
+    def get_estimated_swap_amounts(self, froms, tos, amounts):
+        """
+        Estimated amounts received for many swaps, possibly between
+        different pairs. Swaps sharing a pair are evaluated together.
+        """
+        froms = [to_address(str(i)) for i in froms]
+        tos = [to_address(str(i)) for i in tos]
+        amounts = as_int_array(amounts)
+        if not len(froms) == len(tos) == len(amounts):
+            raise ValueError("Array lengths do not match")
+
+        pairs = {}
+        for idx, pair in enumerate(zip(froms, tos)):
+            pairs.setdefault(pair, []).append(idx)
+
+        result = np.zeros(len(amounts), dtype=object)
+        for (_from, to), idx in pairs.items():
+            result[idx] = self.get_estimated_swap_amount(_from, to, amounts[idx])
+        return result
+
+    def get_best_route(self, _from, to, amounts, offset=0, limit=None):
+        """
+        Route between `_from` and `to` giving the greatest estimated output,
+        mirroring `SynthSwapViews.get_best_route`.
+
+        Every synth whose pool contains `_from` is considered as the initial
+        synth and every synth whose pool contains `to` as the final synth.
+        Synths are considered in the order they were added, so that ties are
+        resolved as on-chain. By default every added synth is considered,
+        `offset` and `limit` select a range of them in the same way as the
+        view. A synth that has not been added is included in the snapshot
+        with `unlisted_synths` and exchanged directly, as within
+        `swap_into_synth`. The view cannot quote such synths.
+
+        Returns a tuple of `(initial_synth, final_synth, amount)`. When
+        `amounts` is an array, each value is a list holding the best route
+        for the corresponding amount.
+        """
+        _from, to = to_address(str(_from)), to_address(str(to))
+        int_amounts = as_int_array(amounts)
+
+        synths = self.snapshot.synths[offset:]
+        if limit is not None:
+            synths = synths[:limit]
+        missing = [i for i in synths if i not in self.snapshot.pools]
+        if missing:
+            raise ValueError(f"{', '.join(missing)} are not within the snapshot")
+
+        initial_synths = self._candidates_for(_from, synths)
+        if self._is_unlisted(_from):
+            initial_synths = [_from]
+        routes = [
+            (initial, final)
+            for initial in initial_synths
+            for final in self._candidates_for(to, synths)
+            if initial != final
+        ]
+        if not routes:
+            raise ValueError(f"No route between {_from} and {to}")
+
+        results = []
+        for initial, final in routes:
+            result = self._swap_into(_from, final, int_amounts, initial)
+            if to != final:
+                result = self._swap_from(final, to, result)
+            results.append(result)
+
+        # the first route is kept when several give the same output
+        best = [
+            max(range(len(routes)), key=lambda r: results[r][x])
+            for x in range(len(int_amounts))
+        ]
+        if np.ndim(amounts) == 0:
+            return routes[best[0]] + (int(results[best[0]][0]),)
+        return (
+            [routes[r][0] for r in best],
+            [routes[r][1] for r in best],
+            np.array([results[r][x] for x, r in enumerate(best)], dtype=object),
+        )
+
+
+def _unwrap(result, amounts):
+    # return a scalar when the amount was given as a scalar
+    if np.ndim(amounts) == 0:
+        return int(result[0])
+    return result.reshape(np.shape(amounts))
@@ -0,0 +1,240 @@
+"""
+Snapshot of the on-chain state required to evaluate `SynthSwap` quotes.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from brownie import ETH_ADDRESS, ZERO_ADDRESS, Contract, web3
+from brownie.convert import to_address
+from brownie.exceptions import VirtualMachineError
+
+from quoter.stableswap import PLAIN, PRECISE, VARIANTS, get_D, get_dy, get_xp
+
+# hardcoded addresses used within `SynthSwap`
+ADDRESS_PROVIDER = "0x0000000022D53366457F9d5E68Ec105046FC4383"
+SNX_ADDRESS_RESOLVER = "0x4E3b31eB0E5CB73641EE1E65E7dCEFe520bA3ef2"
+EXCHANGER_KEY = "0x45786368616e6765720000000000000000000000000000000000000000000000"
+EXCHANGE_RATES_KEY = (
+    "0x45786368616e6765526174657300000000000000000000000000000000000000"
+)
+
+
+def _view(name, inputs, outputs):
+    return {
+        "name": name,
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": f"arg{i}", "type": t} for i, t in enumerate(inputs)],
+        "outputs": [{"name": "", "type": t} for t in outputs],
+    }
+
+
+ADDRESS_PROVIDER_ABI = [_view("get_registry", [], ["address"])]
+REGISTRY_ABI = [_view("get_coins", ["address"], ["address[8]"])]
+RESOLVER_ABI = [_view("getAddress", ["bytes32"], ["address"])]
+EXCHANGE_RATES_ABI = [_view("rateForCurrency", ["bytes32"], ["uint256"])]
+EXCHANGER_ABI = [_view("feeRateForExchange", ["bytes32", "bytes32"], ["uint256"])]
+SYNTH_ABI = [_view("currencyKey", [], ["bytes32"])]
+ERC20_ABI = [_view("decimals", [], ["uint256"])]
+POOL_ABI = [
+    _view("A", [], ["uint256"]),
+    _view("fee", [], ["uint256"]),
+    _view("balances", ["uint256"], ["uint256"]),
+]
+# older pools index `balances` with an `int128`
+POOL_ABI_INT128 = [_view("balances", ["int128"], ["uint256"])]
+# pools that scale `A` by `A_PRECISION` expose the unscaled value
+POOL_ABI_A_PRECISE = [_view("A_precise", [], ["uint256"])]
+
+# mainnet pools deployed prior to `A_PRECISION`, which cannot be told apart by
+# their interface. other pools are `PRECISE` if they implement `A_precise`,
+# otherwise `PLAIN`.
+POOL_VARIANTS = {
+    "0xA5407eAE9Ba41422680e2e00537571bcC53efBfD": "legacy",  # sUSD
+    "0x7fC77b5c7614E1533320Ea6DDc2Eb61fa00A9714": "plain",  # sBTC
+}
+
+
+@dataclass(frozen=True)
+class PoolState:
+    """State of a Curve pool where a synth is swappable."""
+
+    address: str
+    coins: Tuple[str, ...]
+    balances: Tuple[int, ...]
+    rates: Tuple[int, ...]
+    # amplification coefficient as stored within the pool, including `A_PRECISION`
+    A: int
+    fee: int
+    D: int
+    # name of the `Variant` of the StableSwap implementation used by the pool
+    variant: str = PLAIN.name
+
+    def get_dy(self, i, j, dx):
+        variant = VARIANTS[self.variant]
+        return get_dy(
+            i, j, dx, self.balances, self.rates, self.A, self.fee, self.D, variant
+        )
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """State of `SynthSwap`, its Curve pools and Synthetix at a single block."""
+
+    block_number: int
+    # every synth added to `SynthSwap`, in the order they were added
+    synths: Tuple[str, ...]
+    # synth -> pool state, for the synths included in the snapshot
+    pools: Dict[str, PoolState]
+    # coin -> synth that the coin may be swapped with
+    swappable_synth: Dict[str, str]
+    # synth -> USD exchange rate, including synths that have not been added
+    synth_rates: Dict[str, int]
+    # (source synth, destination synth) -> exchange fee rate
+    fee_rates: Dict[Tuple[str, str], int]
+
+
+def _get_pool_state(pool, registry, block):
+    coins = [
+        i for i in registry.get_coins(pool, block_identifier=block) if i != ZERO_ADDRESS
+    ]
+    contract = Contract.from_abi("CurvePool", pool, POOL_ABI)
+
+    balances = []
+    for i in range(len(coins)):
+        try:
+            balances.append(contract.balances(i, block_identifier=block))
+        except (ValueError, VirtualMachineError):
+            contract = Contract.from_abi("CurvePool", pool, POOL_ABI + POOL_ABI_INT128)
+            balances.append(contract.balances["int128"](i, block_identifier=block))
+
+    rates = []
+    for coin in coins:
+        decimals = 18
+        if coin != ETH_ADDRESS:
+            erc20 = Contract.from_abi("ERC20", coin, ERC20_ABI)
+            decimals = erc20.decimals(block_identifier=block)
+        rates.append(10 ** (36 - decimals))
+
+    variant, A = _get_variant(pool, block)
+    return PoolState(
+        address=pool,
+        coins=tuple(coins),
+        balances=tuple(balances),
+        rates=tuple(rates),
+        A=A,
+        fee=contract.fee(block_identifier=block),
+        D=get_D(get_xp(balances, rates), A, variant),
+        variant=variant.name,
+    )
+
+
+def _get_variant(pool, block):
+    # return the implementation variant of `pool` and its amplification coefficient
+    pool = to_address(pool)
+    if pool not in POOL_VARIANTS:
+        contract = Contract.from_abi("CurvePool", pool, POOL_ABI_A_PRECISE)
+        try:
+            return PRECISE, contract.A_precise(block_identifier=block)
+        except (ValueError, VirtualMachineError):
+            pass
+
+    contract = Contract.from_abi("CurvePool", pool, POOL_ABI)
+    return (
+        VARIANTS[POOL_VARIANTS.get(pool, PLAIN.name)],
+        contract.A(block_identifier=block),
+    )
+
+
+def take_snapshot(swap, synths=None, block_identifier=None, unlisted_synths=()):
+    """
+    Query the state required to evaluate quotes for `SynthSwap`.
+
+    Arguments
+    ---------
+    swap : Contract
+        `SynthSwap` deployment
+    synths : list, optional
+        Synths that have been added to `swap`, defaults to every added synth
+    block_identifier : int, optional
+        Block to query at, defaults to the most recent block
+    unlisted_synths : list, optional
+        Synths that have not been added to `swap`, which may be swapped
+        from directly
+
+    Returns
+    -------
+    Snapshot
+    """
+    block = block_identifier
+    if block is None:
+        block = web3.eth.block_number
+
+    provider = Contract.from_abi(
+        "AddressProvider", ADDRESS_PROVIDER, ADDRESS_PROVIDER_ABI
+    )
+    registry = Contract.from_abi(
+        "Registry", provider.get_registry(block_identifier=block), REGISTRY_ABI
+    )
+    resolver = Contract.from_abi("AddressResolver", SNX_ADDRESS_RESOLVER, RESOLVER_ABI)
+    exchanger = Contract.from_abi(
+        "Exchanger",
+        resolver.getAddress(EXCHANGER_KEY, block_identifier=block),
+        EXCHANGER_ABI,
+    )
+    exchange_rates = Contract.from_abi(
+        "ExchangeRates",
+        resolver.getAddress(EXCHANGE_RATES_KEY, block_identifier=block),
+        EXCHANGE_RATES_ABI,
+    )
+
+    added = []
+    while True:
+        synth = swap.synths(len(added) + 1, block_identifier=block)
+        if synth == ZERO_ADDRESS:
+            break
+        added.append(to_address(synth))
+
+    if synths is None:
+        synths = added
+    synths = set(to_address(str(i)) for i in synths)
+    if synths.difference(added):
+        raise ValueError(f"{', '.join(synths.difference(added))} have not been added")
+
+    pools = {}
+    swappable_synth = {}
+    # pools are stored in the order the synths were added, as on-chain
+    for synth in [i for i in added if i in synths]:
+        pool = swap.synth_pools(synth, block_identifier=block)
+        pools[synth] = _get_pool_state(pool, registry, block)
+        for coin in pools[synth].coins:
+            # a coin may be in several pools, the default synth is set on-chain
+            swappable_synth[coin] = swap.swappable_synth(coin, block_identifier=block)
+
+    currency_keys = {}
+    synth_rates = {}
+    for synth in list(pools) + [to_address(str(i)) for i in unlisted_synths]:
+        # queried with a top-level call rather than within a view, so a
+        # Synthetix proxy may modify state while handling it
+        key = Contract.from_abi("Synth", synth, SYNTH_ABI).currencyKey(
+            block_identifier=block
+        )
+        currency_keys[synth] = key
+        synth_rates[synth] = exchange_rates.rateForCurrency(key, block_identifier=block)
+
+    fee_rates = {}
+    for source, source_key in currency_keys.items():
+        for dest, dest_key in currency_keys.items():
+            fee_rates[(source, dest)] = exchanger.feeRateForExchange(
+                source_key, dest_key, block_identifier=block
+            )
+
+    return Snapshot(
+        block_number=block,
+        synths=tuple(added),
+        pools=pools,
+        swappable_synth=swappable_synth,
+        synth_rates=synth_rates,
+        fee_rates=fee_rates,
+    )
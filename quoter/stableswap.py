@@ -0,0 +1,143 @@
+"""
+StableSwap math, evaluated over arrays of amounts.
+
+Amounts are held in NumPy arrays of python integers (`dtype=object`) so that
+every result is identical to the integer arithmetic performed on-chain.
+
+Curve pools have been deployed from several versions of the StableSwap
+implementation, which round differently. Each version is described by a
+`Variant`, and every function takes the variant of the pool being evaluated.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+FEE_DENOMINATOR = 10 ** 10
+PRECISION = 10 ** 18
+A_PRECISION = 100
+MAX_ITERATIONS = 255
+
+
+@dataclass(frozen=True)
+class Variant:
+    """Scaling and rounding used by a version of the StableSwap implementation."""
+
+    name: str
+    # `A` is stored multiplied by this value
+    a_precision: int
+    # added to each balance when calculating D, to prevent division by zero
+    d_offset: int
+    # subtracted from the amount received, in case of rounding errors
+    dy_offset: int
+    # if True, the fee is charged before `dy` is converted from 18 decimals
+    fee_before_rate: bool
+
+
+# compound, y, busd and sUSD pools
+LEGACY = Variant(
+    "legacy", a_precision=1, d_offset=1, dy_offset=0, fee_before_rate=False
+)
+# ren, sBTC and 3pool, and `CurvePoolMock`
+PLAIN = Variant("plain", a_precision=1, d_offset=0, dy_offset=1, fee_before_rate=False)
+# sETH, sEUR, sLINK and pools deployed from the pool templates
+PRECISE = Variant(
+    "precise", a_precision=A_PRECISION, d_offset=0, dy_offset=1, fee_before_rate=True
+)
+
+VARIANTS = {i.name: i for i in (LEGACY, PLAIN, PRECISE)}
+
+_to_int = np.frompyfunc(int, 1, 1)
+
+
+def as_int_array(values):
+    """Convert a scalar or array-like of amounts into a 1-dimensional integer array."""
+    values = np.atleast_1d(np.asarray(values, dtype=object)).ravel()
+    return _to_int(values).astype(object)
+
+
+def get_xp(balances, rates):
+    """Balances normalized to 18 decimals."""
+    return [rate * balance // PRECISION for balance, rate in zip(balances, rates)]
+
+
+def get_D(xp, amp, variant=PLAIN):
+    """
+    Calculate the StableSwap invariant for the normalized balances `xp`.
+    `amp` is given as stored within the pool, including any `A_PRECISION`.
+    """
+    n = len(xp)
+    S = sum(xp)
+    if S == 0:
+        return 0
+
+    a_precision = variant.a_precision
+    D = S
+    Ann = amp * n
+    for _ in range(MAX_ITERATIONS):
+        D_P = D
+        for x in xp:
+            D_P = D_P * D // (x * n + variant.d_offset)
+        D_prev = D
+        D = (
+            (Ann * S // a_precision + D_P * n)
+            * D
+            // ((Ann - a_precision) * D // a_precision + (n + 1) * D_P)
+        )
+        if abs(D - D_prev) <= 1:
+            break
+    return D
+
+
+def get_y(i, j, x, xp, amp, D, variant=PLAIN):
+    """
+    Calculate the new normalized balance of coin `j` for each new normalized
+    balance of coin `i` given in the array `x`.
+    """
+    n = len(xp)
+    Ann = amp * n
+    c = D
+    S_ = 0
+    for k in range(n):
+        if k == i:
+            _x = x
+        elif k != j:
+            _x = xp[k]
+        else:
+            continue
+        S_ = S_ + _x
+        c = c * D // (_x * n)
+    c = c * D * variant.a_precision // (Ann * n)
+    b = S_ + D * variant.a_precision // Ann
+
+    # Newton's method is applied to every amount at once, each amount
+    # is frozen once it has converged
+    y = np.full(len(x), D, dtype=object)
+    active = np.arange(len(x))
+    for _ in range(MAX_ITERATIONS):
+        y_prev = y[active]
+        y_next = (y_prev * y_prev + c[active]) // (2 * y_prev + b[active] - D)
+        y[active] = y_next
+        active = active[np.abs(y_next - y_prev) > 1]
+        if not len(active):
+            break
+    return y
+
+
+def get_dy(i, j, dx, balances, rates, amp, fee, D=None, variant=PLAIN):
+    """
+    Calculate the amount of coin `j` received for each amount of coin `i`
+    in the array `dx`, after fees.
+    """
+    xp = get_xp(balances, rates)
+    if D is None:
+        D = get_D(xp, amp, variant)
+
+    x = xp[i] + as_int_array(dx) * rates[i] // PRECISION
+    y = get_y(i, j, x, xp, amp, D, variant)
+    dy = xp[j] - y - variant.dy_offset
+
+    if variant.fee_before_rate:
+        return (dy - fee * dy // FEE_DENOMINATOR) * PRECISION // rates[j]
+    dy = dy * PRECISION // rates[j]
+    return dy - fee * dy // FEE_DENOMINATOR
@@ -0,0 +1,22 @@
+"""
+Synthetix exchange math, evaluated over arrays of amounts.
+"""
+
+from quoter.stableswap import PRECISION, as_int_array
+
+
+def _round(value_times_ten):
+    # round half up, as `SafeDecimalMath.multiplyDecimalRound` and
+    # `SafeDecimalMath.divideDecimalRound` do
+    return (value_times_ten + 5) // 10
+
+
+def get_amount_received(amount, source_rate, dest_rate, fee_rate):
+    """
+    Calculate the amount of the destination synth received for each amount
+    of the source synth, after fees. Mirrors `Exchanger.getAmountsForExchange`.
+    """
+    amount = _round(as_int_array(amount) * source_rate // (PRECISION // 10))
+    amount = _round(amount * (PRECISION * 10) // dest_rate)
+
+    return amount * (PRECISION - fee_rate) // PRECISION
@@ -1,4 +1,4 @@
-from brownie import Settler, SynthSwap, accounts
+from brownie import Settler, SynthSwap, SynthSwapRouter, SynthSwapViews, accounts
 
 # set the deployer here prior to running on mainnet
 DEPLOYER = accounts.add()
@@ -27,6 +27,8 @@ SYNTHS = [
 def main(deployer=DEPLOYER):
     settler = Settler.deploy({"from": deployer})
     swap = SynthSwap.deploy(settler, 10, {"from": deployer})
+    SynthSwapViews.deploy(swap, {"from": deployer})
+    SynthSwapRouter.deploy(swap, {"from": deployer})
 
     for token, pool in SYNTHS:
         swap.add_synth(token, pool, {"from": deployer})
@@ -0,0 +1,224 @@
+"""
+Keeper that settles the synths held in `SynthSwap` NFTs as soon as their
+waiting period ends, so that owners do not pay for settlement when swapping
+or withdrawing.
+
+Live tokens are discovered with the event indexer and scheduled in a priority
+queue ordered by the time at which they may be settled, which is predicted from
+the indexed conversion time and the Synthetix waiting period. The chain is only
+queried for a token once it is due. Tokens that are ready are settled using
+`settle_many`, with several batches submitted concurrently.
+
+Failed calls are logged and do not stop the keeper. A token whose on-chain
+check fails is dropped, and is scheduled again on the next refresh unless it
+has since been burned. Tokens within a failed settlement batch are retried
+after `RETRY_DELAY` seconds.
+
+To run on mainnet, pass the deployment address and the block that `SynthSwap`
+was deployed in:
+
+    brownie run keeper main <synthswap> <deployment block> --network mainnet
+"""
+
+import asyncio
+import heapq
+import logging
+
+from brownie import SynthSwap, accounts, chain
+
+from indexer import EventIndexer, get_waiting_period, settle_ready_at
+
+# maximum number of token IDs within a single call to `settle_many`
+MAX_BATCH_SIZE = 10
+
+# account used to submit transactions, loaded with `accounts.load`
+KEEPER_ACCOUNT = "keeper"
+
+# seconds to wait before retrying the tokens within a failed settlement batch
+RETRY_DELAY = 60
+
+logger = logging.getLogger(__name__)
+
+
+def _chunks(values, size):
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
+
+
+class SettlementKeeper:
+    """
+    Schedule and perform settlement of `SynthSwap` NFTs.
+
+    Arguments
+    ---------
+    swap : Contract
+        `SynthSwap` deployment
+    indexer : EventIndexer
+        Indexer for `swap`, used to discover unsettled tokens
+    account : Account
+        Account used to submit settlement transactions
+    waiting_period : int, optional
+        Synthetix waiting period in seconds, queried if not given
+    concurrency : int, optional
+        Maximum number of settlement transactions pending at the same time
+    """
+
+    def __init__(self, swap, indexer, account, waiting_period=None, concurrency=4):
+        self.swap = swap
+        self.indexer = indexer
+        self.account = account
+        if waiting_period is None:
+            waiting_period = get_waiting_period()
+        self.waiting_period = waiting_period
+        self.concurrency = concurrency
+
+        # heap of (time at which the token may be settled, token ID)
+        self.queue = []
+        self.scheduled = set()
+
+    def _schedule(self, token_id, ready_at):
+        heapq.heappush(self.queue, (ready_at, token_id))
+        self.scheduled.add(token_id)
+
+    def refresh(self):
+        """
+        Sync the indexer and schedule any newly discovered unsettled tokens.
+
+        Returns
+        -------
+        int
+            Number of tokens added to the queue
+        """
+        self.indexer.sync()
+        tokens = [
+            i
+            for i in self.indexer.store.unsettled_tokens()
+            if i.token_id not in self.scheduled
+        ]
+        for token in tokens:
+            self._schedule(token.token_id, settle_ready_at(token, self.waiting_period))
+        return len(tokens)
+
+    def pop_ready(self):
+        """
+        Remove all tokens that may be settled from the queue.
+
+        Tokens that have been topped up since they were scheduled are
+        rescheduled. Each remaining token is checked on-chain prior to
+        returning, as calls to `settle` are not indexed. Tokens found to be
+        settled already are recorded as such in the store.
+
+        Returns
+        -------
+        list
+            Token IDs that are ready to be settled
+        """
+        # views are evaluated at the timestamp of the latest block
+        now = chain[-1].timestamp
+        token_ids = []
+        settled = []
+        while self.queue and self.queue[0][0] <= now:
+            token_id = heapq.heappop(self.queue)[1]
+            self.scheduled.discard(token_id)
+
+            token = self.indexer.store.get_token(token_id)
+            if token is None or token.settled:
+                # burned, or settled during a swap or withdrawal
+                continue
+
+            ready_at = settle_ready_at(token, self.waiting_period)
+            if ready_at <= now:
+                try:
+                    ready_at = self.swap.settle_ready_at(token_id)
+                except Exception as exc:
+                    # burned or swapped out since the last sync, the token
+                    # is scheduled again on refresh if it still exists
+                    logger.warning("Unable to check token %s: %s", token_id, exc)
+                    continue
+            if ready_at > now:
+                self._schedule(token_id, ready_at)
+            elif ready_at != 0:
+                token_ids.append(token_id)
+            else:
+                settled.append(token_id)
+
+        self.indexer.store.mark_settled(settled)
+        return token_ids
+
+    async def settle(self, token_ids):
+        """
+        Settle `token_ids` using batched calls to `settle_many`.
+
+        Settled tokens are recorded in the store, so that they are not
+        scheduled again. A batch that fails is logged and its tokens are
+        rescheduled `RETRY_DELAY` seconds later.
+
+        Returns
+        -------
+        list
+            Token IDs that were settled
+        """
+        loop = asyncio.get_event_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def settle_batch(batch):
+            padded = batch + [0] * (MAX_BATCH_SIZE - len(batch))
+            async with semaphore:
+                try:
+                    tx = await loop.run_in_executor(
+                        None,
+                        lambda: self.swap.settle_many(padded, {"from": self.account}),
+                    )
+                    if tx.status != 1:
+                        raise ValueError(f"Transaction {tx.txid} reverted")
+                except Exception as exc:
+                    logger.warning("Unable to settle tokens %s: %s", batch, exc)
+                    retry_at = chain[-1].timestamp + RETRY_DELAY
+                    for token_id in batch:
+                        self._schedule(token_id, retry_at)
+                    return []
+            self.indexer.store.mark_settled(batch)
+            return batch
+
+        batches = list(_chunks(token_ids, MAX_BATCH_SIZE))
+        settled = await asyncio.gather(*[settle_batch(i) for i in batches])
+        return [i for batch in settled for i in batch]
+
+    async def run_once(self):
+        """
+        Discover new tokens and settle all tokens that are ready.
+
+        Returns
+        -------
+        list
+            Token IDs that were settled
+        """
+        self.refresh()
+        token_ids = self.pop_ready()
+        return await self.settle(token_ids)
+
+    async def run(self, poll_interval=15):
+        """
+        Settle tokens indefinitely, waiting `poll_interval` seconds between checks.
+
+        Failures, such as an unavailable node, are logged and the check is
+        attempted again after `poll_interval` seconds.
+        """
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Settlement check failed")
+            await asyncio.sleep(poll_interval)
+
+
+def main(swap_address, start_block, path="synthswap.db", account=None):
+    if account is None:
+        account = accounts.load(KEEPER_ACCOUNT)
+
+    swap = SynthSwap.at(swap_address)
+    indexer = EventIndexer(swap, path, start_block=int(start_block))
+
+    logging.basicConfig(level=logging.INFO)
+    keeper = SettlementKeeper(swap, indexer, account)
+    asyncio.run(keeper.run())
@@ -0,0 +1,58 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+BASELINE_PATH = Path(__file__).parent.joinpath("gas_baseline.json")
+
+# maximum allowed increase in gas used, relative to the baseline
+GAS_TOLERANCE = float(os.getenv("GAS_TOLERANCE", "0.02"))
+
+# set to update the baseline file with the measured values
+UPDATE_BASELINE = bool(os.getenv("UPDATE_GAS_BASELINE"))
+
+baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+results = {}
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not results:
+        return
+
+    terminalreporter.section("gas benchmarks")
+    width = max(len(i) for i in results)
+    for name, gas_used in sorted(results.items()):
+        line = f"{name:<{width}}  {gas_used:>9}"
+        if name in baseline:
+            delta = gas_used - baseline[name]
+            line += f"  {delta:>+8} ({delta / baseline[name]:+.2%})"
+        terminalreporter.write_line(line)
+
+
+def pytest_sessionfinish(session):
+    if UPDATE_BASELINE and results:
+        data = dict(sorted({**baseline, **results}.items()))
+        BASELINE_PATH.write_text(json.dumps(data, indent=2) + "\n")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def skip_if_forked(is_forked):
+    if is_forked:
+        pytest.skip("Gas benchmarks are measured against the mock contracts")
+
+
+@pytest.fixture
+def check_gas():
+    def check(name, gas_used):
+        results[name] = gas_used
+        if UPDATE_BASELINE:
+            return
+
+        assert name in baseline, f"No baseline for '{name}', set UPDATE_GAS_BASELINE=1"
+        assert gas_used <= baseline[name] * (1 + GAS_TOLERANCE), (
+            f"'{name}' used {gas_used} gas, exceeding the "
+            f"baseline of {baseline[name]} by more than {GAS_TOLERANCE:.0%}"
+        )
+
+    yield check
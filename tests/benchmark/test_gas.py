@@ -0,0 +1,215 @@
+import pytest
+from brownie import ETH_ADDRESS, ZERO_ADDRESS
+
+MAX_BATCH_SIZE = 10
+AMOUNT = 100_000 * 10 ** 18
+
+
+def _pad(values, default=0):
+    return list(values) + [default] * (MAX_BATCH_SIZE - len(values))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, DAI, add_synths):
+    DAI._mint_for_testing(alice, 100 * AMOUNT)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def token_id(alice, swap, DAI, sBTC, setup):
+    tx = swap.swap_into_synth(DAI, sBTC, AMOUNT, 0, {"from": alice})
+    yield tx.return_value
+
+
+@pytest.fixture(scope="module")
+def token_ids(alice, swap, DAI, sBTC, setup):
+    token_ids = []
+    for i in range(5):
+        tx = swap.swap_into_synth(DAI, sBTC, AMOUNT, 0, {"from": alice})
+        token_ids.append(tx.return_value)
+    yield token_ids
+
+
+def test_constructor(SynthSwap, alice, settler_implementation, check_gas):
+    swap = SynthSwap.deploy(settler_implementation, 10, {"from": alice})
+    check_gas("constructor (10 settlers)", swap.tx.gas_used)
+
+
+def test_add_synth(
+    SynthSwap, alice, settler_implementation, sBTC, curve_sbtc, check_gas
+):
+    swap = SynthSwap.deploy(settler_implementation, 0, {"from": alice})
+    tx = swap.add_synth(sBTC, curve_sbtc, {"from": alice})
+    check_gas("add_synth", tx.gas_used)
+
+
+def test_prewarm_settlers(alice, swap, check_gas):
+    tx = swap.prewarm_settlers(10, {"from": alice})
+    check_gas("prewarm_settlers (10 settlers)", tx.gas_used)
+
+
+def test_swap_into_reused_settler(alice, swap, DAI, sBTC, check_gas):
+    # the first swap also approves the registry swap contract to transfer DAI
+    swap.swap_into_synth(DAI, sBTC, AMOUNT, 0, {"from": alice})
+
+    tx = swap.swap_into_synth(DAI, sBTC, AMOUNT, 0, {"from": alice})
+    assert "NewSettler" not in tx.events
+    check_gas("swap_into_synth (reused settler)", tx.gas_used)
+
+
+def test_swap_into_new_settler(alice, swap, DAI, sBTC, check_gas):
+    # the `swap` fixture deploys 3 settlers
+    for i in range(3):
+        swap.swap_into_synth(DAI, sBTC, AMOUNT, 0, {"from": alice})
+
+    tx = swap.swap_into_synth(DAI, sBTC, AMOUNT, 0, {"from": alice})
+    assert "NewSettler" in tx.events
+    check_gas("swap_into_synth (new settler)", tx.gas_used)
+
+
+def test_swap_into_existing_token(alice, swap, DAI, sBTC, token_id, check_gas):
+    tx = swap.swap_into_synth(DAI, sBTC, AMOUNT, 0, alice, token_id, {"from": alice})
+    check_gas("swap_into_synth (existing token id)", tx.gas_used)
+
+
+def test_swap_into_from_eth(alice, swap, sBTC, check_gas):
+    tx = swap.swap_into_synth(
+        ETH_ADDRESS, sBTC, 10 ** 18, 0, {"from": alice, "value": 10 ** 18}
+    )
+    check_gas("swap_into_synth (from ETH)", tx.gas_used)
+
+
+def test_swap_into_from_unlisted_synth(alice, swap, sJPY, sBTC, check_gas):
+    sJPY._mint_for_testing(alice, AMOUNT)
+    sJPY.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+    tx = swap.swap_into_synth(sJPY, sBTC, AMOUNT, 0, {"from": alice})
+    check_gas("swap_into_synth (unlisted synth)", tx.gas_used)
+
+
+def test_swap_into_many(alice, swap, DAI, sBTC, check_gas):
+    tx = swap.swap_into_synth_many(
+        _pad([DAI] * 3, ZERO_ADDRESS),
+        _pad([sBTC] * 3, ZERO_ADDRESS),
+        _pad([AMOUNT] * 3),
+        _pad([]),
+        _pad([alice] * 3, ZERO_ADDRESS),
+        {"from": alice},
+    )
+    check_gas("swap_into_synth_many (3 swaps)", tx.gas_used)
+
+
+def test_transfer(alice, bob, swap, token_id, check_gas):
+    tx = swap.transferFrom(alice, bob, token_id, {"from": alice})
+    check_gas("transferFrom", tx.gas_used)
+
+
+def test_settle(chain, alice, swap, token_id, check_gas):
+    chain.sleep(600)
+    tx = swap.settle(token_id, {"from": alice})
+    check_gas("settle", tx.gas_used)
+
+
+def test_settle_many(chain, alice, swap, token_ids, check_gas):
+    chain.sleep(600)
+    tx = swap.settle_many(_pad(token_ids), {"from": alice})
+    check_gas("settle_many (5 tokens)", tx.gas_used)
+
+
+@pytest.mark.parametrize("partial", [True, False])
+def test_swap_from(chain, alice, swap, sBTC, WBTC, token_id, check_gas, partial):
+    chain.sleep(600)
+    amount = sBTC.balanceOf(hex(token_id)) // (2 if partial else 1)
+    tx = swap.swap_from_synth(token_id, WBTC, amount, 0, {"from": alice})
+    check_gas(f"swap_from_synth ({'partial' if partial else 'full'})", tx.gas_used)
+
+
+@pytest.mark.parametrize("partial", [True, False])
+def test_withdraw(chain, alice, swap, sBTC, token_id, check_gas, partial):
+    chain.sleep(600)
+    amount = sBTC.balanceOf(hex(token_id)) // (2 if partial else 1)
+    tx = swap.withdraw(token_id, amount, {"from": alice})
+    check_gas(f"withdraw ({'partial' if partial else 'full'})", tx.gas_used)
+
+
+def test_convert_token(chain, alice, swap, sETH, token_id, check_gas):
+    chain.sleep(600)
+    tx = swap.convert_token(token_id, sETH, 0, {"from": alice})
+    check_gas("convert_token", tx.gas_used)
+
+
+def test_merge(chain, alice, swap, token_ids, check_gas):
+    chain.sleep(600)
+    tx = swap.merge(_pad(token_ids[1:]), token_ids[0], {"from": alice})
+    check_gas("merge (4 tokens into 1)", tx.gas_used)
+
+
+def test_split(chain, alice, swap, sBTC, token_id, check_gas):
+    swap.prewarm_settlers(1, {"from": alice})
+    chain.sleep(600)
+    amount = sBTC.balanceOf(hex(token_id)) // 2
+    tx = swap.split(token_id, amount, {"from": alice})
+    assert "NewSettler" not in tx.events
+    check_gas("split", tx.gas_used)
+
+
+def test_withdraw_many(chain, alice, swap, sBTC, token_ids, check_gas):
+    chain.sleep(600)
+    amounts = [sBTC.balanceOf(hex(i)) for i in token_ids]
+    tx = swap.withdraw_many(_pad(token_ids), _pad(amounts), alice, {"from": alice})
+    check_gas("withdraw_many (5 tokens, full)", tx.gas_used)
+
+
+@pytest.mark.parametrize("idx", [(0, 1, 2), (3, 1, 0), (2, 3, 1)])
+def test_settler_reuse(chain, alice, swap, DAI, sBTC, sETH, check_gas, idx):
+    # mirrors `tests/integration/test_settler_reuse.py`: withdraw 3 of 4 NFTs in
+    # the given order, and then reuse each freed settler in a new swap
+    token_ids = []
+    for i in range(4):
+        tx = swap.swap_into_synth(DAI, sBTC, AMOUNT, 0, {"from": alice})
+        token_ids.append(tx.return_value)
+    chain.sleep(600)
+
+    withdraw_gas = 0
+    for i in idx:
+        amount = sBTC.balanceOf(hex(token_ids[i]))
+        withdraw_gas += swap.withdraw(token_ids[i], amount, {"from": alice}).gas_used
+
+    swap_gas = 0
+    for i in idx[::-1]:
+        tx = swap.swap_into_synth(DAI, sETH, AMOUNT, 0, {"from": alice})
+        assert tx.return_value == token_ids[i] + 2 ** 160
+        swap_gas += tx.gas_used
+
+    name = ", ".join(str(i) for i in idx)
+    check_gas(f"settler reuse ({name}) - withdraw x3", withdraw_gas)
+    check_gas(f"settler reuse ({name}) - swap_into_synth x3", swap_gas)
+
+
+@pytest.mark.parametrize(
+    "path", ["first use", "reuse, same synth", "reuse, other synth"]
+)
+def test_settler_lifecycle(chain, alice, swap, DAI, sBTC, sETH, check_gas, path):
+    # module fixtures may already hold some settlers, so deploy fresh ones.
+    # the first swap approves the pool to transfer DAI, and keeps its settler
+    swap.prewarm_settlers(2, {"from": alice})
+    swap.swap_into_synth(DAI, sBTC, AMOUNT, 0, {"from": alice})
+
+    settler = None
+    if path != "first use":
+        tx = swap.swap_into_synth(DAI, sBTC, AMOUNT, 0, {"from": alice})
+        settler = tx.return_value % 2 ** 160
+        chain.sleep(600)
+        swap.withdraw(tx.return_value, 2 ** 256 - 1, {"from": alice})
+
+    synth = sETH if path == "reuse, other synth" else sBTC
+    tx = swap.swap_into_synth(DAI, synth, AMOUNT, 0, {"from": alice})
+    token_id = tx.return_value
+    assert "NewSettler" not in tx.events
+    if settler is not None:
+        assert token_id % 2 ** 160 == settler
+    check_gas(f"settler lifecycle ({path}) - swap_into_synth", tx.gas_used)
+
+    chain.sleep(600)
+    tx = swap.withdraw(token_id, 2 ** 256 - 1, {"from": alice})
+    check_gas(f"settler lifecycle ({path}) - withdraw", tx.gas_used)
@@ -1,6 +1,65 @@
 import pytest
+from brownie import ETH_ADDRESS, ZERO_ADDRESS, network
 from brownie_tokens import MintableForkToken
 
+# hardcoded addresses used within the contracts
+ADDRESS_PROVIDER = "0x0000000022D53366457F9d5E68Ec105046FC4383"
+SNX_ADDRESS_RESOLVER = "0x4E3b31eB0E5CB73641EE1E65E7dCEFe520bA3ef2"
+SNX = "0xC011a73ee8576Fb46F5E1c5751cA3B9Fe0af2a6F"
+EXCHANGER_KEY = "0x45786368616e6765720000000000000000000000000000000000000000000000"
+EXCHANGE_RATES_KEY = (
+    "0x45786368616e6765526174657300000000000000000000000000000000000000"
+)
+
+# USD rates used by the mock exchanger when testing without a fork
+SYNTH_RATES = {"sUSD": 1, "sBTC": 30_000, "sETH": 2_000, "sEUR": 1.2, "sJPY": 0.009}
+
+
+def _currency_key(symbol):
+    return "0x" + symbol.encode().hex().ljust(64, "0")
+
+
+def _inject(web3, contract, address):
+    # place the runtime bytecode of a mock contract at a hardcoded address
+    bytecode = contract._build["deployedBytecode"]
+    if not bytecode.startswith("0x"):
+        bytecode = f"0x{bytecode}"
+    web3.provider.make_request("evm_setAccountCode", [address, bytecode])
+    return contract.at(address)
+
+
+def _token(is_forked, address, container, admin, *args):
+    if is_forked:
+        return MintableForkToken(address)
+    return container.deploy(*args, {"from": admin})
+
+
+def _synth(is_forked, address, container, admin, symbol):
+    args = (f"Synth {symbol}", symbol, 18, _currency_key(symbol))
+    return _token(is_forked, address, container, admin, *args)
+
+
+def _pool(container, admin, coins, amount):
+    # deploy a mock curve pool and seed it with `amount` of each coin
+    coins = list(coins) + [ZERO_ADDRESS] * (4 - len(coins))
+    pool = container.deploy(coins, 100, 4000000, {"from": admin})
+
+    amounts = [0] * 4
+    value = 0
+    for i, coin in enumerate(coins):
+        if coin == ZERO_ADDRESS:
+            break
+        if coin == ETH_ADDRESS:
+            value = amounts[i] = amount * 10 ** 18
+        else:
+            amounts[i] = amount * 10 ** coin.decimals()
+            coin._mint_for_testing(admin, amounts[i], {"from": admin})
+            coin.approve(pool, amounts[i], {"from": admin})
+    pool.add_liquidity(amounts, {"from": admin, "value": value})
+
+    return pool
+
+
 # isolation
 
 
@@ -27,6 +86,19 @@ def charlie(accounts):
     yield accounts[2]
 
 
+@pytest.fixture(scope="session")
+def admin(accounts):
+    yield accounts[-1]
+
+
+# network
+
+
+@pytest.fixture(scope="session")
+def is_forked():
+    yield "fork" in network.show_active()
+
+
 # deployments
 
 
@@ -36,10 +108,20 @@ def settler_implementation(Settler, alice):
 
 
 @pytest.fixture(scope="module")
-def swap(SynthSwap, alice, settler_implementation):
+def swap(SynthSwap, alice, settler_implementation, registry, exchanger):
     yield SynthSwap.deploy(settler_implementation, 3, {"from": alice})
 
 
+@pytest.fixture(scope="module")
+def swap_views(SynthSwapViews, alice, swap):
+    yield SynthSwapViews.deploy(swap, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def swap_router(SynthSwapRouter, alice, swap):
+    yield SynthSwapRouter.deploy(swap, {"from": alice})
+
+
 # settlers
 
 
@@ -85,64 +167,174 @@ def settler_susd(Settler, alice, swap, WBTC, sUSD, add_synths):
 
 
 @pytest.fixture(scope="module")
-def sUSD():
-    yield MintableForkToken("0x57ab1ec28d129707052df4df418d58a2d46d5f51")
+def sUSD(is_forked, SynthMock, admin):
+    addr = "0x57ab1ec28d129707052df4df418d58a2d46d5f51"
+    yield _synth(is_forked, addr, SynthMock, admin, "sUSD")
 
 
 @pytest.fixture(scope="module")
-def sBTC():
-    yield MintableForkToken("0xfe18be6b3bd88a2d2a7f928d00292e7a9963cfc6")
+def sBTC(is_forked, SynthMock, admin):
+    addr = "0xfe18be6b3bd88a2d2a7f928d00292e7a9963cfc6"
+    yield _synth(is_forked, addr, SynthMock, admin, "sBTC")
 
 
 @pytest.fixture(scope="module")
-def sETH():
-    yield MintableForkToken("0x5e74C9036fb86BD7eCdcb084a0673EFc32eA31cb")
+def sETH(is_forked, SynthMock, admin):
+    addr = "0x5e74C9036fb86BD7eCdcb084a0673EFc32eA31cb"
+    yield _synth(is_forked, addr, SynthMock, admin, "sETH")
 
 
 @pytest.fixture(scope="module")
-def sEUR():
-    yield MintableForkToken("0xD71eCFF9342A5Ced620049e616c5035F1dB98620")
+def sEUR(is_forked, SynthMock, admin):
+    addr = "0xD71eCFF9342A5Ced620049e616c5035F1dB98620"
+    yield _synth(is_forked, addr, SynthMock, admin, "sEUR")
+
+
+@pytest.fixture(scope="module")
+def sJPY(is_forked, SynthMock, admin):
+    # not added to `SynthSwap`, as there is no Curve pool for it
+    addr = "0xF6b1C627e95BFc3c1b4c9B825a032Ff0fBf3e07d"
+    yield _synth(is_forked, addr, SynthMock, admin, "sJPY")
 
 
 # swappable coins
 
 
 @pytest.fixture(scope="module")
-def DAI():
-    yield MintableForkToken("0x6B175474E89094C44Da98b954EedeAC495271d0F")
+def DAI(is_forked, ERC20MockDaiPermit, admin):
+    addr = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+    yield _token(
+        is_forked, addr, ERC20MockDaiPermit, admin, "Dai Stablecoin", "DAI", 18
+    )
+
+
+@pytest.fixture(scope="module")
+def USDC(is_forked, ERC20MockPermit, admin):
+    addr = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+    yield _token(is_forked, addr, ERC20MockPermit, admin, "USD Coin", "USDC", 6)
+
+
+@pytest.fixture(scope="module")
+def USDT(is_forked, ERC20MockNoReturn, admin):
+    addr = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+    yield _token(is_forked, addr, ERC20MockNoReturn, admin, "Tether USD", "USDT", 6)
+
+
+@pytest.fixture(scope="module")
+def WBTC(is_forked, ERC20Mock, admin):
+    addr = "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599"
+    yield _token(is_forked, addr, ERC20Mock, admin, "Wrapped BTC", "WBTC", 8)
 
 
 @pytest.fixture(scope="module")
-def USDT():
-    yield MintableForkToken("0xdAC17F958D2ee523a2206206994597C13D831ec7")
+def renBTC(is_forked, ERC20Mock, admin):
+    addr = "0xEB4C2781e4ebA804CE9a9803C67d0893436bB27D"
+    yield _token(is_forked, addr, ERC20Mock, admin, "renBTC", "renBTC", 8)
 
 
 @pytest.fixture(scope="module")
-def WBTC():
-    yield MintableForkToken("0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599")
+def EURS(is_forked, ERC20Mock, admin):
+    addr = "0xdB25f211AB05b1c97D595516F45794528a807ad8"
+    yield _token(is_forked, addr, ERC20Mock, admin, "STASIS EURS Token", "EURS", 2)
 
 
 # curve pools
 
 
 @pytest.fixture(scope="module")
-def curve_susd(Contract):
-    yield Contract("0xA5407eAE9Ba41422680e2e00537571bcC53efBfD")
+def curve_susd(is_forked, Contract, CurvePoolMock, admin, DAI, USDC, USDT, sUSD):
+    if is_forked:
+        yield Contract("0xA5407eAE9Ba41422680e2e00537571bcC53efBfD")
+    else:
+        yield _pool(CurvePoolMock, admin, [DAI, USDC, USDT, sUSD], 100_000_000)
 
 
 @pytest.fixture(scope="module")
-def curve_sbtc(Contract):
-    yield Contract("0x7fC77b5c7614E1533320Ea6DDc2Eb61fa00A9714")
+def curve_sbtc(is_forked, Contract, CurvePoolMock, admin, renBTC, WBTC, sBTC):
+    if is_forked:
+        yield Contract("0x7fC77b5c7614E1533320Ea6DDc2Eb61fa00A9714")
+    else:
+        yield _pool(CurvePoolMock, admin, [renBTC, WBTC, sBTC], 10_000)
 
 
 @pytest.fixture(scope="module")
-def curve_seth(Contract):
-    yield Contract("0xc5424b857f758e906013f3555dad202e4bdb4567")
+def curve_seth(is_forked, Contract, CurvePoolMock, admin, sETH):
+    if is_forked:
+        yield Contract("0xc5424b857f758e906013f3555dad202e4bdb4567")
+    else:
+        yield _pool(CurvePoolMock, admin, [ETH_ADDRESS, sETH], 10_000)
 
 
 @pytest.fixture(scope="module")
-def curve_seur(Contract):
-    yield Contract("0x0Ce6a5fF5217e38315f87032CF90686C96627CAA")
+def curve_seur(is_forked, Contract, CurvePoolMock, admin, EURS, sEUR):
+    if is_forked:
+        yield Contract("0x0Ce6a5fF5217e38315f87032CF90686C96627CAA")
+    else:
+        yield _pool(CurvePoolMock, admin, [EURS, sEUR], 10_000_000)
+
+
+# curve registry and synthetix
+
+
+@pytest.fixture(scope="module")
+def registry(
+    is_forked,
+    web3,
+    Contract,
+    RegistryMock,
+    RegistrySwapMock,
+    AddressProviderMock,
+    admin,
+    curve_susd,
+    curve_sbtc,
+    curve_seth,
+    curve_seur,
+):
+    if is_forked:
+        yield Contract(Contract(ADDRESS_PROVIDER).get_registry())
+    else:
+        registry = RegistryMock.deploy({"from": admin})
+        for pool in (curve_susd, curve_sbtc, curve_seth, curve_seur):
+            registry.add_pool(pool, {"from": admin})
+        registry_swap = RegistrySwapMock.deploy({"from": admin})
+
+        provider = _inject(web3, AddressProviderMock, ADDRESS_PROVIDER)
+        provider.set_address(0, registry, {"from": admin})
+        provider.set_address(2, registry_swap, {"from": admin})
+
+        yield registry
+
+
+@pytest.fixture(scope="module")
+def exchanger(
+    is_forked,
+    web3,
+    Contract,
+    ExchangerMock,
+    AddressResolverMock,
+    SynthetixMock,
+    admin,
+    sUSD,
+    sBTC,
+    sETH,
+    sEUR,
+    sJPY,
+):
+    if is_forked:
+        yield Contract(Contract(SNX_ADDRESS_RESOLVER).getAddress(EXCHANGER_KEY))
+    else:
+        # 0.3% fee, 5 minute waiting period
+        exchanger = ExchangerMock.deploy(3 * 10 ** 15, 300, {"from": admin})
+        for synth in (sUSD, sBTC, sETH, sEUR, sJPY):
+            rate = int(SYNTH_RATES[synth.symbol()] * 10 ** 18)
+            exchanger.add_synth(synth, rate, {"from": admin})
+
+        resolver = _inject(web3, AddressResolverMock, SNX_ADDRESS_RESOLVER)
+        resolver.set_address(EXCHANGER_KEY, exchanger, {"from": admin})
+        resolver.set_address(EXCHANGE_RATES_KEY, exchanger, {"from": admin})
+        _inject(web3, SynthetixMock, SNX)
+
+        yield exchanger
 
 
 # test setup
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(scope="module", autouse=True)
+def skip_if_not_forked(is_forked):
+    if not is_forked:
+        pytest.skip("Integration tests require a forked mainnet")
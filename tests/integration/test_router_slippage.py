@@ -0,0 +1,34 @@
+import pytest
+from brownie import chain
+
+pytestmark = pytest.mark.usefixtures("add_synths")
+
+
+def test_swap_into_synth(Settler, alice, swap, swap_router, DAI, sBTC):
+    # currency keys of the Synthetix proxies must be read via `SynthSwap`
+    amount = 100_000 * 10 ** 18
+    DAI._mint_for_testing(alice, amount)
+    DAI.approve(swap_router, amount, {"from": alice})
+
+    tx = swap_router.swap_into_synth_with_slippage(
+        DAI, sBTC, amount, 100, chain.time() + 600, {"from": alice}
+    )
+    token_id = tx.return_value
+
+    assert swap.ownerOf(token_id) == alice
+    assert sBTC.balanceOf(Settler.at(hex(token_id))) > 0
+    assert DAI.balanceOf(alice) == 0
+
+
+def test_swap_into_synth_unlisted(Settler, alice, swap, swap_router, sJPY, sBTC):
+    # `currencyKey` is called on the proxy of a synth that has not been added
+    amount = 1_000_000 * 10 ** 18
+    sJPY._mint_for_testing(alice, amount)
+    sJPY.approve(swap_router, amount, {"from": alice})
+
+    tx = swap_router.swap_into_synth_with_slippage(
+        sJPY, sBTC, amount, 0, chain.time() + 600, {"from": alice}
+    )
+
+    assert sBTC.balanceOf(Settler.at(hex(tx.return_value))) > 0
+    assert sJPY.balanceOf(alice) == 0
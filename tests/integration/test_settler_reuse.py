@@ -42,6 +42,8 @@ def test_reuse_settler(Settler, swap, alice, bob, USDT, sBTC, sETH, token_ids, i
         assert not swap.is_settled(token_id)
         assert swap.ownerOf(token_id) == bob
         assert settler.synth() == sETH
+        with brownie.reverts():
+            swap.ownerOf(token_ids[i])
 
     assert swap.balanceOf(bob) == 3
     assert swap.balanceOf(alice) == 1
@@ -5,6 +5,7 @@ def test_add_synth(alice, swap, sUSD, curve_susd):
     swap.add_synth(sUSD, curve_susd, {"from": alice})
 
     assert swap.synth_pools(sUSD) == curve_susd
+    assert swap.currency_keys(sUSD) == sUSD.currencyKey()
     for coin in [curve_susd.coins(i) for i in range(4)]:
         assert swap.swappable_synth(coin) == sUSD
 
@@ -0,0 +1,203 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS, Settler
+
+from quoter import QuoteEngine, take_snapshot
+
+
+@pytest.fixture(scope="module")
+def sUSD2(is_forked, SynthMock, admin, exchanger):
+    if is_forked:
+        pytest.skip("requires a second synth pool containing DAI")
+    key = "0x" + b"sUSD2".hex().ljust(64, "0")
+    synth = SynthMock.deploy("Synth sUSD2", "sUSD2", 18, key, {"from": admin})
+    exchanger.add_synth(synth, 10 ** 18, {"from": admin})
+    yield synth
+
+
+@pytest.fixture(scope="module")
+def shallow_pool(CurvePoolMock, admin, registry, DAI, USDC, sUSD2):
+    # a second, much shallower pool where DAI may be exchanged for a synth
+    coins = [DAI, USDC, sUSD2, ZERO_ADDRESS]
+    pool = CurvePoolMock.deploy(coins, 100, 4000000, {"from": admin})
+    amounts = [10_000 * 10 ** i.decimals() for i in coins[:3]] + [0]
+    for coin, amount in zip(coins, amounts[:3]):
+        coin._mint_for_testing(admin, amount, {"from": admin})
+        coin.approve(pool, amount, {"from": admin})
+    pool.add_liquidity(amounts, {"from": admin})
+    registry.add_pool(pool, {"from": admin})
+    yield pool
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, swap_router, DAI, sUSD2, shallow_pool, add_synths):
+    # added last, so it becomes the default synth for DAI and USDC
+    swap.add_synth(sUSD2, shallow_pool, {"from": alice})
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap_router, 2 ** 256 - 1, {"from": alice})
+
+
+def test_default_synth(swap, DAI, sUSD2):
+    assert swap.swappable_synth(DAI) == sUSD2
+
+
+def test_enumerate_synths(swap, sUSD, sBTC, sETH, sEUR, sUSD2):
+    synths = [swap.synths(i) for i in range(1, 7)]
+    assert synths == [sUSD, sBTC, sETH, sEUR, sUSD2, ZERO_ADDRESS]
+
+
+def test_best_route(swap_views, curve_susd, DAI, WBTC, sUSD, sBTC):
+    amount = 100_000 * 10 ** 18
+    route = swap_views.get_best_route(DAI, WBTC, amount)
+    default = swap_views.get_swap_route(DAI, WBTC, amount)
+
+    assert route["initial_synth"] == sUSD
+    assert route["initial_pool"] == curve_susd
+    assert route["final_synth"] == sBTC
+    assert route["amount"] > default["amount"]
+
+
+@pytest.mark.parametrize("amount", [10 ** 18, 10 ** 21, 10 ** 23])
+def test_never_worse_than_default(swap_views, DAI, WBTC, sBTC, amount):
+    for to in (WBTC, sBTC):
+        route = swap_views.get_best_route(DAI, to, amount)
+        assert route["amount"] >= swap_views.get_swap_route(DAI, to, amount)["amount"]
+
+
+def test_best_route_from_synth(swap_views, sUSD, sBTC):
+    route = swap_views.get_best_route(sUSD, sBTC, 10 ** 18)
+    assert route == swap_views.get_swap_route(sUSD, sBTC, 10 ** 18)
+
+
+def test_no_route(swap_views, WBTC, renBTC):
+    # both coins are only in the sBTC pool, so no synth exchange is possible
+    with brownie.reverts("dev: no route"):
+        swap_views.get_best_route(WBTC, renBTC, 10 ** 8)
+
+
+def test_swap_into_synth_via(alice, swap, swap_router, swap_views, DAI, sUSD, sBTC):
+    amount = 100_000 * 10 ** 18
+    route = swap_views.get_best_route(DAI, sBTC, amount)
+
+    tx = swap_router.swap_into_synth_via(
+        DAI, sBTC, amount, route["final_synth_amount"], sUSD, {"from": alice}
+    )
+    token_id = tx.return_value
+
+    assert swap.ownerOf(token_id) == alice
+    assert sBTC.balanceOf(Settler.at(hex(token_id))) == route["final_synth_amount"]
+    assert DAI.balanceOf(alice) == 900_000 * 10 ** 18
+    assert sUSD.balanceOf(swap_router) == 0
+
+
+def test_swap_into_synth_via_ignores_router_balance(
+    alice, bob, swap, swap_router, swap_views, DAI, sUSD, sBTC
+):
+    # synths sent to the router by mistake are not added to the swap
+    sUSD._mint_for_testing(bob, 10 ** 18)
+    sUSD.transfer(swap_router, 10 ** 18, {"from": bob})
+    amount = 100_000 * 10 ** 18
+    route = swap_views.get_best_route(DAI, sBTC, amount)
+
+    tx = swap_router.swap_into_synth_via(DAI, sBTC, amount, 0, sUSD, {"from": alice})
+
+    assert sBTC.balanceOf(hex(tx.return_value)) == route["final_synth_amount"]
+    assert sUSD.balanceOf(swap_router) == 10 ** 18
+
+
+def test_swap_into_synth_via_synth(alice, swap, swap_router, sUSD, sBTC):
+    sUSD._mint_for_testing(alice, 10 ** 18)
+    sUSD.approve(swap_router, 10 ** 18, {"from": alice})
+    expected = swap.get_swap_into_synth_amount(sUSD, sBTC, 10 ** 18)
+
+    tx = swap_router.swap_into_synth_via(sUSD, sBTC, 10 ** 18, 0, sUSD, {"from": alice})
+
+    assert sBTC.balanceOf(Settler.at(hex(tx.return_value))) == expected
+
+
+def test_swap_into_synth_via_coin_not_in_pool(alice, swap_router, DAI, sBTC, sETH):
+    with brownie.reverts("dev: coin not in pool"):
+        swap_router.swap_into_synth_via(DAI, sBTC, 10 ** 18, 0, sETH, {"from": alice})
+
+
+def test_swap_into_synth_via_unknown_synth(alice, swap_router, DAI, USDC, sBTC):
+    with brownie.reverts("dev: unknown synth"):
+        swap_router.swap_into_synth_via(DAI, sBTC, 10 ** 18, 0, USDC, {"from": alice})
+
+
+def test_quoter_best_route(swap, swap_views, sUSD, sBTC, sETH, sEUR, sUSD2, DAI, WBTC):
+    # synths are evaluated in the order they were added, regardless of this order
+    snapshot = take_snapshot(swap, [sUSD2, sEUR, sETH, sBTC, sUSD])
+    assert list(snapshot.pools) == [sUSD, sBTC, sETH, sEUR, sUSD2]
+    engine = QuoteEngine(snapshot)
+    amounts = [10 ** 18, 100_000 * 10 ** 18]
+
+    initial, final, result = engine.get_best_route(DAI, WBTC, amounts)
+    for i, amount in enumerate(amounts):
+        route = swap_views.get_best_route(DAI, WBTC, amount)
+        assert initial[i] == route["initial_synth"]
+        assert final[i] == route["final_synth"]
+        assert result[i] == route["amount"]
+
+    assert engine.get_best_route(DAI, WBTC, amounts[1]) == (
+        sUSD,
+        sBTC,
+        swap_views.get_best_route(DAI, WBTC, amounts[1])["amount"],
+    )
+
+
+def test_quoter_best_route_offset(swap, swap_views, sUSD2, sBTC, DAI, WBTC):
+    engine = QuoteEngine(take_snapshot(swap))
+    route = swap_views.get_best_route(DAI, WBTC, 10 ** 21, 1, 4)
+
+    assert engine.get_best_route(DAI, WBTC, 10 ** 21, offset=1, limit=4) == (
+        sUSD2,
+        sBTC,
+        route["amount"],
+    )
+
+
+def test_best_route_unlisted_synth(swap_views, sJPY, WBTC):
+    # the currency key of a synth that has not been added is not cached
+    with brownie.reverts("dev: no route"):
+        swap_views.get_best_route(sJPY, WBTC, 10 ** 21)
+
+
+def test_quoter_best_route_unlisted_synth(swap, exchanger, sJPY, sBTC, WBTC):
+    engine = QuoteEngine(take_snapshot(swap, unlisted_synths=[sJPY]))
+    synth_amount = exchanger.getAmountsForExchange(
+        10 ** 21, sJPY.currencyKey(), sBTC.currencyKey()
+    )[0]
+
+    # exchanged directly, as within `swap_into_synth`
+    assert engine.get_best_route(sJPY, WBTC, 10 ** 21) == (
+        sJPY,
+        sBTC,
+        swap.get_swap_from_synth_amount(sBTC, WBTC, synth_amount),
+    )
+
+
+def test_offset_and_limit(
+    alice, admin, swap, swap_views, registry, SynthMock, CurvePoolMock, DAI, WBTC, sBTC
+):
+    # five synths are already added, more than `MAX_SYNTHS` in total
+    for i in range(16):
+        symbol = f"sTEST{i}"
+        key = "0x" + symbol.encode().hex().ljust(64, "0")
+        synth = SynthMock.deploy(symbol, symbol, 18, key, {"from": admin})
+        coins = [synth] + [ZERO_ADDRESS] * 3
+        pool = CurvePoolMock.deploy(coins, 100, 4000000, {"from": admin})
+        registry.add_pool(pool, {"from": admin})
+        swap.add_synth(synth, pool, {"from": alice})
+
+    # adding synths does not prevent a route from being found
+    amount = 10 ** 18
+    assert swap_views.get_best_route(DAI, WBTC, amount)["final_synth"] == sBTC
+
+    # sUSD is skipped, so the shallower pool is used
+    route = swap_views.get_best_route(DAI, WBTC, amount, 1)
+    assert route["initial_synth"] == swap.synths(5)
+
+    # sBTC is skipped, and no other synth can be swapped into WBTC
+    with brownie.reverts("dev: no route"):
+        swap_views.get_best_route(DAI, WBTC, amount, 2)
@@ -0,0 +1,94 @@
+import brownie
+import pytest
+from brownie import Settler, chain
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, DAI, add_synths):
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def token_id(alice, swap, DAI, sBTC, setup):
+    tx = swap.swap_into_synth(DAI, sBTC, 1_000_000 * 10 ** 18, 0, {"from": alice})
+    chain.mine(timedelta=600)
+    yield tx.return_value
+
+
+def test_convert(swap, alice, exchanger, sBTC, sETH, token_id):
+    settler = Settler.at(hex(token_id))
+    amount = sBTC.balanceOf(settler)
+    expected = exchanger.getAmountsForExchange(
+        amount, sBTC.currencyKey(), sETH.currencyKey()
+    )[0]
+
+    tx = swap.convert_token(token_id, sETH, expected, {"from": alice})
+
+    assert tx.return_value == expected
+    assert sBTC.balanceOf(settler) == 0
+    assert sETH.balanceOf(settler) == expected
+    assert settler.synth() == sETH
+    assert swap.ownerOf(token_id) == alice
+    assert swap.token_info(token_id)["synth"] == sETH
+    assert tx.events["TokenUpdate"][-1].values() == [token_id, alice, sETH, expected]
+
+
+def test_requires_settlement(swap, alice, sBTC, sEUR, token_id):
+    swap.convert_token(token_id, sEUR, 0, {"from": alice})
+
+    assert not swap.is_settled(token_id)
+    assert swap.settle_ready_at(token_id) > chain[-1].timestamp
+
+    # the new synth cannot be converted again until the waiting period has passed
+    with brownie.reverts():
+        swap.convert_token(token_id, sBTC, 0, {"from": alice})
+
+
+def test_converts_settled_token(swap, alice, sETH, token_id):
+    swap.settle(token_id, {"from": alice})
+    swap.convert_token(token_id, sETH, 0, {"from": alice})
+
+    assert not swap.is_settled(token_id)
+
+
+def test_withdraw_after_convert(swap, alice, sETH, token_id):
+    amount = swap.convert_token(token_id, sETH, 0, {"from": alice}).return_value
+    chain.mine(timedelta=600)
+
+    swap.withdraw(token_id, amount, {"from": alice})
+
+    assert sETH.balanceOf(alice) == amount
+    with brownie.reverts():
+        swap.ownerOf(token_id)
+
+
+def test_operator(swap, alice, bob, sETH, token_id):
+    swap.approve(bob, token_id, {"from": alice})
+    swap.convert_token(token_id, sETH, 0, {"from": bob})
+
+    assert swap.ownerOf(token_id) == alice
+    assert swap.token_info(token_id)["synth"] == sETH
+
+
+def test_slippage(swap, alice, sBTC, sETH, token_id):
+    # 1 sBTC is worth 15 sETH
+    expected = sBTC.balanceOf(hex(token_id)) * 16
+
+    with brownie.reverts("Rekt by slippage"):
+        swap.convert_token(token_id, sETH, expected, {"from": alice})
+
+
+def test_same_synth(swap, alice, sBTC, token_id):
+    with brownie.reverts("dev: same synth"):
+        swap.convert_token(token_id, sBTC, 0, {"from": alice})
+
+
+def test_unknown_synth(swap, alice, DAI, token_id):
+    with brownie.reverts("dev: unknown synth"):
+        swap.convert_token(token_id, DAI, 0, {"from": alice})
+
+
+def test_caller_not_owner(swap, bob, sETH, token_id):
+    with brownie.reverts("Caller is not owner or operator"):
+        swap.convert_token(token_id, sETH, 0, {"from": bob})
@@ -0,0 +1,74 @@
+import brownie
+import pytest
+from brownie import ETH_ADDRESS, chain
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, DAI, USDT, EURS, add_synths):
+    for coin in (DAI, USDT, EURS):
+        coin._mint_for_testing(alice, 10 ** 30, {"from": alice})
+        coin.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+
+@pytest.mark.parametrize("idx", range(3))
+def test_swap_into_approves_pool(
+    alice, swap, DAI, USDT, EURS, sBTC, curve_susd, curve_seur, idx
+):
+    coin, pool = [(DAI, curve_susd), (USDT, curve_susd), (EURS, curve_seur)][idx]
+    amount = 10 ** coin.decimals()
+    expected = swap.get_swap_into_synth_amount(coin, sBTC, amount)
+
+    tx = swap.swap_into_synth(coin, sBTC, amount, 0, {"from": alice})
+    settler = hex(tx.return_value)
+
+    assert coin.allowance(swap, pool) > 0
+    assert abs(sBTC.balanceOf(settler) - expected) <= 1
+    assert coin.balanceOf(swap) == 0
+
+
+def test_swap_into_from_eth(alice, swap, sBTC, sETH, curve_seth):
+    tx = swap.swap_into_synth(
+        ETH_ADDRESS, sBTC, 10 ** 18, 0, {"from": alice, "value": 10 ** 18}
+    )
+
+    assert sBTC.balanceOf(hex(tx.return_value)) > 0
+    assert sETH.balanceOf(swap) == 0
+    assert swap.balance() == 0
+
+
+def test_swap_from_no_return_value(alice, bob, swap, settler_susd, sUSD, USDT):
+    # USDT does not return a value from `transfer`
+    token_id = int(settler_susd.address, 16)
+    chain.sleep(600)
+    expected = swap.get_swap_from_synth_amount(sUSD, USDT, 10 ** 18)
+    swap.swap_from_synth(token_id, USDT, 10 ** 18, 0, bob, {"from": alice})
+
+    assert abs(USDT.balanceOf(bob) - expected) <= 1
+    assert USDT.balanceOf(settler_susd) == 0
+
+
+def test_swap_from_into_eth(alice, bob, swap, settler_seth, sETH):
+    # settlers cannot receive ether, so this swap is routed via the registry swap
+    token_id = int(settler_seth.address, 16)
+    chain.sleep(600)
+    expected = swap.get_swap_from_synth_amount(sETH, ETH_ADDRESS, 10 ** 18)
+    initial = bob.balance()
+    swap.swap_from_synth(token_id, ETH_ADDRESS, 10 ** 18, 0, bob, {"from": alice})
+
+    assert abs(bob.balance() - initial - expected) <= 1
+    assert settler_seth.balance() == 0
+
+
+def test_swap_from_coin_not_in_pool(alice, swap, settler_sbtc, DAI):
+    token_id = int(settler_sbtc.address, 16)
+    chain.sleep(600)
+    with brownie.reverts("dev: coin not in pool"):
+        swap.swap_from_synth(token_id, DAI, 10 ** 18, 0, {"from": alice})
+
+
+def test_swap_from_respects_expected(alice, swap, settler_sbtc, sBTC, WBTC):
+    token_id = int(settler_sbtc.address, 16)
+    chain.sleep(600)
+    expected = swap.get_swap_from_synth_amount(sBTC, WBTC, 10 ** 18)
+    with brownie.reverts():
+        swap.swap_from_synth(token_id, WBTC, 10 ** 18, expected + 2, {"from": alice})
@@ -0,0 +1,123 @@
+import brownie
+import pytest
+
+
+@pytest.fixture(scope="module")
+def token_ids(alice, bob, swap, DAI, sBTC, sETH, add_synths):
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+    token_ids = []
+    for synth, receiver in [(sBTC, alice), (sETH, bob), (sBTC, alice), (sETH, bob)]:
+        tx = swap.swap_into_synth(
+            DAI, synth, 250_000 * 10 ** 18, 0, receiver, {"from": alice}
+        )
+        token_ids.append(tx.return_value)
+
+    return token_ids
+
+
+def _all_tokens(swap):
+    return [swap.tokenByIndex(i) for i in range(swap.totalSupply())]
+
+
+def _tokens_of(swap, owner):
+    return [swap.tokenOfOwnerByIndex(owner, i) for i in range(swap.balanceOf(owner))]
+
+
+def test_initial_state(swap):
+    assert swap.totalSupply() == 0
+
+    with brownie.reverts():
+        swap.tokenByIndex(0)
+
+
+def test_mint(swap, alice, bob, token_ids):
+    assert swap.totalSupply() == 4
+    assert _all_tokens(swap) == token_ids
+    assert _tokens_of(swap, alice) == token_ids[::2]
+    assert _tokens_of(swap, bob) == token_ids[1::2]
+
+
+def test_index_out_of_range(swap, alice, charlie, token_ids):
+    with brownie.reverts():
+        swap.tokenByIndex(4)
+    with brownie.reverts():
+        swap.tokenOfOwnerByIndex(alice, 2)
+    with brownie.reverts():
+        swap.tokenOfOwnerByIndex(charlie, 0)
+
+
+def test_transfer(swap, alice, bob, charlie, token_ids):
+    swap.transferFrom(alice, charlie, token_ids[0], {"from": alice})
+
+    assert _all_tokens(swap) == token_ids
+    assert _tokens_of(swap, alice) == [token_ids[2]]
+    assert _tokens_of(swap, charlie) == [token_ids[0]]
+
+
+@pytest.mark.parametrize("idx", range(4))
+def test_burn(chain, swap, alice, bob, sBTC, sETH, token_ids, idx):
+    chain.sleep(600)
+    owner = [alice, bob][idx % 2]
+    synth = [sBTC, sETH][idx % 2]
+    token_id = token_ids[idx]
+    swap.withdraw(token_id, synth.balanceOf(hex(token_id)), {"from": owner})
+
+    remaining = token_ids[:idx] + token_ids[idx + 1 :]
+    assert swap.totalSupply() == 3
+    assert sorted(_all_tokens(swap)) == sorted(remaining)
+    assert sorted(_tokens_of(swap, owner)) == sorted(
+        [i for i in remaining if i in token_ids[idx % 2 :: 2]]
+    )
+
+    # remaining tokens keep a valid index after being moved
+    for token_id in remaining:
+        owner = swap.ownerOf(token_id)
+        swap.transferFrom(owner, owner, token_id, {"from": owner})
+    assert sorted(_all_tokens(swap)) == sorted(remaining)
+
+
+def test_burn_all(chain, swap, alice, bob, sBTC, sETH, token_ids):
+    chain.sleep(600)
+    for i, token_id in enumerate(token_ids):
+        synth = [sBTC, sETH][i % 2]
+        owner = [alice, bob][i % 2]
+        swap.withdraw(token_id, synth.balanceOf(hex(token_id)), {"from": owner})
+
+    assert swap.totalSupply() == 0
+    assert swap.balanceOf(alice) == 0
+    assert swap.balanceOf(bob) == 0
+
+
+def test_burned_slots_are_not_exposed(chain, swap, alice, DAI, sBTC, token_ids):
+    # the final slots vacated by a burn are not cleared, but are unreachable
+    # until they are overwritten by the next mint
+    chain.sleep(600)
+    swap.withdraw(token_ids[2], 2 ** 256 - 1, {"from": alice})
+
+    with brownie.reverts():
+        swap.tokenByIndex(3)
+    with brownie.reverts():
+        swap.tokenOfOwnerByIndex(alice, 1)
+
+    DAI._mint_for_testing(alice, 10 ** 18)
+    tx = swap.swap_into_synth(DAI, sBTC, 10 ** 18, 0, {"from": alice})
+    assert swap.tokenByIndex(3) == tx.return_value
+    assert swap.tokenOfOwnerByIndex(alice, 1) == tx.return_value
+    assert _tokens_of(swap, alice) == [token_ids[0], tx.return_value]
+
+
+def test_transfer_gas_is_bounded(swap, alice, bob, DAI, sBTC, token_ids):
+    # the cost of a transfer must not depend on the number of NFTs held
+    tx = swap.transferFrom(alice, bob, token_ids[0], {"from": alice})
+    base_gas = tx.gas_used
+
+    DAI._mint_for_testing(alice, 10 ** 18)
+    for i in range(10):
+        swap.swap_into_synth(DAI, sBTC, 10 ** 17, 0, bob, {"from": alice})
+
+    # the transfer back may be cheaper, as the vacated owner slot of alice
+    # was not cleared by the first transfer
+    tx = swap.transferFrom(bob, alice, token_ids[0], {"from": bob})
+    assert tx.gas_used - base_gas < 10_000
@@ -0,0 +1,39 @@
+import brownie
+import pytest
+from brownie import ETH_ADDRESS
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(add_synths):
+    pass
+
+
+@pytest.mark.parametrize("amount", [10 ** 6, 10 ** 18, 10 ** 22])
+def test_swap_from_synth_uses_pool_indices(
+    swap, curve_susd, sUSD, DAI, USDC, USDT, amount
+):
+    # sUSD pool coins: DAI, USDC, USDT, sUSD
+    for idx, coin in enumerate([DAI, USDC, USDT]):
+        expected = curve_susd.get_dy(3, idx, amount)
+        assert swap.get_swap_from_synth_amount(sUSD, coin, amount) == expected
+
+
+def test_swap_into_synth_uses_pool_indices(swap, curve_seth, sETH):
+    # sETH pool coins: ETH, sETH
+    amount = 10 ** 18
+    expected = swap.get_swap_into_synth_amount(
+        sETH, sETH, curve_seth.get_dy(0, 1, amount)
+    )
+    assert swap.get_swap_into_synth_amount(ETH_ADDRESS, sETH, amount) == expected
+
+
+def test_swap_from_synth_coin_not_in_pool(swap, sBTC, DAI):
+    with brownie.reverts("dev: coin not in pool"):
+        swap.get_swap_from_synth_amount(sBTC, DAI, 10 ** 18)
+
+
+def test_swap_into_synth_unknown_coin(swap, sBTC):
+    with brownie.reverts():
+        swap.get_swap_into_synth_amount(
+            "0x47bD14817d7684082E04934878EE2Dd3576Ae19d", sBTC, 10 ** 18
+        )
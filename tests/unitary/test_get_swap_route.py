@@ -0,0 +1,91 @@
+import brownie
+import pytest
+
+MAX_QUERY_SIZE = 50
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(add_synths):
+    pass
+
+
+def test_route(swap_views, exchanger, curve_susd, curve_sbtc, DAI, WBTC, sUSD, sBTC):
+    amount = 100_000 * 10 ** 18
+    route = swap_views.get_swap_route(DAI, WBTC, amount)
+
+    susd_amount = curve_susd.get_dy(0, 3, amount)
+    sbtc_amount, fee, _ = exchanger.getAmountsForExchange(
+        susd_amount, sUSD.currencyKey(), sBTC.currencyKey()
+    )
+
+    assert route["initial_synth"] == sUSD
+    assert route["initial_pool"] == curve_susd
+    assert route["initial_synth_amount"] == susd_amount
+    assert route["final_synth"] == sBTC
+    assert route["final_pool"] == curve_sbtc
+    assert route["final_synth_amount"] == sbtc_amount
+    assert route["exchange_fee"] == fee
+    assert route["amount"] == curve_sbtc.get_dy(2, 1, sbtc_amount)
+
+
+def test_matches_swap_quotes(swap, swap_views, DAI, WBTC, sBTC):
+    amount = 100_000 * 10 ** 18
+    route = swap_views.get_swap_route(DAI, WBTC, amount)
+
+    assert route["final_synth_amount"] == swap.get_swap_into_synth_amount(
+        DAI, sBTC, amount
+    )
+    assert route["amount"] == swap.get_estimated_swap_amount(DAI, WBTC, amount)
+
+
+def test_from_synth(swap_views, sUSD, sBTC):
+    amount = 100_000 * 10 ** 18
+    route = swap_views.get_swap_route(sUSD, sBTC, amount)
+
+    assert route["initial_synth_amount"] == amount
+    assert route["amount"] == route["final_synth_amount"]
+
+
+def test_to_synth(swap, swap_views, USDT, sETH):
+    amount = 100_000 * 10 ** 6
+    route = swap_views.get_swap_route(USDT, sETH, amount)
+
+    assert route["final_synth"] == sETH
+    assert route["amount"] == route["final_synth_amount"]
+    assert route["amount"] == swap.get_swap_into_synth_amount(USDT, sETH, amount)
+
+
+def test_route_amounts(swap_views, DAI, WBTC):
+    amounts = [i * 10_000 * 10 ** 18 for i in range(1, 11)]
+    result = swap_views.get_swap_route_amounts(
+        DAI, WBTC, amounts + [0] * (MAX_QUERY_SIZE - len(amounts))
+    )
+
+    for i, amount in enumerate(amounts):
+        route = swap_views.get_swap_route(DAI, WBTC, amount)
+        assert result[0][i] == route["initial_synth_amount"]
+        assert result[1][i] == route["final_synth_amount"]
+        assert result[2][i] == route["exchange_fee"]
+        assert result[3][i] == route["amount"]
+
+    assert set(x for i in result for x in i[len(amounts) :]) == {0}
+
+
+def test_unknown_coin(swap_views, sBTC):
+    with brownie.reverts("dev: unknown coin"):
+        swap_views.get_swap_route(
+            sBTC, "0x47bD14817d7684082E04934878EE2Dd3576Ae19d", 10 ** 18
+        )
+
+
+def test_unlisted_synth(swap_views, sJPY, sBTC):
+    # the currency key of a synth that is not added is not cached
+    with brownie.reverts("dev: unknown coin"):
+        swap_views.get_swap_route(sJPY, sBTC, 10 ** 18)
+
+
+def test_not_a_synth(swap_views, sBTC):
+    with brownie.reverts():
+        swap_views.get_swap_route(
+            "0x47bD14817d7684082E04934878EE2Dd3576Ae19d", sBTC, 10 ** 18
+        )
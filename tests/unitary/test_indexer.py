@@ -0,0 +1,210 @@
+import pytest
+from brownie import chain
+
+from indexer import EventIndexer, get_waiting_period, settle_ready_at, tokens_due
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, bob, swap, DAI, add_synths):
+    for acct in (alice, bob):
+        DAI._mint_for_testing(acct, 10 ** 24)
+        DAI.approve(swap, 2 ** 256 - 1, {"from": acct})
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path.joinpath("synthswap.db"))
+
+
+@pytest.fixture
+def indexer(swap, path):
+    yield EventIndexer(swap, path, confirmations=0, batch_size=3)
+
+
+def _assert_matches_chain(indexer, swap, accounts):
+    store = indexer.store
+    for acct in accounts:
+        token_ids = [
+            swap.tokenOfOwnerByIndex(acct, i) for i in range(swap.balanceOf(acct))
+        ]
+        assert store.tokens_of_owner(acct) == sorted(token_ids)
+
+        for token_id in store.tokens_of_owner(acct):
+            token = store.get_token(token_id)
+            info = swap.token_info(token_id)
+            assert token.owner == info["owner"]
+            assert token.synth == info["synth"]
+            assert token.balance == info["underlying_balance"]
+
+    assert len(store.available_token_ids()) == swap.available_settlers()
+
+
+def test_initial_state(indexer, swap):
+    indexer.sync()
+
+    # the `swap` fixture deploys 3 settlers
+    assert len(indexer.store.settlers()) == 3
+    assert indexer.store.available_token_ids() == [
+        int(i, 16) for i in indexer.store.settlers()
+    ]
+    assert indexer.store.checkpoint == chain.height
+
+
+def test_swaps(indexer, alice, bob, swap, DAI, sBTC, sETH):
+    for i in range(5):
+        swap.swap_into_synth(DAI, [sBTC, sETH][i % 2], 10 ** 21, 0, {"from": alice})
+    swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": bob})
+
+    indexer.sync()
+    _assert_matches_chain(indexer, swap, [alice, bob])
+    assert len(indexer.store.settlers()) == 6
+
+
+def test_transfer_and_burn(indexer, alice, bob, swap, DAI, sBTC):
+    token_ids = [
+        swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice}).return_value
+        for i in range(3)
+    ]
+    chain.sleep(600)
+    swap.transferFrom(alice, bob, token_ids[0], {"from": alice})
+    balance = swap.token_info(token_ids[1])["underlying_balance"]
+    swap.withdraw(token_ids[1], balance, {"from": alice})
+    swap.withdraw(token_ids[2], balance // 2, {"from": alice})
+
+    indexer.sync()
+    _assert_matches_chain(indexer, swap, [alice, bob])
+
+    assert indexer.store.get_token(token_ids[1]) is None
+    assert indexer.store.get_token(token_ids[2]).settled
+    assert not indexer.store.get_token(token_ids[0]).settled
+    assert [i.token_id for i in indexer.store.unsettled_tokens()] == [token_ids[0]]
+
+
+def test_next_token_id(indexer, alice, swap, DAI, sBTC):
+    token_id = swap.swap_into_synth(
+        DAI, sBTC, 10 ** 21, 0, {"from": alice}
+    ).return_value
+    chain.sleep(600)
+    balance = swap.token_info(token_id)["underlying_balance"]
+    swap.withdraw(token_id, balance, {"from": alice})
+
+    indexer.sync()
+    expected = indexer.store.available_token_ids()[-1]
+    assert expected == token_id + 2 ** 160
+
+    tx = swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice})
+    assert tx.return_value == expected
+
+
+def test_incremental_sync(indexer, alice, swap, DAI, sBTC):
+    swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice})
+    indexer.sync()
+    checkpoint = indexer.store.checkpoint
+
+    swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice})
+    assert indexer.sync() == 2
+    assert indexer.store.checkpoint > checkpoint
+    _assert_matches_chain(indexer, swap, [alice])
+
+
+def test_resume_from_checkpoint(swap, path, alice, DAI, sBTC):
+    swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice})
+    indexer = EventIndexer(swap, path, confirmations=0)
+    indexer.sync()
+    indexer.store.close()
+
+    # a restarted indexer reads the existing state and only applies new events
+    indexer = EventIndexer(swap, path, confirmations=0)
+    assert indexer.store.tokens_of_owner(alice) == [swap.tokenOfOwnerByIndex(alice, 0)]
+    assert indexer.sync() == 0
+
+    swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice})
+    assert indexer.sync() == 2
+    _assert_matches_chain(indexer, swap, [alice])
+
+
+def test_confirmations(swap, path, alice, DAI, sBTC):
+    indexer = EventIndexer(swap, path, confirmations=2)
+    swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice})
+    indexer.sync()
+
+    assert indexer.store.checkpoint == chain.height - 2
+    assert indexer.store.tokens_of_owner(alice) == []
+
+
+def test_store_is_bound_to_swap(SynthSwap, swap, path, alice, settler_implementation):
+    EventIndexer(swap, path, confirmations=0).sync()
+
+    other = SynthSwap.deploy(settler_implementation, 0, {"from": alice})
+    with pytest.raises(ValueError):
+        EventIndexer(other, path)
+
+
+def test_convert_token(indexer, alice, swap, DAI, sBTC, sETH):
+    token_id = swap.swap_into_synth(
+        DAI, sBTC, 10 ** 21, 0, {"from": alice}
+    ).return_value
+    chain.mine(timedelta=600)
+    swap.settle(token_id, {"from": alice})
+    swap.withdraw(token_id, 10 ** 6, {"from": alice})
+    indexer.sync()
+    assert indexer.store.get_token(token_id).settled
+
+    # a conversion may reduce the balance, but still requires settlement
+    tx = swap.convert_token(token_id, sETH, 0, {"from": alice})
+    indexer.sync()
+
+    token = indexer.store.get_token(token_id)
+    assert token.synth == sETH
+    assert not token.settled
+    assert token.converted_at == tx.timestamp
+    _assert_matches_chain(indexer, swap, [alice])
+
+
+def test_merge_and_split(indexer, alice, swap, DAI, sBTC):
+    token_ids = [
+        swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice}).return_value
+        for i in range(3)
+    ]
+    chain.mine(timedelta=600)
+    tx = swap.merge(token_ids[1:] + [0] * 8, token_ids[0], {"from": alice})
+    amount = tx.return_value // 2
+    new_id = swap.split(token_ids[0], amount, {"from": alice}).return_value
+
+    indexer.sync()
+    _assert_matches_chain(indexer, swap, [alice])
+    assert indexer.store.get_token(token_ids[1]) is None
+    assert indexer.store.get_token(new_id).settled
+    assert indexer.store.unsettled_tokens() == []
+
+    # merging into an unsettled token does not change its waiting period
+    tx = swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice})
+    swap.merge([new_id] + [0] * 9, tx.return_value, {"from": alice})
+    indexer.sync()
+
+    token = indexer.store.get_token(tx.return_value)
+    assert not token.settled
+    assert token.converted_at == tx.timestamp
+    _assert_matches_chain(indexer, swap, [alice])
+
+
+def test_settle_ready_at(indexer, alice, swap, exchanger, DAI, sBTC):
+    token_ids = [
+        swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice}).return_value
+        for i in range(3)
+    ]
+    chain.mine(timedelta=600)
+    swap.withdraw(token_ids[0], 10 ** 6, {"from": alice})
+    swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, alice, token_ids[1], {"from": alice})
+
+    indexer.sync()
+    waiting_period = get_waiting_period()
+    assert waiting_period == exchanger.waitingPeriodSecs()
+
+    for token_id in token_ids:
+        token = indexer.store.get_token(token_id)
+        assert settle_ready_at(token, waiting_period) == swap.settle_ready_at(token_id)
+
+    timestamp = swap.settle_ready_at(token_ids[2])
+    due = tokens_due(indexer.store, waiting_period, timestamp)
+    assert [i.token_id for i in due] == [token_ids[2]]
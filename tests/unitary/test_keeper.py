@@ -0,0 +1,232 @@
+import asyncio
+
+import pytest
+from brownie import chain
+
+from indexer import EventIndexer
+from scripts.keeper import RETRY_DELAY, SettlementKeeper
+
+
+@pytest.fixture(scope="module", autouse=True)
+def skip_if_forked(is_forked):
+    if is_forked:
+        pytest.skip("timings assume the 5 minute waiting period of the mock exchanger")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, DAI, add_synths):
+    DAI._mint_for_testing(alice, 10 ** 24)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+
+@pytest.fixture
+def keeper(swap, charlie, tmp_path):
+    indexer = EventIndexer(swap, str(tmp_path.joinpath("keeper.db")), confirmations=0)
+    yield SettlementKeeper(swap, indexer, charlie)
+
+
+def _advance(seconds):
+    # mine a block `seconds` after the latest block
+    chain.mine(timestamp=chain[-1].timestamp + seconds)
+
+
+def _swap(swap, alice, DAI, sBTC, count):
+    return [
+        swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice}).return_value
+        for i in range(count)
+    ]
+
+
+def test_schedules_unsettled_tokens(keeper, alice, swap, DAI, sBTC):
+    token_ids = _swap(swap, alice, DAI, sBTC, 3)
+
+    assert keeper.refresh() == 3
+    assert sorted(keeper.queue) == sorted(
+        (swap.settle_ready_at(i), i) for i in token_ids
+    )
+
+    # already scheduled tokens are not added again
+    assert keeper.refresh() == 0
+
+
+def test_nothing_ready_during_waiting_period(keeper, alice, swap, DAI, sBTC):
+    _swap(swap, alice, DAI, sBTC, 3)
+    keeper.refresh()
+
+    assert keeper.pop_ready() == []
+    assert len(keeper.queue) == 3
+
+
+def test_settle_in_batches(keeper, alice, swap, DAI, sBTC):
+    token_ids = _swap(swap, alice, DAI, sBTC, 12)
+    keeper.refresh()
+    _advance(301)
+
+    settled = asyncio.run(keeper.run_once())
+
+    assert sorted(settled) == sorted(token_ids)
+    assert all(swap.is_settled(i) for i in token_ids)
+    assert keeper.queue == []
+
+
+def test_settle_in_order_of_readiness(keeper, alice, swap, DAI, sBTC):
+    first = _swap(swap, alice, DAI, sBTC, 2)
+    _advance(150)
+    second = _swap(swap, alice, DAI, sBTC, 2)
+    keeper.refresh()
+
+    _advance(160)
+    assert sorted(asyncio.run(keeper.run_once())) == sorted(first)
+    assert not any(swap.is_settled(i) for i in second)
+
+    _advance(150)
+    assert sorted(asyncio.run(keeper.run_once())) == sorted(second)
+
+
+def test_skips_settled_and_burned(keeper, alice, swap, DAI, sBTC):
+    token_ids = _swap(swap, alice, DAI, sBTC, 3)
+    keeper.refresh()
+    _advance(301)
+
+    swap.settle(token_ids[0], {"from": alice})
+    balance = swap.token_info(token_ids[1])["underlying_balance"]
+    swap.withdraw(token_ids[1], balance, {"from": alice})
+
+    assert asyncio.run(keeper.run_once()) == [token_ids[2]]
+
+
+def test_reschedules_topped_up_token(keeper, alice, swap, DAI, sBTC):
+    token_id = _swap(swap, alice, DAI, sBTC, 1)[0]
+    keeper.refresh()
+
+    _advance(301)
+    swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, alice, token_id, {"from": alice})
+
+    assert asyncio.run(keeper.run_once()) == []
+    assert [i[1] for i in keeper.queue] == [token_id]
+
+    _advance(301)
+    assert asyncio.run(keeper.run_once()) == [token_id]
+    assert swap.is_settled(token_id)
+
+
+class _RevertingSwap:
+    """
+    Wraps `SynthSwap` so that the first `count` calls to `method` revert,
+    by replacing the given token IDs with one that does not exist.
+    """
+
+    def __init__(self, swap, method, count=1):
+        self._swap = swap
+        self._method = method
+        self.count = count
+
+    def __getattr__(self, name):
+        fn = getattr(self._swap, name)
+        if name != self._method:
+            return fn
+
+        def call(token_ids, *args):
+            if self.count:
+                self.count -= 1
+                unknown = 2 ** 256 - 1
+                token_ids = [unknown] * len(token_ids) if args else unknown
+            return fn(token_ids, *args)
+
+        return call
+
+
+def test_failed_batch_is_retried(keeper, alice, swap, DAI, sBTC):
+    token_ids = _swap(swap, alice, DAI, sBTC, 20)
+    keeper.refresh()
+    _advance(301)
+
+    keeper.swap = _RevertingSwap(swap, "settle_many")
+    settled = asyncio.run(keeper.run_once())
+
+    # only the batch that reverted is rescheduled
+    assert len(settled) == 10
+    assert sorted(i[1] for i in keeper.queue) == sorted(set(token_ids) - set(settled))
+    assert not any(swap.is_settled(i[1]) for i in keeper.queue)
+
+    assert asyncio.run(keeper.run_once()) == []
+    _advance(RETRY_DELAY)
+    assert len(asyncio.run(keeper.run_once())) == 10
+    assert all(swap.is_settled(i) for i in token_ids)
+
+
+def test_failed_check_is_dropped(keeper, alice, swap, DAI, sBTC):
+    token_ids = _swap(swap, alice, DAI, sBTC, 2)
+    keeper.refresh()
+    _advance(301)
+
+    keeper.swap = _RevertingSwap(swap, "settle_ready_at")
+    settled = asyncio.run(keeper.run_once())
+
+    # the token that could not be checked is scheduled again on refresh
+    assert len(settled) == 1
+    assert keeper.queue == []
+    assert sorted(asyncio.run(keeper.run_once()) + settled) == sorted(token_ids)
+
+
+def test_token_burned_before_settlement(keeper, alice, swap, DAI, sBTC):
+    token_ids = _swap(swap, alice, DAI, sBTC, 3)
+    keeper.refresh()
+    _advance(301)
+    ready = keeper.pop_ready()
+
+    # the token is burned after it was checked, so the batch reverts
+    balance = swap.token_info(token_ids[0])["underlying_balance"]
+    swap.withdraw(token_ids[0], balance, {"from": alice})
+    assert asyncio.run(keeper.settle(ready)) == []
+
+    _advance(RETRY_DELAY)
+    assert sorted(asyncio.run(keeper.run_once())) == sorted(token_ids[1:])
+
+
+class _CountingSwap:
+    """Wraps `SynthSwap`, recording the token IDs checked with `settle_ready_at`."""
+
+    def __init__(self, swap):
+        self._swap = swap
+        self.checked = []
+
+    def __getattr__(self, name):
+        return getattr(self._swap, name)
+
+    def settle_ready_at(self, token_id):
+        self.checked.append(token_id)
+        return self._swap.settle_ready_at(token_id)
+
+
+def test_settled_tokens_are_not_checked_again(keeper, alice, swap, DAI, sBTC):
+    token_ids = _swap(swap, alice, DAI, sBTC, 3)
+    keeper.refresh()
+    _advance(301)
+    swap.settle(token_ids[0], {"from": alice})
+
+    keeper.swap = _CountingSwap(swap)
+    assert sorted(asyncio.run(keeper.run_once())) == sorted(token_ids[1:])
+    assert sorted(keeper.swap.checked) == sorted(token_ids)
+
+    # tokens settled by the keeper or by another caller are recorded in the store
+    assert keeper.indexer.store.unsettled_tokens() == []
+    _advance(301)
+    assert asyncio.run(keeper.run_once()) == []
+    assert len(keeper.swap.checked) == 3
+    assert keeper.queue == []
+
+
+def test_settled_token_is_scheduled_after_conversion(keeper, alice, swap, DAI, sBTC):
+    token_id = _swap(swap, alice, DAI, sBTC, 1)[0]
+    keeper.refresh()
+    _advance(301)
+    assert asyncio.run(keeper.run_once()) == [token_id]
+
+    swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, alice, token_id, {"from": alice})
+    assert asyncio.run(keeper.run_once()) == []
+    assert [i[1] for i in keeper.queue] == [token_id]
+
+    _advance(301)
+    assert asyncio.run(keeper.run_once()) == [token_id]
+    assert swap.is_settled(token_id)
@@ -0,0 +1,137 @@
+import brownie
+import pytest
+from brownie import chain
+
+MAX_BATCH_SIZE = 10
+
+
+def _pad(token_ids):
+    return token_ids + [0] * (MAX_BATCH_SIZE - len(token_ids))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, DAI, add_synths):
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def token_ids(alice, swap, DAI, sBTC, setup):
+    token_ids = [
+        swap.swap_into_synth(
+            DAI, sBTC, 100_000 * 10 ** 18, 0, {"from": alice}
+        ).return_value
+        for i in range(4)
+    ]
+    chain.mine(timedelta=600)
+    yield token_ids
+
+
+def test_merge(swap, alice, sBTC, token_ids):
+    balance = sum(sBTC.balanceOf(hex(i)) for i in token_ids)
+
+    tx = swap.merge(_pad(token_ids[1:]), token_ids[0], {"from": alice})
+
+    assert tx.return_value == balance
+    assert sBTC.balanceOf(hex(token_ids[0])) == balance
+    assert swap.balanceOf(alice) == 1
+    assert swap.tokenOfOwnerByIndex(alice, 0) == token_ids[0]
+    assert tx.events["TokenUpdate"][-1].values() == [token_ids[0], alice, sBTC, balance]
+    assert [i.values() for i in tx.events["BalanceTransfer"]] == [
+        [i, token_ids[0]] for i in token_ids[1:]
+    ]
+
+
+def test_merged_tokens_are_burned(swap, alice, sBTC, token_ids):
+    swap.merge(_pad(token_ids[1:]), token_ids[0], {"from": alice})
+
+    for token_id in token_ids[1:]:
+        assert sBTC.balanceOf(hex(token_id)) == 0
+        with brownie.reverts():
+            swap.ownerOf(token_id)
+
+
+def test_settlers_are_released(swap, alice, DAI, sBTC, token_ids):
+    available = swap.available_settlers()
+    swap.merge(_pad(token_ids[1:]), token_ids[0], {"from": alice})
+
+    assert swap.available_settlers() == available + 3
+
+    # the last released settler is the first to be reused
+    tx = swap.swap_into_synth(DAI, sBTC, 10 ** 18, 0, {"from": alice})
+    assert tx.return_value == token_ids[-1] + 2 ** 160
+
+
+def test_merge_settled(swap, alice, sBTC, token_ids):
+    swap.settle_many(_pad(token_ids), {"from": alice})
+    balance = sum(sBTC.balanceOf(hex(i)) for i in token_ids)
+
+    tx = swap.merge(_pad(token_ids[:2]), token_ids[2], {"from": alice})
+
+    assert tx.return_value == sBTC.balanceOf(hex(token_ids[2]))
+    assert tx.return_value + sBTC.balanceOf(hex(token_ids[3])) == balance
+
+
+def test_merge_into_unsettled(swap, alice, DAI, sBTC, token_ids):
+    into_id = swap.swap_into_synth(DAI, sBTC, 10 ** 18, 0, {"from": alice}).return_value
+
+    swap.merge(_pad(token_ids), into_id, {"from": alice})
+
+    # the merged balances are settled, but the waiting period of `into_id` is unchanged
+    assert not swap.is_settled(into_id)
+    assert swap.token_info(into_id)["time_to_settle"] > 0
+    assert swap.balanceOf(alice) == 1
+
+
+def test_cannot_merge_unsettled(swap, alice, DAI, sBTC, token_ids):
+    token_id = swap.swap_into_synth(
+        DAI, sBTC, 10 ** 18, 0, {"from": alice}
+    ).return_value
+
+    with brownie.reverts():
+        swap.merge(_pad([token_id]), token_ids[0], {"from": alice})
+
+
+def test_operator(swap, alice, bob, sBTC, token_ids):
+    swap.setApprovalForAll(bob, True, {"from": alice})
+    swap.merge(_pad(token_ids[1:]), token_ids[0], {"from": bob})
+
+    assert swap.ownerOf(token_ids[0]) == alice
+    assert swap.balanceOf(alice) == 1
+
+
+def test_different_synth(swap, alice, DAI, sETH, token_ids):
+    token_id = swap.swap_into_synth(
+        DAI, sETH, 10 ** 18, 0, {"from": alice}
+    ).return_value
+    chain.mine(timedelta=600)
+
+    with brownie.reverts("dev: owner or synth mismatch"):
+        swap.merge(_pad([token_id]), token_ids[0], {"from": alice})
+
+
+def test_different_owner(swap, alice, bob, token_ids):
+    # an operator of both owners cannot move balances between them
+    swap.transferFrom(alice, bob, token_ids[1], {"from": alice})
+    swap.setApprovalForAll(alice, True, {"from": bob})
+
+    with brownie.reverts("dev: owner or synth mismatch"):
+        swap.merge(_pad(token_ids[1:2]), token_ids[0], {"from": alice})
+
+
+def test_merge_into_self(swap, alice, token_ids):
+    with brownie.reverts("dev: cannot merge into self"):
+        swap.merge(_pad(token_ids), token_ids[0], {"from": alice})
+
+
+def test_caller_not_owner(swap, bob, token_ids):
+    with brownie.reverts("Caller is not owner or operator"):
+        swap.merge(_pad(token_ids[1:]), token_ids[0], {"from": bob})
+
+
+def test_caller_not_owner_of_merged(swap, alice, bob, token_ids):
+    # approval for `_into_id` does not allow merging other tokens into it
+    swap.approve(bob, token_ids[0], {"from": alice})
+
+    with brownie.reverts("Caller is not owner or operator"):
+        swap.merge(_pad(token_ids[1:]), token_ids[0], {"from": bob})
@@ -0,0 +1,64 @@
+import brownie
+import pytest
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, DAI, add_synths):
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+
+def test_available_settlers(swap):
+    # the `swap` fixture deploys 3 settlers
+    assert swap.available_settlers() == 3
+
+
+def test_prewarm(swap, bob):
+    tx = swap.prewarm_settlers(5, {"from": bob})
+
+    assert tx.return_value == 8
+    assert swap.available_settlers() == 8
+    assert len(tx.events["NewSettler"]) == 5
+    assert tx.events["SettlersDeployed"].values() == [bob, 5, 8]
+
+
+def test_prewarm_zero(swap, bob):
+    tx = swap.prewarm_settlers(0, {"from": bob})
+
+    assert swap.available_settlers() == 3
+    assert "NewSettler" not in tx.events
+
+
+def test_prewarm_max(swap, bob):
+    with brownie.reverts("dev: too many settlers"):
+        swap.prewarm_settlers(101, {"from": bob})
+
+
+def test_swaps_use_prewarmed_settlers(swap, alice, bob, DAI, sBTC):
+    swap.prewarm_settlers(2, {"from": bob})
+
+    for i in range(5):
+        tx = swap.swap_into_synth(DAI, sBTC, 100_000 * 10 ** 18, 0, {"from": alice})
+        assert "NewSettler" not in tx.events
+
+    assert swap.available_settlers() == 0
+    tx = swap.swap_into_synth(DAI, sBTC, 100_000 * 10 ** 18, 0, {"from": alice})
+    assert "NewSettler" in tx.events
+
+
+def test_prewarmed_token_ids_are_unique(swap, alice, bob, DAI, sBTC):
+    tx = swap.prewarm_settlers(3, {"from": bob})
+    settlers = {i["addr"] for i in tx.events["NewSettler"]}
+
+    token_ids = set()
+    for i in range(6):
+        tx = swap.swap_into_synth(DAI, sBTC, 100_000 * 10 ** 18, 0, {"from": alice})
+        token_ids.add(tx.return_value)
+
+    assert len(token_ids) == 6
+    assert settlers < {brownie.convert.to_address(hex(i % 2 ** 160)) for i in token_ids}
+
+
+def test_constructor_max_settlers(SynthSwap, alice, settler_implementation):
+    with brownie.reverts():
+        SynthSwap.deploy(settler_implementation, 101, {"from": alice})
@@ -0,0 +1,85 @@
+import itertools
+
+import pytest
+from brownie import ETH_ADDRESS
+
+from quoter import QuoteEngine, take_snapshot
+
+AMOUNTS = [10 ** 6, 10 ** 18, 31337 * 10 ** 18, 2_500_000 * 10 ** 18]
+
+
+@pytest.fixture(scope="module")
+def synths(sUSD, sBTC, sETH, sEUR):
+    return [sUSD, sBTC, sETH, sEUR]
+
+
+@pytest.fixture(scope="module")
+def coins(DAI, USDT, WBTC, EURS):
+    return [DAI, USDT, WBTC, EURS, ETH_ADDRESS]
+
+
+@pytest.fixture(scope="module")
+def engine(swap, synths, add_synths):
+    return QuoteEngine(take_snapshot(swap, synths))
+
+
+def _scale(coin, amounts):
+    # adjust test amounts to the precision of `coin`
+    decimals = 18 if coin == ETH_ADDRESS else coin.decimals()
+    return [max(i * 10 ** decimals // 10 ** 18, 1) for i in amounts]
+
+
+def test_swap_into_synth(swap, engine, coins, synths):
+    for coin, synth in itertools.product(coins + synths, synths):
+        amounts = _scale(coin, AMOUNTS)
+        expected = [swap.get_swap_into_synth_amount(coin, synth, i) for i in amounts]
+        assert list(engine.get_swap_into_synth_amount(coin, synth, amounts)) == expected
+
+
+def test_swap_from_synth(swap, engine, sUSD, sBTC, DAI, USDT, WBTC):
+    for synth, coin in [(sUSD, DAI), (sUSD, USDT), (sBTC, WBTC)]:
+        expected = [swap.get_swap_from_synth_amount(synth, coin, i) for i in AMOUNTS]
+        assert list(engine.get_swap_from_synth_amount(synth, coin, AMOUNTS)) == expected
+
+
+def test_estimated_swap_amount(swap, engine, coins):
+    for _from, to in itertools.permutations(coins, 2):
+        amounts = _scale(_from, AMOUNTS[:3])
+        expected = [swap.get_estimated_swap_amount(_from, to, i) for i in amounts]
+        assert list(engine.get_estimated_swap_amount(_from, to, amounts)) == expected
+
+
+def test_scalar_amount(swap, engine, DAI, sBTC):
+    result = engine.get_swap_into_synth_amount(DAI, sBTC, 10 ** 18)
+    assert isinstance(result, int)
+    assert result == swap.get_swap_into_synth_amount(DAI, sBTC, 10 ** 18)
+
+
+def test_many_pairs(swap, engine, DAI, USDT, WBTC, EURS):
+    froms = [DAI, WBTC, DAI, EURS, DAI]
+    tos = [WBTC, DAI, WBTC, USDT, EURS]
+    amounts = [10 ** 18, 10 ** 7, 5 * 10 ** 20, 10 ** 4, 31337]
+
+    expected = [swap.get_estimated_swap_amount(*i) for i in zip(froms, tos, amounts)]
+    assert list(engine.get_estimated_swap_amounts(froms, tos, amounts)) == expected
+
+
+def test_snapshot_is_fixed_to_block(alice, swap, synths, engine, DAI, sBTC):
+    amount = 1_000_000 * 10 ** 18
+    DAI._mint_for_testing(alice, amount)
+    DAI.approve(swap, amount, {"from": alice})
+    swap.swap_into_synth(DAI, sBTC, amount, 0, {"from": alice})
+
+    # the pool balances have changed, so the old snapshot is now stale
+    expected = swap.get_swap_into_synth_amount(DAI, sBTC, 10 ** 24)
+    assert engine.get_swap_into_synth_amount(DAI, sBTC, 10 ** 24) != expected
+
+    engine = QuoteEngine(take_snapshot(swap, synths))
+    assert engine.get_swap_into_synth_amount(DAI, sBTC, 10 ** 24) == expected
+
+
+def test_unknown_coin(engine, sBTC):
+    with pytest.raises(ValueError):
+        engine.get_swap_into_synth_amount(
+            "0x47bD14817d7684082E04934878EE2Dd3576Ae19d", sBTC, 1
+        )
@@ -0,0 +1,140 @@
+import brownie
+import pytest
+from brownie import ETH_ADDRESS, ZERO_ADDRESS, Contract, web3
+
+from quoter import snapshot
+from quoter.stableswap import LEGACY, PLAIN, PRECISE
+
+# imbalanced pool balances, in whole units of each coin
+BALANCES = [
+    [3_000_000, 1_000_000, 2_000_000, 500_000],
+    [1_000_000, 20_000_000, 3_000_000, 40_000_000],
+    [800_000, 20_000_000, 600_000, 5_000_000],
+]
+AMOUNTS = [1, 10 ** 6, 10 ** 18, 31337 * 10 ** 18, 250_000 * 10 ** 18]
+
+
+def _deploy(container, admin, coins, balances):
+    # deploy a pool mock and set balances of each coin in whole units
+    padded = list(coins) + [ZERO_ADDRESS] * (4 - len(coins))
+    pool = container.deploy(padded, 100, 4000000, {"from": admin})
+    decimals = [18 if i == ETH_ADDRESS else i.decimals() for i in coins]
+    amounts = [b * 10 ** d for b, d in zip(balances, decimals)]
+    pool.set_balances(amounts + [0] * (4 - len(coins)), {"from": admin})
+    return pool
+
+
+def _scale(coin, amounts):
+    # adjust test amounts to the precision of `coin`
+    decimals = 18 if coin == ETH_ADDRESS else coin.decimals()
+    return [max(i * 10 ** decimals // 10 ** 18, 1) for i in amounts]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def skip_if_forked(is_forked):
+    if is_forked:
+        pytest.skip("requires mock pools with balances set directly")
+
+
+@pytest.fixture(scope="module")
+def legacy_coins(DAI, USDC, USDT, sUSD):
+    yield [DAI, USDC, USDT, sUSD]
+
+
+@pytest.fixture
+def registry(RegistryMock, admin):
+    yield RegistryMock.deploy({"from": admin})
+
+
+@pytest.fixture
+def legacy_pool(monkeypatch, CurvePoolLegacyMock, admin, registry, legacy_coins):
+    def deploy(balances):
+        pool = _deploy(CurvePoolLegacyMock, admin, legacy_coins, balances)
+        registry.add_pool(pool, {"from": admin})
+        # older pools are identified by address
+        monkeypatch.setitem(snapshot.POOL_VARIANTS, pool.address, LEGACY.name)
+        return pool
+
+    yield deploy
+
+
+@pytest.fixture(params=["EURS", "ETH"])
+def precise_coins(request, EURS, sEUR, sETH):
+    if request.param == "EURS":
+        yield [EURS, sEUR]
+    else:
+        yield [ETH_ADDRESS, sETH]
+
+
+@pytest.fixture
+def precise_pool(CurvePoolPreciseMock, admin, registry, precise_coins):
+    def deploy(balances):
+        pool = _deploy(CurvePoolPreciseMock, admin, precise_coins, balances[:2])
+        registry.add_pool(pool, {"from": admin})
+        return pool
+
+    yield deploy
+
+
+def _assert_matches(pool, registry, coins):
+    state = snapshot._get_pool_state(pool, registry, web3.eth.block_number)
+    for i in range(len(coins)):
+        for j in range(len(coins)):
+            if i == j:
+                continue
+            amounts = _scale(coins[i], AMOUNTS)
+            expected = [pool.get_dy(i, j, x) for x in amounts]
+            assert list(state.get_dy(i, j, amounts)) == expected
+    return state
+
+
+@pytest.mark.parametrize("balances", BALANCES)
+def test_legacy_pool(legacy_pool, registry, legacy_coins, balances):
+    pool = legacy_pool(balances)
+    state = _assert_matches(pool, registry, legacy_coins)
+
+    assert state.variant == LEGACY.name
+    assert state.A == pool.A()
+
+
+def test_int128_balances(legacy_pool, registry, legacy_coins):
+    # older pools only accept an `int128` index, a call using `uint256` reverts
+    pool = legacy_pool(BALANCES[0])
+    contract = Contract.from_abi("CurvePool", pool.address, snapshot.POOL_ABI)
+    with brownie.reverts():
+        contract.balances(0)
+
+    state = snapshot._get_pool_state(pool, registry, web3.eth.block_number)
+    assert state.balances == tuple(pool.balances(i) for i in range(4))
+
+
+@pytest.mark.parametrize("balances", BALANCES)
+def test_precise_pool(precise_pool, registry, precise_coins, balances):
+    pool = precise_pool(balances)
+    state = _assert_matches(pool, registry, precise_coins)
+
+    # the variant is identified by `A_precise`, which is used within the math
+    assert state.variant == PRECISE.name
+    assert state.A == pool.A_precise() == pool.A() * 100
+
+
+def test_plain_pool(registry, admin, curve_sbtc, renBTC, WBTC, sBTC):
+    registry.add_pool(curve_sbtc, {"from": admin})
+    state = _assert_matches(curve_sbtc, registry, [renBTC, WBTC, sBTC])
+
+    assert state.variant == PLAIN.name
+
+
+@pytest.mark.parametrize("variant", [PLAIN, PRECISE])
+def test_variant_matters(legacy_pool, registry, legacy_coins, variant):
+    # evaluating a legacy pool with the math of another variant gives
+    # different results, so the variant must be selected correctly
+    pool = legacy_pool(BALANCES[0])
+    state = snapshot._get_pool_state(pool, registry, web3.eth.block_number)
+    state = snapshot.PoolState(
+        **{**state.__dict__, "variant": variant.name, "D": None},
+    )
+
+    amounts = AMOUNTS[1:]
+    expected = [pool.get_dy(0, 3, x) for x in amounts]
+    assert list(state.get_dy(0, 3, amounts)) != expected
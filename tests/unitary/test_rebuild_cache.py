@@ -0,0 +1,53 @@
+import pytest
+from brownie import ETH_ADDRESS
+
+ADDRESS_PROVIDER = "0x0000000022D53366457F9d5E68Ec105046FC4383"
+
+
+@pytest.fixture(scope="module")
+def provider(is_forked, AddressProviderMock, registry):
+    if is_forked:
+        pytest.skip("requires the mock address provider")
+    yield AddressProviderMock.at(ADDRESS_PROVIDER)
+
+
+@pytest.fixture(scope="module")
+def new_registry_swap(RegistrySwapMock, admin, provider):
+    registry_swap = RegistrySwapMock.deploy({"from": admin})
+    provider.set_address(2, registry_swap, {"from": admin})
+    yield registry_swap
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, DAI, add_synths):
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+
+def test_swaps_use_pool_directly(alice, swap, DAI, sBTC, curve_susd, new_registry_swap):
+    swap.swap_into_synth(DAI, sBTC, 100_000 * 10 ** 18, 0, {"from": alice})
+
+    assert DAI.allowance(swap, curve_susd) > 0
+    assert DAI.allowance(swap, new_registry_swap) == 0
+
+
+def test_settler_approval_migrates(
+    chain, alice, swap, sETH, settler_seth, new_registry_swap
+):
+    # swapping into ether is the only path which uses the registry swap contract
+    token_id = int(settler_seth.address, 16)
+    chain.sleep(600)
+    swap.swap_from_synth(token_id, ETH_ADDRESS, 10 ** 18, 0, {"from": alice})
+    assert sETH.allowance(settler_seth, new_registry_swap) == 0
+
+    swap.rebuildCache({"from": alice})
+    swap.swap_from_synth(token_id, ETH_ADDRESS, 10 ** 18, 0, {"from": alice})
+    assert sETH.allowance(settler_seth, new_registry_swap) > 0
+
+
+def test_quotes_use_cached_registry(alice, admin, swap, provider, DAI, sBTC):
+    expected = swap.get_swap_into_synth_amount(DAI, sBTC, 10 ** 18)
+
+    # the cached registry continues to be used until the cache is rebuilt
+    provider.set_address(0, alice, {"from": admin})
+    assert swap.get_swap_into_synth_amount(DAI, sBTC, 10 ** 18) == expected
@@ -0,0 +1,79 @@
+import pytest
+from brownie import ETH_ADDRESS, ZERO_ADDRESS, chain
+
+MAX_BATCH_SIZE = 10
+
+
+@pytest.fixture(scope="module")
+def receiver(ReentrantReceiverMock, alice, swap):
+    yield ReentrantReceiverMock.deploy(swap, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def token_ids(alice, receiver, swap, DAI, sETH, add_synths):
+    DAI._mint_for_testing(alice, 2_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+    token_ids = []
+    for i in range(2):
+        tx = swap.swap_into_synth(DAI, sETH, 10 ** 24, 0, receiver, {"from": alice})
+        token_ids.append(tx.return_value)
+
+    chain.mine(timedelta=600)
+    yield token_ids
+
+
+def _assert_enumeration(swap, receiver, bob, remaining_id):
+    # the burned NFT is removed from the new owner, and the
+    # other NFT held by the original owner is unaffected
+    assert swap.totalSupply() == 1
+    assert swap.tokenByIndex(0) == remaining_id
+    assert swap.balanceOf(bob) == 0
+    assert swap.balanceOf(receiver) == 1
+    assert swap.tokenOfOwnerByIndex(receiver, 0) == remaining_id
+    assert swap.ownerOf(remaining_id) == receiver
+
+
+def test_transfer_during_swap_from(swap, receiver, bob, sETH, token_ids):
+    token_id = token_ids[0]
+    balance = sETH.balanceOf(hex(token_id))
+    data = swap.swap_from_synth.encode_input(token_id, ETH_ADDRESS, balance, 0)
+
+    tx = receiver.execute(data, token_id, bob, {"from": bob})
+
+    assert tx.events["Transfer"][-1].values() == [bob, ZERO_ADDRESS, token_id]
+    assert tx.events["TokenUpdate"][-1].values() == [
+        token_id,
+        ZERO_ADDRESS,
+        ZERO_ADDRESS,
+        0,
+    ]
+    _assert_enumeration(swap, receiver, bob, token_ids[1])
+
+
+def test_transfer_during_swap_from_many(swap, receiver, bob, sETH, token_ids):
+    token_id = token_ids[0]
+    balance = sETH.balanceOf(hex(token_id))
+    data = swap.swap_from_synth_many.encode_input(
+        [token_id] + [0] * (MAX_BATCH_SIZE - 1),
+        [ETH_ADDRESS] + [ZERO_ADDRESS] * (MAX_BATCH_SIZE - 1),
+        [balance] + [0] * (MAX_BATCH_SIZE - 1),
+        [0] * MAX_BATCH_SIZE,
+    )
+
+    tx = receiver.execute(data, token_id, bob, {"from": bob})
+
+    assert tx.events["Transfer"][-1].values() == [bob, ZERO_ADDRESS, token_id]
+    _assert_enumeration(swap, receiver, bob, token_ids[1])
+
+
+def test_transfer_during_partial_swap_from(swap, receiver, bob, sETH, token_ids):
+    token_id = token_ids[0]
+    balance = sETH.balanceOf(hex(token_id))
+    data = swap.swap_from_synth.encode_input(token_id, ETH_ADDRESS, balance // 2, 0)
+
+    tx = receiver.execute(data, token_id, bob, {"from": bob})
+
+    # the NFT is not burned, and the update reports the new owner
+    assert swap.ownerOf(token_id) == bob
+    assert tx.events["TokenUpdate"][-1]["owner"] == bob
@@ -0,0 +1,58 @@
+import brownie
+import pytest
+
+MAX_BATCH_SIZE = 10
+
+
+def _pad(token_ids):
+    return list(token_ids) + [0] * (MAX_BATCH_SIZE - len(token_ids))
+
+
+@pytest.fixture(scope="module")
+def token_ids(alice, swap, DAI, sBTC, sETH, add_synths):
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+    token_ids = []
+    for synth in (sBTC, sETH, sBTC):
+        tx = swap.swap_into_synth(DAI, synth, 300_000 * 10 ** 18, 0, {"from": alice})
+        token_ids.append(tx.return_value)
+
+    return token_ids
+
+
+def test_cannot_settle_immediately(alice, swap, token_ids):
+    with brownie.reverts("dev: settlement failed"):
+        swap.settle_many(_pad(token_ids), {"from": alice})
+
+
+def test_unknown_id(chain, alice, swap, token_ids):
+    chain.sleep(600)
+    with brownie.reverts("Unknown Token ID"):
+        swap.settle_many(_pad(token_ids + [31337]), {"from": alice})
+
+
+def test_settle_many(chain, alice, swap, token_ids):
+    chain.sleep(600)
+    swap.settle_many(_pad(token_ids), {"from": alice})
+
+    for token_id in token_ids:
+        assert swap.is_settled(token_id)
+
+
+def test_stops_at_zero(chain, alice, swap, token_ids):
+    chain.sleep(600)
+    swap.settle_many(_pad(token_ids[:1] + [0] + token_ids[1:]), {"from": alice})
+
+    assert swap.is_settled(token_ids[0])
+    assert not swap.is_settled(token_ids[1])
+    assert not swap.is_settled(token_ids[2])
+
+
+def test_already_settled(chain, alice, swap, token_ids):
+    chain.sleep(600)
+    swap.settle(token_ids[1], {"from": alice})
+    swap.settle_many(_pad(token_ids), {"from": alice})
+
+    for token_id in token_ids:
+        assert swap.is_settled(token_id)
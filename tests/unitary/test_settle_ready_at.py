@@ -0,0 +1,63 @@
+import brownie
+import pytest
+from brownie import chain
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, DAI, add_synths):
+    DAI._mint_for_testing(alice, 10 ** 24)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def token_id(alice, swap, DAI, sBTC, setup):
+    tx = swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, {"from": alice})
+    yield tx.return_value
+
+
+def test_ready_at(swap, exchanger, token_id):
+    expected = chain[-1].timestamp + exchanger.waitingPeriodSecs()
+
+    assert swap.settle_ready_at(token_id) == expected
+
+
+def test_settled(alice, swap, token_id):
+    chain.mine(timedelta=600)
+    swap.settle(token_id, {"from": alice})
+
+    assert swap.settle_ready_at(token_id) == 0
+
+
+def test_top_up(alice, swap, exchanger, DAI, sBTC, token_id):
+    chain.mine(timedelta=600)
+    swap.settle(token_id, {"from": alice})
+
+    swap.swap_into_synth(DAI, sBTC, 10 ** 21, 0, alice, token_id, {"from": alice})
+
+    # topping up a settled token requires settling it again
+    assert not swap.is_settled(token_id)
+    assert swap.settle_ready_at(token_id) == (
+        chain[-1].timestamp + exchanger.waitingPeriodSecs()
+    )
+    assert swap.token_info(token_id)["time_to_settle"] > 0
+
+
+def test_reused_settler(alice, swap, exchanger, DAI, sBTC, token_id):
+    chain.mine(timedelta=600)
+    balance = swap.token_info(token_id)["underlying_balance"]
+    swap.withdraw(token_id, balance, {"from": alice})
+
+    chain.mine(timedelta=600)
+    new_token_id = swap.swap_into_synth(
+        DAI, sBTC, 10 ** 21, 0, {"from": alice}
+    ).return_value
+
+    assert new_token_id == token_id + 2 ** 160
+    assert swap.settle_ready_at(new_token_id) == (
+        chain[-1].timestamp + exchanger.waitingPeriodSecs()
+    )
+
+
+def test_unknown_token(swap, token_id):
+    with brownie.reverts("Unknown Token ID"):
+        swap.settle_ready_at(token_id + 1)
@@ -0,0 +1,126 @@
+import brownie
+import pytest
+from brownie import Settler, chain
+
+AMOUNT = 1_000_000 * 10 ** 18
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, DAI, add_synths):
+    DAI._mint_for_testing(alice, 2 * AMOUNT)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def token_id(alice, swap, DAI, sBTC, setup):
+    tx = swap.swap_into_synth(DAI, sBTC, AMOUNT, 0, {"from": alice})
+    chain.mine(timedelta=600)
+    yield tx.return_value
+
+
+def test_split(swap, alice, sBTC, token_id):
+    balance = sBTC.balanceOf(hex(token_id))
+    amount = balance // 3
+
+    tx = swap.split(token_id, amount, {"from": alice})
+    new_id = tx.return_value
+
+    assert new_id != token_id
+    assert swap.ownerOf(new_id) == alice
+    assert sBTC.balanceOf(hex(token_id)) == balance - amount
+    assert sBTC.balanceOf(hex(new_id)) == amount
+    assert Settler.at(hex(new_id)).synth() == sBTC
+    assert swap.token_info(new_id)["synth"] == sBTC
+    assert tx.events["BalanceTransfer"].values() == [token_id, new_id]
+    assert tx.events["TokenUpdate"][0].values() == [
+        token_id,
+        alice,
+        sBTC,
+        balance - amount,
+    ]
+    assert tx.events["TokenUpdate"][-1].values() == [new_id, alice, sBTC, amount]
+
+
+def test_both_settled(swap, alice, token_id):
+    new_id = swap.split(token_id, 10 ** 18, {"from": alice}).return_value
+
+    assert swap.is_settled(token_id)
+    assert swap.is_settled(new_id)
+    assert swap.settle_ready_at(new_id) == 0
+
+
+def test_uses_available_settler(swap, alice, token_id):
+    available = swap.available_settlers()
+    tx = swap.split(token_id, 10 ** 18, {"from": alice})
+
+    assert "NewSettler" not in tx.events
+    assert swap.available_settlers() == available - 1
+
+
+def test_deploys_settler(swap, alice, DAI, sBTC, token_id):
+    for i in range(swap.available_settlers()):
+        swap.swap_into_synth(DAI, sBTC, 10 ** 18, 0, {"from": alice})
+
+    tx = swap.split(token_id, 10 ** 18, {"from": alice})
+
+    assert int(tx.events["NewSettler"]["addr"], 16) == tx.return_value
+    assert swap.ownerOf(tx.return_value) == alice
+
+
+def test_reused_settler_with_other_synth(swap, alice, DAI, sBTC, sETH, token_id):
+    # the next available settler was last used for sETH
+    other_id = swap.swap_into_synth(
+        DAI, sETH, 10 ** 18, 0, {"from": alice}
+    ).return_value
+    chain.mine(timedelta=600)
+    swap.withdraw(other_id, 2 ** 256 - 1, {"from": alice})
+
+    new_id = swap.split(token_id, 10 ** 18, {"from": alice}).return_value
+
+    assert new_id == other_id + 2 ** 160
+    assert Settler.at(hex(new_id % 2 ** 160)).synth() == sBTC
+    assert swap.token_info(new_id)["synth"] == sBTC
+
+
+def test_withdraw_split_token(swap, alice, sBTC, token_id):
+    new_id = swap.split(token_id, 10 ** 18, {"from": alice}).return_value
+    swap.withdraw(new_id, 10 ** 18, {"from": alice})
+
+    assert sBTC.balanceOf(alice) == 10 ** 18
+    with brownie.reverts():
+        swap.ownerOf(new_id)
+
+
+def test_operator(swap, alice, bob, token_id):
+    swap.approve(bob, token_id, {"from": alice})
+    new_id = swap.split(token_id, 10 ** 18, {"from": bob}).return_value
+
+    assert swap.ownerOf(new_id) == alice
+
+
+def test_cannot_split_immediately(swap, alice, DAI, sBTC):
+    token_id = swap.swap_into_synth(
+        DAI, sBTC, 10 ** 18, 0, {"from": alice}
+    ).return_value
+
+    with brownie.reverts():
+        swap.split(token_id, 10 ** 6, {"from": alice})
+
+
+def test_entire_balance(swap, alice, sBTC, token_id):
+    balance = sBTC.balanceOf(hex(token_id))
+
+    with brownie.reverts("dev: entire balance"):
+        swap.split(token_id, balance, {"from": alice})
+
+
+def test_exceeds_balance(swap, alice, sBTC, token_id):
+    balance = sBTC.balanceOf(hex(token_id))
+
+    with brownie.reverts():
+        swap.split(token_id, balance + 1, {"from": alice})
+
+
+def test_caller_not_owner(swap, bob, token_id):
+    with brownie.reverts("Caller is not owner or operator"):
+        swap.split(token_id, 10 ** 18, {"from": bob})
@@ -6,3 +6,8 @@ def test_erc165_support(swap):
 def test_erc721_support(swap):
     erc721_interface_id = "0x80ac58cd"
     assert swap.supportsInterface(erc721_interface_id) is True
+
+
+def test_erc721_enumerable_support(swap):
+    erc721_enumerable_interface_id = "0x780e9d63"
+    assert swap.supportsInterface(erc721_enumerable_interface_id) is True
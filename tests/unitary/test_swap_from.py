@@ -120,3 +120,9 @@ def test_approved_one_token_operator(swap, alice, bob, WBTC, token_id):
     swap.approve(bob, token_id, {"from": alice})
     chain.sleep(600)
     swap.swap_from_synth(token_id, WBTC, 1, 0, {"from": bob})
+
+
+def test_zero_address(swap, alice, token_id):
+    chain.sleep(600)
+    with brownie.reverts("dev: coin not in pool"):
+        swap.swap_from_synth(token_id, ZERO_ADDRESS, 1, 0, {"from": alice})
@@ -0,0 +1,119 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS, chain
+
+MAX_BATCH_SIZE = 10
+
+
+def _pad(values, default=0):
+    return list(values) + [default] * (MAX_BATCH_SIZE - len(values))
+
+
+@pytest.fixture(scope="module")
+def token_ids(alice, swap, DAI, sBTC, sETH, add_synths):
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+    token_ids = []
+    for synth in (sBTC, sETH, sBTC):
+        tx = swap.swap_into_synth(DAI, synth, 300_000 * 10 ** 18, 0, {"from": alice})
+        token_ids.append(tx.return_value)
+
+    return token_ids
+
+
+@pytest.fixture(scope="module")
+def balances(swap, token_ids):
+    chain.mine(timedelta=600)
+    return [swap.token_info(i)["underlying_balance"] for i in token_ids]
+
+
+@pytest.fixture(scope="module")
+def targets(WBTC, renBTC):
+    return [WBTC, "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE", renBTC]
+
+
+def test_cannot_swap_from_immediately(alice, swap, token_ids, targets):
+    with brownie.reverts():
+        swap.swap_from_synth_many(
+            _pad(token_ids),
+            _pad(targets, ZERO_ADDRESS),
+            _pad([1, 1, 1]),
+            _pad([]),
+            {"from": alice},
+        )
+
+
+def test_only_owner(bob, swap, token_ids, targets, balances):
+    with brownie.reverts("Caller is not owner or operator"):
+        swap.swap_from_synth_many(
+            _pad(token_ids),
+            _pad(targets, ZERO_ADDRESS),
+            _pad([1, 1, 1]),
+            _pad([]),
+            {"from": bob},
+        )
+
+
+def test_swap_all(alice, swap, sBTC, sETH, WBTC, renBTC, token_ids, targets, balances):
+    expected = [
+        swap.get_swap_from_synth_amount(sBTC, WBTC, balances[0]),
+        swap.get_swap_from_synth_amount(sETH, targets[1], balances[1]),
+    ]
+    initial_eth = alice.balance()
+
+    tx = swap.swap_from_synth_many(
+        _pad(token_ids),
+        _pad(targets, ZERO_ADDRESS),
+        _pad(balances),
+        _pad([]),
+        {"from": alice},
+    )
+
+    assert tx.return_value == [0] * MAX_BATCH_SIZE
+    assert abs(WBTC.balanceOf(alice) - expected[0]) <= 1
+    assert abs(alice.balance() - initial_eth - expected[1]) <= 1
+    assert renBTC.balanceOf(alice) > 0
+    for coin in (sBTC, sETH, WBTC, renBTC):
+        assert coin.balanceOf(swap) == 0
+
+
+def test_swap_all_burns(alice, swap, token_ids, targets, balances):
+    tx = swap.swap_from_synth_many(
+        _pad(token_ids),
+        _pad(targets, ZERO_ADDRESS),
+        _pad(balances),
+        _pad([]),
+        {"from": alice},
+    )
+
+    assert swap.balanceOf(alice) == 0
+    burns = [i.values() for i in tx.events["Transfer"] if i.address == swap]
+    assert burns == [[alice, ZERO_ADDRESS, i] for i in token_ids]
+
+
+def test_swap_partial(alice, swap, token_ids, targets, balances):
+    amounts = [balances[0] // 2, balances[1], balances[2] // 3]
+    tx = swap.swap_from_synth_many(
+        _pad(token_ids),
+        _pad(targets, ZERO_ADDRESS),
+        _pad(amounts),
+        _pad([]),
+        {"from": alice},
+    )
+
+    remaining = [balances[0] - amounts[0], 0, balances[2] - amounts[2]]
+    assert tx.return_value == _pad(remaining)
+    assert swap.balanceOf(alice) == 2
+
+
+def test_slippage(alice, swap, sETH, token_ids, targets, balances):
+    expected = swap.get_swap_from_synth_amount(sETH, targets[1], balances[1])
+    with brownie.reverts():
+        swap.swap_from_synth_many(
+            _pad(token_ids),
+            _pad(targets, ZERO_ADDRESS),
+            _pad(balances),
+            _pad([0, expected + 1, 0]),
+            {"from": alice},
+        )
@@ -150,6 +150,11 @@ def test_swap_into_multiple_same_synth(swap, alice, DAI, sBTC):
     assert Settler.at(hex(token_id2)).synth() == sBTC
 
 
+def test_zero_receiver(swap, alice, DAI, sBTC):
+    with brownie.reverts("dev: zero receiver"):
+        swap.swap_into_synth(DAI, sBTC, 10 ** 18, 0, ZERO_ADDRESS, {"from": alice})
+
+
 def test_unknown_synth(swap, alice, DAI):
     # i sure hope we never have a pool for this
     sTRX = "0x47bD14817d7684082E04934878EE2Dd3576Ae19d"
@@ -0,0 +1,225 @@
+import brownie
+import pytest
+from brownie import ETH_ADDRESS, ZERO_ADDRESS, Settler
+
+MAX_BATCH_SIZE = 10
+
+
+def _pad(values, default=0):
+    return list(values) + [default] * (MAX_BATCH_SIZE - len(values))
+
+
+def _swap_many(swap, caller, swaps, value=0):
+    # each swap is given as (from, synth, amount, expected, receiver)
+    from_, synth, amount, expected, receiver = zip(*swaps)
+    return swap.swap_into_synth_many(
+        _pad(from_, ZERO_ADDRESS),
+        _pad(synth, ZERO_ADDRESS),
+        _pad(amount),
+        _pad(expected),
+        _pad(receiver, ZERO_ADDRESS),
+        {"from": caller, "value": value},
+    )
+
+
+@pytest.fixture
+def sUSD2(
+    is_forked, SynthMock, CurvePoolMock, admin, alice, exchanger, registry, swap, sUSD
+):
+    if is_forked:
+        pytest.skip("requires a mock synth pool containing sUSD")
+    # a synth whose pool contains sUSD, so sUSD is no longer its own default synth
+    key = "0x" + b"sUSD2".hex().ljust(64, "0")
+    synth = SynthMock.deploy("Synth sUSD2", "sUSD2", 18, key, {"from": admin})
+    exchanger.add_synth(synth, 10 ** 18, {"from": admin})
+
+    coins = [sUSD, synth, ZERO_ADDRESS, ZERO_ADDRESS]
+    pool = CurvePoolMock.deploy(coins, 100, 4000000, {"from": admin})
+    for coin in coins[:2]:
+        coin._mint_for_testing(admin, 10 ** 24, {"from": admin})
+        coin.approve(pool, 10 ** 24, {"from": admin})
+    pool.add_liquidity([10 ** 24, 10 ** 24, 0, 0], {"from": admin})
+    registry.add_pool(pool, {"from": admin})
+    swap.add_synth(synth, pool, {"from": alice})
+
+    yield synth
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, DAI, USDT, add_synths):
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+    USDT._mint_for_testing(alice, 1_000_000 * 10 ** 6)
+    USDT.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+
+def test_mints_for_each_swap(swap, alice, bob, DAI, sBTC, sETH):
+    amount = 250_000 * 10 ** 18
+    tx = _swap_many(
+        swap,
+        alice,
+        [
+            (DAI, sBTC, amount, 0, alice),
+            (DAI, sETH, amount, 0, bob),
+            (DAI, sBTC, amount, 0, bob),
+        ],
+    )
+    token_ids = tx.return_value[:3]
+
+    assert len(set(token_ids)) == 3
+    assert tx.return_value[3:] == [0] * 7
+    assert swap.balanceOf(alice) == 1
+    assert swap.balanceOf(bob) == 2
+
+    for token_id, receiver, synth in zip(
+        token_ids, [alice, bob, bob], [sBTC, sETH, sBTC]
+    ):
+        settler = Settler.at(hex(token_id))
+        assert swap.ownerOf(token_id) == receiver
+        assert settler.synth() == synth
+        assert synth.balanceOf(settler) > 0
+
+
+def test_balances(swap, alice, DAI, USDT, sUSD, sBTC):
+    tx = _swap_many(
+        swap,
+        alice,
+        [
+            (DAI, sBTC, 500_000 * 10 ** 18, 0, alice),
+            (USDT, sBTC, 1_000_000 * 10 ** 6, 0, alice),
+            (DAI, sBTC, 500_000 * 10 ** 18, 0, alice),
+        ],
+    )
+
+    for coin in (DAI, USDT, sUSD, sBTC):
+        assert coin.balanceOf(alice) == 0
+        assert coin.balanceOf(swap) == 0
+
+    for token_id in tx.return_value[:3]:
+        settler = Settler.at(hex(token_id))
+        assert DAI.balanceOf(settler) == 0
+        assert USDT.balanceOf(settler) == 0
+        assert sUSD.balanceOf(settler) == 0
+
+
+def test_one_transfer_per_coin(swap, alice, DAI, sBTC, sETH):
+    amount = 250_000 * 10 ** 18
+    tx = _swap_many(
+        swap,
+        alice,
+        [(DAI, sBTC, amount, 0, alice)] * 2 + [(DAI, sETH, amount, 0, alice)] * 2,
+    )
+
+    transfers = [
+        i for i in tx.events["Transfer"] if i.address == DAI and i.values()[0] == alice
+    ]
+    assert len(transfers) == 1
+    assert transfers[0].values()[1:] == [swap, 1_000_000 * 10 ** 18]
+
+
+def test_swap_from_eth(swap, alice, bob, sETH, sBTC, sEUR):
+    tx = _swap_many(
+        swap,
+        alice,
+        [
+            (ETH_ADDRESS, sBTC, 10 ** 18, 0, alice),
+            (ETH_ADDRESS, sEUR, 2 * 10 ** 18, 0, bob),
+        ],
+        value=3 * 10 ** 18,
+    )
+
+    assert swap.balance() == 0
+    assert sETH.balanceOf(swap) == 0
+    assert sBTC.balanceOf(hex(tx.return_value[0])) > 0
+    assert sEUR.balanceOf(hex(tx.return_value[1])) > 0
+
+
+@pytest.mark.parametrize("value", [0, 10 ** 18 - 1, 10 ** 18 + 1])
+def test_incorrect_eth_amount(swap, alice, sBTC, value):
+    with brownie.reverts("dev: incorrect ETH amount"):
+        _swap_many(swap, alice, [(ETH_ADDRESS, sBTC, 10 ** 18, 0, alice)], value=value)
+
+
+def test_reuses_available_settlers(swap, alice, DAI, sBTC):
+    # the `swap` fixture deploys 3 settlers
+    amount = 200_000 * 10 ** 18
+    tx = _swap_many(swap, alice, [(DAI, sBTC, amount, 0, alice)] * 3)
+    assert "NewSettler" not in tx.events
+
+    tx = _swap_many(swap, alice, [(DAI, sBTC, amount, 0, alice)] * 2)
+    assert len(tx.events["NewSettler"]) == 2
+
+
+def test_slippage(swap, alice, DAI, sBTC, sETH):
+    amount = 500_000 * 10 ** 18
+    expected = swap.get_swap_into_synth_amount(DAI, sETH, amount)
+
+    with brownie.reverts("Rekt by slippage"):
+        _swap_many(
+            swap,
+            alice,
+            [(DAI, sBTC, amount, 0, alice), (DAI, sETH, amount, expected * 2, alice)],
+        )
+
+
+def test_unknown_synth(swap, alice, DAI, sBTC):
+    sTRX = "0x47bD14817d7684082E04934878EE2Dd3576Ae19d"
+
+    with brownie.reverts():
+        _swap_many(
+            swap,
+            alice,
+            [(DAI, sBTC, 10 ** 18, 0, alice), (DAI, sTRX, 10 ** 18, 0, alice)],
+        )
+
+
+def test_input_is_intermediate_synth(swap, alice, DAI, sUSD, sBTC, sUSD2):
+    # sUSD is held by the contract before the first swap, which exchanges DAI
+    # for sUSD. only the amount received from the exchange goes to its settler.
+    assert swap.swappable_synth(sUSD) == sUSD2
+    amount = 10_000 * 10 ** 18
+    sUSD._mint_for_testing(alice, amount)
+    sUSD.approve(swap, amount, {"from": alice})
+    expected = [
+        swap.get_swap_into_synth_amount(DAI, sBTC, amount),
+        swap.get_swap_into_synth_amount(sUSD, sBTC, amount),
+    ]
+
+    tx = _swap_many(
+        swap, alice, [(DAI, sBTC, amount, 0, alice), (sUSD, sBTC, amount, 0, alice)]
+    )
+
+    token_ids = tx.return_value[:2]
+    assert [sBTC.balanceOf(hex(i)) for i in token_ids] == expected
+    assert sUSD.balanceOf(swap) == 0
+
+
+def test_zero_receiver(swap, alice, DAI, sBTC):
+    # the receiver of the second swap is left as padding
+    swaps = [(DAI, sBTC, 10 ** 18, 0, alice), (DAI, sBTC, 10 ** 18, 0, alice)]
+    from_, synth, amount, expected, receiver = zip(*swaps)
+
+    with brownie.reverts("dev: zero receiver"):
+        swap.swap_into_synth_many(
+            _pad(from_, ZERO_ADDRESS),
+            _pad(synth, ZERO_ADDRESS),
+            _pad(amount),
+            _pad(expected),
+            _pad(receiver[:1], ZERO_ADDRESS),
+            {"from": alice},
+        )
+
+
+def test_cheaper_than_single_swaps(chain, swap, alice, DAI, sBTC):
+    # 5 swaps, using the 3 available settlers and deploying 2 more
+    amount = 100_000 * 10 ** 18
+    tx = _swap_many(swap, alice, [(DAI, sBTC, amount, 0, alice)] * 5)
+    batch_gas = tx.gas_used
+    chain.undo()
+
+    single_gas = 0
+    for i in range(5):
+        tx = swap.swap_into_synth(DAI, sBTC, amount, 0, {"from": alice})
+        single_gas += tx.gas_used
+
+    assert batch_gas < single_gas
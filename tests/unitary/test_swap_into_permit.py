@@ -0,0 +1,178 @@
+import brownie
+import pytest
+from brownie import Settler, chain
+from eth_keys import keys
+from eth_utils import keccak
+
+EIP2612_TYPEHASH = keccak(
+    text="Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)"
+)
+DAI_TYPEHASH = keccak(
+    text="Permit(address holder,address spender,uint256 nonce,uint256 expiry,bool allowed)"
+)
+
+
+def _encode(*values):
+    # abi encode addresses, integers and bytes32 values
+    return b"".join(
+        bytes(i).rjust(32, b"\x00")
+        if isinstance(i, bytes)
+        else int(str(i), 16 if str(i).startswith("0x") else 10).to_bytes(32, "big")
+        for i in values
+    )
+
+
+def _sign(signer, token, typehash, *values):
+    struct_hash = keccak(typehash + _encode(*values))
+    digest = keccak(b"\x19\x01" + bytes(token.DOMAIN_SEPARATOR()) + struct_hash)
+    signature = keys.PrivateKey(bytes.fromhex(signer.private_key[2:])).sign_msg_hash(
+        digest
+    )
+    return (
+        signature.v + 27,
+        signature.r.to_bytes(32, "big"),
+        signature.s.to_bytes(32, "big"),
+    )
+
+
+def _sign_eip2612(signer, token, spender, value, deadline):
+    nonce = token.nonces(signer)
+    return _sign(
+        signer, token, EIP2612_TYPEHASH, signer, spender, value, nonce, deadline
+    )
+
+
+def _sign_dai(signer, token, spender, expiry):
+    nonce = token.nonces(signer)
+    return _sign(signer, token, DAI_TYPEHASH, signer, spender, nonce, expiry, 1)
+
+
+@pytest.fixture(scope="module")
+def signer(accounts, alice):
+    signer = accounts.add()
+    alice.transfer(signer, 10 ** 18)
+    yield signer
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(signer, DAI, USDC, add_synths):
+    DAI._mint_for_testing(signer, 1_000_000 * 10 ** 18)
+    USDC._mint_for_testing(signer, 1_000_000 * 10 ** 6)
+
+
+@pytest.fixture
+def deadline():
+    yield chain[-1].timestamp + 3600
+
+
+def test_eip2612_permit(swap, swap_router, signer, USDC, sBTC, deadline):
+    amount = 1_000 * 10 ** 6
+    sig = _sign_eip2612(signer, USDC, swap_router, amount, deadline)
+    expected = swap.get_swap_into_synth_amount(USDC, sBTC, amount)
+
+    tx = swap_router.swap_into_synth_with_permit(
+        USDC, sBTC, amount, 0, deadline, *sig, False, {"from": signer}
+    )
+    token_id = tx.return_value
+
+    assert swap.ownerOf(token_id) == signer
+    assert sBTC.balanceOf(Settler.at(hex(token_id))) == expected
+    assert USDC.balanceOf(signer) == 999_000 * 10 ** 6
+    assert USDC.allowance(signer, swap_router) == 0
+    assert USDC.nonces(signer) == 1
+
+
+def test_dai_permit(swap, swap_router, signer, DAI, sBTC, deadline):
+    amount = 1_000 * 10 ** 18
+    sig = _sign_dai(signer, DAI, swap_router, deadline)
+
+    tx = swap_router.swap_into_synth_with_permit(
+        DAI, sBTC, amount, 0, deadline, *sig, True, {"from": signer}
+    )
+    token_id = tx.return_value
+
+    assert swap.ownerOf(token_id) == signer
+    assert DAI.balanceOf(signer) == 999_000 * 10 ** 18
+    assert DAI.allowance(signer, swap_router) == 2 ** 256 - 1 - amount
+    assert DAI.nonces(signer) == 1
+
+
+def test_receiver(swap, swap_router, signer, bob, USDC, sBTC, deadline):
+    amount = 1_000 * 10 ** 6
+    sig = _sign_eip2612(signer, USDC, swap_router, amount, deadline)
+
+    tx = swap_router.swap_into_synth_with_permit(
+        USDC, sBTC, amount, 0, deadline, *sig, False, bob, {"from": signer}
+    )
+
+    assert swap.ownerOf(tx.return_value) == bob
+    assert swap.balanceOf(signer) == 0
+
+
+def test_existing_allowance(swap, swap_router, signer, DAI, sBTC, deadline):
+    DAI.approve(swap_router, 2 ** 256 - 1, {"from": signer})
+
+    # the permit is skipped, so the signature is not checked
+    tx = swap_router.swap_into_synth_with_permit(
+        DAI,
+        sBTC,
+        1_000 * 10 ** 18,
+        0,
+        0,
+        0,
+        bytes(32),
+        bytes(32),
+        True,
+        {"from": signer},
+    )
+
+    assert swap.ownerOf(tx.return_value) == signer
+    assert DAI.nonces(signer) == 0
+
+
+def test_permit_already_submitted(swap, swap_router, signer, bob, USDC, sBTC, deadline):
+    amount = 1_000 * 10 ** 6
+    sig = _sign_eip2612(signer, USDC, swap_router, amount, deadline)
+
+    # a third party observes the signature and submits the permit first
+    selector = keccak(
+        text="permit(address,address,uint256,uint256,uint8,bytes32,bytes32)"
+    )
+    data = selector[:4] + _encode(signer, swap_router, amount, deadline, *sig)
+    bob.transfer(USDC, 0, data=f"0x{data.hex()}")
+    assert USDC.allowance(signer, swap_router) == amount
+
+    tx = swap_router.swap_into_synth_with_permit(
+        USDC, sBTC, amount, 0, deadline, *sig, False, {"from": signer}
+    )
+    assert swap.ownerOf(tx.return_value) == signer
+
+
+def test_invalid_signature(swap_router, signer, bob, USDC, sBTC, deadline):
+    amount = 1_000 * 10 ** 6
+    # signed for a smaller amount
+    sig = _sign_eip2612(signer, USDC, swap_router, amount - 1, deadline)
+
+    with brownie.reverts():
+        swap_router.swap_into_synth_with_permit(
+            USDC, sBTC, amount, 0, deadline, *sig, False, {"from": signer}
+        )
+
+
+def test_expired(swap_router, signer, DAI, sBTC):
+    expiry = chain[-1].timestamp - 1
+    sig = _sign_dai(signer, DAI, swap_router, expiry)
+
+    with brownie.reverts():
+        swap_router.swap_into_synth_with_permit(
+            DAI, sBTC, 1_000 * 10 ** 18, 0, expiry, *sig, True, {"from": signer}
+        )
+
+
+def test_wrong_signer(swap_router, signer, bob, DAI, sBTC, deadline):
+    sig = _sign_dai(signer, DAI, swap_router, deadline)
+
+    with brownie.reverts():
+        swap_router.swap_into_synth_with_permit(
+            DAI, sBTC, 1_000 * 10 ** 18, 0, deadline, *sig, True, {"from": bob}
+        )
@@ -0,0 +1,100 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS, Settler, chain
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, sJPY, add_synths):
+    sJPY._mint_for_testing(alice, 10_000_000 * 10 ** 18)
+    sJPY.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+
+def test_not_added(swap, sJPY):
+    assert swap.swappable_synth(sJPY) == ZERO_ADDRESS
+    assert swap.synth_pools(sJPY) == ZERO_ADDRESS
+
+
+def test_swap_into(swap, exchanger, alice, sJPY, sBTC):
+    amount = 1_000_000 * 10 ** 18
+    expected = exchanger.getAmountsForExchange(
+        amount, sJPY.currencyKey(), sBTC.currencyKey()
+    )[0]
+
+    tx = swap.swap_into_synth(sJPY, sBTC, amount, expected, {"from": alice})
+    token_id = tx.return_value
+
+    assert swap.ownerOf(token_id) == alice
+    assert sBTC.balanceOf(Settler.at(hex(token_id))) == expected
+    assert sJPY.balanceOf(alice) == 9_000_000 * 10 ** 18
+    assert sJPY.balanceOf(swap) == 0
+
+
+def test_not_cached(swap, alice, sJPY, sBTC):
+    swap.swap_into_synth(sJPY, sBTC, 10 ** 18, 0, {"from": alice})
+
+    assert swap.swappable_synth(sJPY) == ZERO_ADDRESS
+    assert swap.synths(5) == ZERO_ADDRESS
+
+
+def test_quotes_require_add_synth(swap, sJPY, sBTC, WBTC):
+    # the currency key is only cached by `add_synth`
+    with brownie.reverts("dev: unknown synth"):
+        swap.get_swap_into_synth_amount(sJPY, sBTC, 10 ** 21)
+    with brownie.reverts("dev: unknown synth"):
+        swap.get_estimated_swap_amount(sJPY, WBTC, 10 ** 21)
+
+
+def test_existing_token(swap, alice, sJPY, sBTC):
+    token_id = swap.swap_into_synth(
+        sJPY, sBTC, 10 ** 21, 0, {"from": alice}
+    ).return_value
+    swap.swap_into_synth(sJPY, sBTC, 10 ** 21, 0, alice, token_id, {"from": alice})
+
+    assert swap.balanceOf(alice) == 1
+
+
+def test_swap_into_many(swap, alice, bob, sJPY, sBTC, sETH):
+    amount = 10 ** 21
+    tx = swap.swap_into_synth_many(
+        [sJPY, sJPY] + [ZERO_ADDRESS] * 8,
+        [sBTC, sETH] + [ZERO_ADDRESS] * 8,
+        [amount, amount] + [0] * 8,
+        [0] * 10,
+        [alice, bob] + [ZERO_ADDRESS] * 8,
+        {"from": alice},
+    )
+
+    assert swap.ownerOf(tx.return_value[0]) == alice
+    assert swap.ownerOf(tx.return_value[1]) == bob
+    assert sJPY.balanceOf(alice) == 10_000_000 * 10 ** 18 - 2 * amount
+
+
+def test_withdraw(swap, alice, sJPY, sBTC):
+    token_id = swap.swap_into_synth(
+        sJPY, sBTC, 10 ** 21, 0, {"from": alice}
+    ).return_value
+    chain.mine(timedelta=600)
+
+    amount = swap.token_info(token_id)["underlying_balance"]
+    swap.withdraw(token_id, amount, {"from": alice})
+
+    assert sBTC.balanceOf(alice) == amount
+
+
+def test_cannot_swap_into_unlisted(swap, alice, DAI, sJPY):
+    DAI._mint_for_testing(alice, 10 ** 18)
+    DAI.approve(swap, 10 ** 18, {"from": alice})
+
+    with brownie.reverts():
+        swap.swap_into_synth(DAI, sJPY, 10 ** 18, 0, {"from": alice})
+
+
+def test_not_a_synth(swap, alice, sBTC):
+    with brownie.reverts():
+        swap.swap_into_synth(
+            "0x47bD14817d7684082E04934878EE2Dd3576Ae19d",
+            sBTC,
+            10 ** 18,
+            0,
+            {"from": alice},
+        )
@@ -0,0 +1,145 @@
+import brownie
+import pytest
+from brownie import ETH_ADDRESS, Settler, chain
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, swap, swap_router, DAI, EURS, add_synths):
+    for coin in (DAI, EURS):
+        coin._mint_for_testing(alice, 1_000_000 * 10 ** coin.decimals())
+        coin.approve(swap_router, 2 ** 256 - 1, {"from": alice})
+    swap.setApprovalForAll(swap_router, True, {"from": alice})
+
+
+@pytest.fixture
+def deadline():
+    yield chain[-1].timestamp + 3600
+
+
+@pytest.fixture(scope="module")
+def token_id(alice, swap, swap_router, DAI, sBTC, setup):
+    tx = swap_router.swap_into_synth_with_slippage(
+        DAI,
+        sBTC,
+        1_000_000 * 10 ** 18,
+        100,
+        chain[-1].timestamp + 3600,
+        {"from": alice},
+    )
+    chain.mine(timedelta=600)
+    yield tx.return_value
+
+
+@pytest.mark.parametrize("idx", range(3))
+def test_swap_into(
+    alice, swap, swap_router, DAI, EURS, sUSD, sEUR, sBTC, deadline, idx
+):
+    coin, value = [(DAI, 0), (EURS, 0), (ETH_ADDRESS, 10 ** 18)][idx]
+    amount = value or 10_000 * 10 ** coin.decimals()
+    expected = swap.get_swap_into_synth_amount(coin, sBTC, amount)
+
+    tx = swap_router.swap_into_synth_with_slippage(
+        coin, sBTC, amount, 100, deadline, {"from": alice, "value": value}
+    )
+    token_id = tx.return_value
+
+    assert swap.ownerOf(token_id) == alice
+    assert sBTC.balanceOf(Settler.at(hex(token_id))) == expected
+
+
+def test_swap_into_reference(alice, swap_router, exchanger, DAI, sUSD, sBTC, deadline):
+    # the reference amount values DAI at par with sUSD, so the Curve fee
+    # alone exceeds a slippage of zero
+    with brownie.reverts():
+        swap_router.swap_into_synth_with_slippage(
+            DAI, sBTC, 10_000 * 10 ** 18, 0, deadline, {"from": alice}
+        )
+
+
+def test_swap_into_unlisted_synth(alice, swap_router, exchanger, sJPY, sBTC, deadline):
+    # exchanged directly, so the reference amount is received with zero slippage
+    amount = 10 ** 21
+    sJPY._mint_for_testing(alice, amount)
+    sJPY.approve(swap_router, amount, {"from": alice})
+    expected = exchanger.getAmountsForExchange(
+        amount, sJPY.currencyKey(), sBTC.currencyKey()
+    )[0]
+
+    tx = swap_router.swap_into_synth_with_slippage(
+        sJPY, sBTC, amount, 0, deadline, {"from": alice}
+    )
+
+    assert sBTC.balanceOf(Settler.at(hex(tx.return_value))) == expected
+
+
+def test_swap_into_expired(alice, swap_router, DAI, sBTC):
+    with brownie.reverts("dev: expired"):
+        swap_router.swap_into_synth_with_slippage(
+            DAI, sBTC, 10 ** 18, 100, chain[-1].timestamp - 1, {"from": alice}
+        )
+
+
+def test_swap_into_invalid_slippage(alice, swap_router, DAI, sBTC, deadline):
+    with brownie.reverts("dev: invalid slippage"):
+        swap_router.swap_into_synth_with_slippage(
+            DAI, sBTC, 10 ** 18, 10001, deadline, {"from": alice}
+        )
+
+
+@pytest.mark.parametrize("value", [10 ** 18 - 1, 10 ** 18 + 1])
+def test_swap_into_incorrect_eth_amount(alice, swap_router, sBTC, deadline, value):
+    # the reference amount is calculated from `_amount`, not the ETH sent
+    with brownie.reverts("dev: incorrect ETH amount"):
+        swap_router.swap_into_synth_with_slippage(
+            ETH_ADDRESS, sBTC, 10 ** 18, 100, deadline, {"from": alice, "value": value}
+        )
+
+
+def test_swap_into_non_zero_eth_amount(alice, swap_router, DAI, sBTC, deadline):
+    with brownie.reverts("dev: non-zero ETH amount"):
+        swap_router.swap_into_synth_with_slippage(
+            DAI, sBTC, 10 ** 18, 100, deadline, {"from": alice, "value": 1}
+        )
+
+
+def test_swap_from(alice, bob, swap, swap_router, WBTC, sBTC, token_id, deadline):
+    amount = swap.token_info(token_id)["underlying_balance"] // 2
+    expected = swap.get_swap_from_synth_amount(sBTC, WBTC, amount)
+
+    swap_router.swap_from_synth_with_slippage(
+        token_id, WBTC, amount, 100, deadline, bob, {"from": alice}
+    )
+
+    assert WBTC.balanceOf(bob) == expected
+    assert swap.ownerOf(token_id) == alice
+
+
+def test_swap_from_reference(alice, swap, swap_router, WBTC, token_id, deadline):
+    amount = swap.token_info(token_id)["underlying_balance"]
+    with brownie.reverts():
+        swap_router.swap_from_synth_with_slippage(
+            token_id, WBTC, amount, 0, deadline, {"from": alice}
+        )
+
+
+def test_swap_from_expired(alice, swap_router, WBTC, token_id):
+    with brownie.reverts():
+        swap_router.swap_from_synth_with_slippage(
+            token_id, WBTC, 10 ** 8, 100, chain[-1].timestamp - 1, {"from": alice}
+        )
+
+
+def test_swap_from_operator(alice, bob, swap, swap_router, WBTC, token_id, deadline):
+    swap.approve(bob, token_id, {"from": alice})
+    swap_router.swap_from_synth_with_slippage(
+        token_id, WBTC, 10 ** 16, 100, deadline, {"from": bob}
+    )
+
+    assert WBTC.balanceOf(bob) > 0
+
+
+def test_swap_from_caller_not_owner(bob, swap_router, WBTC, token_id, deadline):
+    with brownie.reverts("Caller is not owner or operator"):
+        swap_router.swap_from_synth_with_slippage(
+            token_id, WBTC, 10 ** 6, 100, deadline, {"from": bob}
+        )
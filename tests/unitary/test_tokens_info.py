@@ -0,0 +1,53 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+MAX_QUERY_SIZE = 50
+
+
+def _pad(token_ids):
+    return list(token_ids) + [0] * (MAX_QUERY_SIZE - len(token_ids))
+
+
+@pytest.fixture(scope="module")
+def token_ids(alice, bob, swap, DAI, sBTC, sETH, add_synths):
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+    token_ids = []
+    for synth, receiver in [(sBTC, alice), (sETH, bob), (sBTC, bob)]:
+        tx = swap.swap_into_synth(
+            DAI, synth, 300_000 * 10 ** 18, 0, receiver, {"from": alice}
+        )
+        token_ids.append(tx.return_value)
+
+    return token_ids
+
+
+def test_matches_token_info(swap, swap_views, token_ids):
+    result = swap_views.tokens_info(_pad(token_ids))
+
+    for i, token_id in enumerate(token_ids):
+        assert [x[i] for x in result] == swap.token_info(token_id)
+
+
+def test_zero_padding(swap_views, token_ids):
+    owners, synths, balances, times_to_settle = swap_views.tokens_info(_pad(token_ids))
+
+    assert owners[3:] == [ZERO_ADDRESS] * (MAX_QUERY_SIZE - 3)
+    assert synths[3:] == [ZERO_ADDRESS] * (MAX_QUERY_SIZE - 3)
+    assert balances[3:] == [0] * (MAX_QUERY_SIZE - 3)
+    assert times_to_settle[3:] == [0] * (MAX_QUERY_SIZE - 3)
+
+
+def test_portfolio(swap_views, bob, sETH, sBTC, token_ids):
+    owned = [i for i in swap_views.tokens_of_owner(bob) if i]
+    owners, synths = swap_views.tokens_info(_pad(owned))[:2]
+
+    assert owners[:2] == [bob, bob]
+    assert sorted(synths[:2]) == sorted([sETH.address, sBTC.address])
+
+
+def test_unknown_id(swap_views, token_ids):
+    with brownie.reverts():
+        swap_views.tokens_info(_pad(token_ids + [31337]))
@@ -0,0 +1,68 @@
+import pytest
+
+MAX_QUERY_SIZE = 50
+
+
+@pytest.fixture(scope="module")
+def token_ids(alice, swap, DAI, sBTC, sETH, add_synths):
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+    token_ids = []
+    for synth in (sBTC, sETH, sBTC, sETH):
+        tx = swap.swap_into_synth(DAI, synth, 250_000 * 10 ** 18, 0, {"from": alice})
+        token_ids.append(tx.return_value)
+
+    return token_ids
+
+
+def _tokens_of_owner(swap_views, owner, *args):
+    return [i for i in swap_views.tokens_of_owner(owner, *args) if i]
+
+
+def test_tokens_of_owner(swap_views, alice, bob, token_ids):
+    assert swap_views.tokens_of_owner(alice) == token_ids + [0] * (MAX_QUERY_SIZE - 4)
+    assert _tokens_of_owner(swap_views, bob) == []
+
+
+@pytest.mark.parametrize("offset,limit", [(0, 2), (1, 2), (2, 50), (3, 1), (4, 1)])
+def test_offset_and_limit(swap_views, alice, token_ids, offset, limit):
+    assert (
+        _tokens_of_owner(swap_views, alice, offset, limit) == token_ids[offset:][:limit]
+    )
+
+
+def test_transfer(swap, swap_views, alice, bob, token_ids):
+    swap.transferFrom(alice, bob, token_ids[1], {"from": alice})
+
+    assert sorted(_tokens_of_owner(swap_views, alice)) == sorted(
+        token_ids[:1] + token_ids[2:]
+    )
+    assert _tokens_of_owner(swap_views, bob) == [token_ids[1]]
+
+
+def test_transfer_all(swap, swap_views, alice, bob, token_ids):
+    for token_id in token_ids[::-1]:
+        swap.transferFrom(alice, bob, token_id, {"from": alice})
+
+    assert _tokens_of_owner(swap_views, alice) == []
+    assert sorted(_tokens_of_owner(swap_views, bob)) == sorted(token_ids)
+
+    # the index of each token must remain valid after moving within the list
+    for token_id in token_ids:
+        swap.transferFrom(bob, alice, token_id, {"from": bob})
+
+    assert _tokens_of_owner(swap_views, bob) == []
+    assert sorted(_tokens_of_owner(swap_views, alice)) == sorted(token_ids)
+
+
+def test_burn(chain, swap, swap_views, alice, sBTC, token_ids):
+    chain.sleep(600)
+    swap.withdraw(token_ids[0], sBTC.balanceOf(hex(token_ids[0])), {"from": alice})
+
+    assert sorted(_tokens_of_owner(swap_views, alice)) == sorted(token_ids[1:])
+
+    # the token that was moved into the vacated index can still be transferred
+    for token_id in token_ids[1:]:
+        swap.transferFrom(alice, alice, token_id, {"from": alice})
+    assert sorted(_tokens_of_owner(swap_views, alice)) == sorted(token_ids[1:])
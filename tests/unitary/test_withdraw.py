@@ -51,6 +51,18 @@ def test_withdraw_all_burns(alice, swap, token_id, sBTC):
         swap.ownerOf(token_id)
 
 
+def test_withdraw_max_uint(alice, swap, settler_sbtc, sBTC, token_id):
+    chain.mine(timedelta=600)
+    balance = swap.token_info(token_id)["underlying_balance"]
+
+    tx = swap.withdraw(token_id, 2 ** 256 - 1, {"from": alice})
+
+    assert tx.return_value == 0
+    assert sBTC.balanceOf(alice) == balance
+    assert sBTC.balanceOf(settler_sbtc) == 0
+    assert swap.balanceOf(alice) == 0
+
+
 def test_withdraw_partial(alice, swap, settler_sbtc, sBTC, token_id):
     chain.mine(timedelta=600)
     initial = swap.token_info(token_id)["underlying_balance"]
@@ -128,3 +140,15 @@ def test_approved_one_token_operator(swap, alice, bob, token_id):
     swap.approve(bob, token_id, {"from": alice})
     chain.sleep(600)
     swap.withdraw(token_id, 1, {"from": bob})
+
+
+def test_approved_operator_withdraw_all(swap, alice, bob, sBTC, token_id):
+    swap.setApprovalForAll(bob, True, {"from": alice})
+    chain.mine(timedelta=600)
+    balance = swap.token_info(token_id)["underlying_balance"]
+
+    tx = swap.withdraw(token_id, balance, {"from": bob})
+
+    assert sBTC.balanceOf(bob) == balance
+    assert swap.balanceOf(alice) == 0
+    assert tx.events["Transfer"][-1].values() == [alice, ZERO_ADDRESS, token_id]
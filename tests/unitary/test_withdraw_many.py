@@ -0,0 +1,119 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS, chain
+
+MAX_BATCH_SIZE = 10
+
+
+def _pad(values):
+    return list(values) + [0] * (MAX_BATCH_SIZE - len(values))
+
+
+@pytest.fixture(scope="module")
+def token_ids(alice, swap, DAI, sBTC, sETH, add_synths):
+    DAI._mint_for_testing(alice, 1_000_000 * 10 ** 18)
+    DAI.approve(swap, 2 ** 256 - 1, {"from": alice})
+
+    token_ids = []
+    for synth in (sBTC, sETH, sBTC):
+        tx = swap.swap_into_synth(DAI, synth, 300_000 * 10 ** 18, 0, {"from": alice})
+        token_ids.append(tx.return_value)
+
+    return token_ids
+
+
+@pytest.fixture(scope="module")
+def balances(swap, token_ids):
+    chain.mine(timedelta=600)
+    return [swap.token_info(i)["underlying_balance"] for i in token_ids]
+
+
+def test_cannot_withdraw_immediately(alice, swap, token_ids):
+    with brownie.reverts():
+        swap.withdraw_many(_pad(token_ids), _pad([1, 1, 1]), {"from": alice})
+
+
+def test_only_owner(bob, swap, token_ids, balances):
+    with brownie.reverts("Caller is not owner or operator"):
+        swap.withdraw_many(_pad(token_ids), _pad([1, 1, 1]), {"from": bob})
+
+
+def test_withdraw_all(alice, swap, sBTC, sETH, token_ids, balances):
+    tx = swap.withdraw_many(_pad(token_ids), _pad(balances), {"from": alice})
+
+    assert tx.return_value == [0] * MAX_BATCH_SIZE
+    assert sBTC.balanceOf(alice) == balances[0] + balances[2]
+    assert sETH.balanceOf(alice) == balances[1]
+    assert sBTC.balanceOf(swap) == 0
+    assert sETH.balanceOf(swap) == 0
+
+
+def test_withdraw_all_burns(alice, swap, token_ids, balances):
+    tx = swap.withdraw_many(_pad(token_ids), _pad(balances), {"from": alice})
+
+    assert swap.balanceOf(alice) == 0
+    burns = [i.values() for i in tx.events["Transfer"] if i.address == swap]
+    assert burns == [[alice, ZERO_ADDRESS, i] for i in token_ids]
+    for token_id in token_ids:
+        with brownie.reverts():
+            swap.ownerOf(token_id)
+
+
+def test_burned_ids_are_reused(alice, swap, DAI, sBTC, token_ids, balances):
+    swap.withdraw_many(_pad(token_ids), _pad(balances), {"from": alice})
+
+    tx = swap.swap_into_synth(DAI, sBTC, 10 ** 18, 0, {"from": alice})
+    assert "NewSettler" not in tx.events
+    assert tx.return_value == token_ids[-1] + 2 ** 160
+    assert swap.ownerOf(tx.return_value) == alice
+
+    # the ID of the burned NFT is not valid for the new token using its settler
+    with brownie.reverts("Unknown Token ID"):
+        swap.ownerOf(token_ids[-1])
+    with brownie.reverts("Unknown Token ID"):
+        swap.is_settled(token_ids[-1])
+
+
+def test_withdraw_partial(alice, swap, token_ids, balances):
+    amounts = [balances[0], balances[1] // 2, balances[2] // 4]
+    tx = swap.withdraw_many(_pad(token_ids), _pad(amounts), {"from": alice})
+
+    remaining = [0, balances[1] - amounts[1], balances[2] - amounts[2]]
+    assert tx.return_value == _pad(remaining)
+    assert swap.balanceOf(alice) == 2
+    assert swap.ownerOf(token_ids[1]) == alice
+    assert swap.ownerOf(token_ids[2]) == alice
+
+
+def test_different_receiver(alice, bob, swap, sBTC, token_ids, balances):
+    swap.withdraw_many(_pad(token_ids[:1]), _pad(balances[:1]), bob, {"from": alice})
+
+    assert sBTC.balanceOf(alice) == 0
+    assert sBTC.balanceOf(bob) == balances[0]
+
+
+def test_approved_operator(alice, bob, swap, sBTC, token_ids, balances):
+    swap.setApprovalForAll(bob, True, {"from": alice})
+    swap.withdraw_many(_pad(token_ids), _pad(balances), {"from": bob})
+
+    assert sBTC.balanceOf(bob) == balances[0] + balances[2]
+    assert swap.balanceOf(alice) == 0
+
+
+def test_duplicate_token_id(alice, swap, token_ids, balances):
+    with brownie.reverts("Unknown Token ID"):
+        swap.withdraw_many(
+            _pad(token_ids[:1] * 2), _pad(balances[:1] * 2), {"from": alice}
+        )
+
+
+def test_cheaper_than_single_withdrawals(alice, swap, token_ids, balances):
+    tx = swap.withdraw_many(_pad(token_ids), _pad(balances), {"from": alice})
+    batch_gas = tx.gas_used
+    chain.undo()
+
+    single_gas = 0
+    for token_id, balance in zip(token_ids, balances):
+        single_gas += swap.withdraw(token_id, balance, {"from": alice}).gas_used
+
+    assert batch_gas < single_gas